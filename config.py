@@ -5,7 +5,7 @@ from ignis.command_manager import CommandManager
 from ignis.config_manager import ConfigManager
 from ignis.css_manager import CssInfoPath, CssManager
 from ignis.options import options
-from modules.bar import Bar, register_bar, toggle_bars
+from modules.bar import BarManager, get_bar_state, toggle_bars
 from modules.bar.widgets import SystemPopup
 from modules.notifications import IntegratedCenter, init_notifications, init_task_popup
 from modules.osd import (
@@ -28,8 +28,6 @@ options.notifications.popup_timeout = config.ui.notification_popup_timeout
 css = CssManager.get_default()
 command_manager = CommandManager.get_default()
 config_manager = ConfigManager.get_default()
-bar = Bar(config.ui.primary_monitor)
-
 # Delete or set "True for auto-reload"
 config_manager.autoreload_config = False
 
@@ -58,7 +56,6 @@ init_task_popup()
 init_workspace_osd()
 init_barless_clock()
 init_barless_clock_overlay()
-register_bar(bar)
 
 
 def _on_visible_changed(window, *_):
@@ -68,12 +65,13 @@ def _on_visible_changed(window, *_):
         _osd_window.show_osd()
 
 
-bar.connect("notify::visible", _on_visible_changed)
+# One bar per monitor, created/destroyed on hotplug
+bar_manager = BarManager(on_visible_changed=_on_visible_changed)
 
 
 def _handle_initial_bar_state():
     """Show workspace OSD on startup if bar starts hidden"""
-    if not bar.visible:
+    if not get_bar_state():
         set_bar_visibility(False)
         set_barless_clock_visibility(False)
         from modules.osd.workspace_osd import _osd_window
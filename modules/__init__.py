@@ -1,4 +1,4 @@
-from . import bar, notifications, osd, overlays, recorder, utils, weather
+from . import bar, notifications, osd, overlays, recorder, sysmon, utils, weather
 
 __all__ = [
     "bar",
@@ -6,6 +6,7 @@ __all__ = [
     "osd",
     "overlays",
     "recorder",
+    "sysmon",
     "utils",
     "weather",
 ]
@@ -1,9 +1,11 @@
-from .bar import Bar
-from .bar_toggle import get_bar_state, hide_bars, register_bar, show_bars, toggle_bars
+from .bar import Bar, BarManager
+from .bar_toggle import get_bar_state, hide_bars, register_bar, show_bars, toggle_bars, unregister_bar
 
 __all__ = [
     "Bar",
+    "BarManager",
     "register_bar",
+    "unregister_bar",
     "toggle_bars",
     "show_bars",
     "hide_bars",
@@ -1,9 +1,16 @@
+from typing import Callable, Dict, List, Optional
+
+from gi.repository import Gdk
 from ignis import utils, widgets
 from modules.utils import load_bar_state
 from settings import config
+
+from .bar_toggle import get_bar_state, register_bar, unregister_bar
 from .widgets.battery import battery_widget
 from .widgets.clock import clock
+from .widgets.cpu_graph import cpu_graph
 from .widgets.focused_window import window_title
+from .widgets.net_speed import net_speed
 from .widgets.recorder import recording_indicator
 from .widgets.system_indicator import system_indicator
 from .widgets.workspaces import workspaces
@@ -35,6 +42,8 @@ def right_section():
         spacing=12,
         child=[
             recording_indicator(),
+            *([net_speed()] if config.ui.bar.net_speed else []),
+            *([cpu_graph()] if config.ui.bar.cpu_graph else []),
             system_indicator(),
             battery_widget(),
         ],
@@ -54,7 +63,8 @@ class Bar(widgets.Window):
         initial_visible = load_bar_state()
 
         super().__init__(
-            namespace=f"ignis_bar_{monitor_id}",
+            # Connector, not index: indices shift on hotplug and namespaces must stay unique
+            namespace=f"ignis_bar_{monitor_name}",
             monitor=monitor_id,
             anchor=["left", "top", "right"],
             exclusivity="exclusive",
@@ -69,22 +79,71 @@ class Bar(widgets.Window):
 
 
 # ───────────────────────────────────────────────
-# INITIALIZATION FUNCTION
+# BAR MANAGER (one bar per monitor, follows hotplug)
 # ───────────────────────────────────────────────
 
 
-def init_bars():
-    primary_monitor = config.ui.bar_monitor
-    bar = Bar(primary_monitor)
-
-    def _on_visible_changed(window, *_):
-        from modules.osd.workspace_osd import _osd_window, set_bar_visibility
-
-        set_bar_visibility(window.visible)
-
-        if not window.visible and _osd_window:
-            _osd_window.show_osd()
-
-    bar.connect("notify::visible", _on_visible_changed)
-
-    return bar
+class BarManager:
+    """
+    Keeps one Bar per connected monitor (or only the configured one when
+    ui.bar.all_monitors is off), keyed by connector name.
+
+    Listens to the display's monitor list model, so bars are created and
+    destroyed on hotplug without a restart. Bar widgets share their service
+    subscriptions, so each extra bar adds no extra handlers.
+    """
+
+    def __init__(self, on_visible_changed: Optional[Callable] = None):
+        self._on_visible_changed = on_visible_changed
+        self._bars: Dict[str, Bar] = {}
+        self._monitors = Gdk.Display.get_default().get_monitors()
+        self._handler_id = self._monitors.connect("items-changed", lambda *_: self.sync())
+        self.sync()
+
+    @property
+    def bars(self) -> List[Bar]:
+        return list(self._bars.values())
+
+    def _wanted(self) -> Dict[str, int]:
+        """connector -> monitor index for every monitor that should have a bar"""
+        connectors = {}
+        for index in range(self._monitors.get_n_items()):
+            connector = self._monitors.get_item(index).get_connector()
+            if connector:
+                connectors[connector] = index
+
+        if config.ui.bar.all_monitors or not connectors:
+            return connectors
+
+        index = config.ui.bar_monitor if config.ui.bar_monitor < len(connectors) else 0
+        connector = self._monitors.get_item(index).get_connector()
+        return {connector: index}
+
+    def sync(self):
+        wanted = self._wanted()
+
+        for connector in [c for c in self._bars if c not in wanted]:
+            bar = self._bars.pop(connector)
+            unregister_bar(bar)
+            bar.destroy()
+
+        visible = get_bar_state() if self._bars else load_bar_state()
+        for connector, index in wanted.items():
+            bar = self._bars.get(connector)
+            if bar is None:
+                bar = Bar(index)
+                bar.set_visible(visible)
+                if self._on_visible_changed:
+                    bar.connect("notify::visible", self._on_visible_changed)
+                register_bar(bar)
+                self._bars[connector] = bar
+            elif bar.monitor != index:
+                # Indices shift when an earlier monitor is unplugged
+                bar.monitor = index
+
+    def destroy(self):
+        self._monitors.disconnect(self._handler_id)
+        for bar in self._bars.values():
+            unregister_bar(bar)
+            bar.destroy()
+        self._bars.clear()
@@ -10,6 +10,12 @@ def register_bar(bar_window) -> None:
     _bar_windows.append(bar_window)
 
 
+def unregister_bar(bar_window) -> None:
+    """Forget a bar window (e.g. its monitor was unplugged)"""
+    if bar_window in _bar_windows:
+        _bar_windows.remove(bar_window)
+
+
 def toggle_bars():
     """Toggle all registered bars"""
 
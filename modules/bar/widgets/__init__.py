@@ -1,6 +1,8 @@
 from .battery import battery_widget
 from .clock import clock
+from .cpu_graph import cpu_graph
 from .focused_window import window_title
+from .net_speed import net_speed
 from .network_items import EthernetItem, VpnNetworkItem, WifiNetworkItem
 from .recorder import recording_indicator
 from .system_indicator import system_indicator
@@ -10,7 +12,9 @@ from .workspaces import workspaces
 __all__ = [
     "battery_widget",
     "clock",
+    "cpu_graph",
     "EthernetItem",
+    "net_speed",
     "recording_indicator",
     "system_indicator",
     "SystemPopup",
@@ -1,6 +1,7 @@
 from ignis import widgets
 from ignis.services.upower import UPowerService
 from modules.utils.signal_manager import SignalManager
+from modules.utils.update_batcher import get_update_batcher, set_css_class, set_tooltip_if_changed
 from settings import config
 
 upower = UPowerService.get_default()
@@ -66,6 +67,7 @@ class BatteryWidget(widgets.Box):
     def _cleanup(self):
         """Cleanup on destroy"""
         self._signals.disconnect_all()
+        get_update_batcher().cancel(self)
 
     def _setup_signals(self):
         """Setup all signal connections through manager"""
@@ -81,7 +83,11 @@ class BatteryWidget(widgets.Box):
             "notify::time-to-full",
             "notify::time-to-empty",
         ]:
-            self._signals.connect(battery, signal, lambda *_: self._update_all())
+            self._signals.connect(battery, signal, lambda *_: self._schedule_update())
+
+    def _schedule_update(self):
+        """UPower reports several properties at once; apply them once per frame"""
+        get_update_batcher().mark(self, self._update_all)
 
     def _update_all(self):
         """Update all battery UI elements"""
@@ -106,21 +112,16 @@ class BatteryWidget(widgets.Box):
             mins = (battery.time_to_empty % 3600) // 60
             time_str = f"\nTime remaining: {hours}h {mins}m"
 
-        self.set_tooltip_text(f"{battery.device_name}\n{status}: {int(battery.percentage)}%{time_str}")
+        set_tooltip_if_changed(self, f"{battery.device_name}\n{status}: {int(battery.percentage)}%{time_str}")
 
     def _update_warning_class(self):
         """Update CSS classes based on battery level"""
         percent = self._battery.percentage
 
-        if percent < config.battery.critical_threshold:
-            self.add_css_class("critical")
-            self.remove_css_class("warning")
-        elif percent < config.battery.warning_threshold:
-            self.add_css_class("warning")
-            self.remove_css_class("critical")
-        else:
-            self.remove_css_class("warning")
-            self.remove_css_class("critical")
+        critical = percent < config.battery.critical_threshold
+        warning = not critical and percent < config.battery.warning_threshold
+        set_css_class(self, "critical", critical)
+        set_css_class(self, "warning", warning)
 
 
 def battery_widget():
@@ -1,19 +1,79 @@
 import datetime
-from ignis import utils, widgets
+from typing import NamedTuple
+
+from ignis import widgets
 from ignis.services.notifications import NotificationService
 from ignis.window_manager import WindowManager
+from modules.utils.broadcast import Broadcast, poll_source
 from modules.utils.signal_manager import SignalManager
+from modules.weather.astronomy import get_ephemeris
 from settings import config
 
 wm = WindowManager.get_default()
 notifications = NotificationService.get_default()
 
 
-def clock():
-    """Clock with notification indicator (fully correct & leak-safe)"""
+class NotificationSummary(NamedTuple):
+    count: int
+    has_critical: bool
+
+
+def _current_time() -> str:
+    # Also update barless clock if it exists
+    try:
+        from modules.osd.clock_osd import update_barless_clock
+
+        update_barless_clock()
+    except:
+        pass
+
+    return datetime.datetime.now().strftime("%H:%M")
 
+
+def _should_show_notification(notif) -> bool:
+    """Check if notification should be shown (not filtered)"""
+    return not config.ui.notifications.should_filter(notif)
+
+
+def _notification_summary() -> NotificationSummary:
+    visible_notifs = [n for n in notifications.notifications if _should_show_notification(n)]
+    return NotificationSummary(
+        count=len(visible_notifs),
+        has_critical=any(n.urgency == 2 for n in visible_notifs),
+    )
+
+
+def _notification_source(notify):
+    """Watch the service and every live notification with one set of handlers"""
     signals = SignalManager()
-    clock_poll = None
+
+    def watch_notification(nt):
+        signals.connect(nt, "closed", notify)
+        try:
+            signals.connect(nt, "dismissed", notify)
+        except Exception:
+            pass
+
+    def on_new_notification(_, nt):
+        watch_notification(nt)
+        notify()
+
+    signals.connect(notifications, "notified", on_new_notification)
+    signals.connect(notifications, "new_popup", on_new_notification)
+
+    for nt in notifications.notifications:
+        watch_notification(nt)
+
+    return signals.disconnect_all
+
+
+# Shared by every bar's clock
+clock_tick = Broadcast(_current_time, poll_source(60000))
+notification_summary = Broadcast(_notification_summary, _notification_source)
+
+
+def clock():
+    """Clock with notification indicator (fully correct & leak-safe)"""
 
     clock_label = widgets.Label(css_classes=["clock"])
 
@@ -34,30 +94,22 @@ def clock():
         on_click=lambda x: wm.open_window("ignis_INTEGRATED_CENTER"),
     )
 
-    def update_time():
-        time_str = datetime.datetime.now().strftime("%H:%M")
-
-        # Also update barless clock if it exists
-        try:
-            from modules.osd.barless_clock import update_barless_clock
-
-            update_barless_clock()
-        except:
-            pass
+    def update_time(time_str: str):
+        if clock_label.label != time_str:
+            clock_label.label = time_str
 
-        return time_str
+    def update_notifications(summary: NotificationSummary):
+        count = summary.count
 
-    def _should_show_notification(notif) -> bool:
-        """Check if notification should be shown (not filtered)"""
-        return not config.ui.notifications.should_filter(notif)
+        tooltip = datetime.datetime.now().strftime("%A, %d.%m %Y")
 
-    def update_notifications(*_):
-        all_notifs = notifications.notifications
-        visible_notifs = [n for n in all_notifs if _should_show_notification(n)]
-        count = len(visible_notifs)
-        has_critical = any(n.urgency == 2 for n in visible_notifs)
+        day = get_ephemeris().today()
+        tooltip += f"\n{day.moon_emoji} {day.moon_phase_name}, {day.moon_illumination:.0f}%"
+        if day.sunrise and day.sunset:
+            sunrise = datetime.datetime.fromtimestamp(day.sunrise).strftime("%H:%M")
+            sunset = datetime.datetime.fromtimestamp(day.sunset).strftime("%H:%M")
+            tooltip += f"\nSunrise {sunrise}  •  Sunset {sunset}"
 
-        tooltip = datetime.datetime.now().strftime("%A, %d.%m %Y")
         if count > 0:
             tooltip += f"\n\n{count} notification(s)"
 
@@ -67,38 +119,18 @@ def clock():
             notif_dot.visible = True
             notif_dot.remove_css_class("normal")
             notif_dot.remove_css_class("critical")
-            notif_dot.add_css_class("critical" if has_critical else "normal")
+            notif_dot.add_css_class("critical" if summary.has_critical else "normal")
         else:
             notif_dot.visible = False
 
-    def watch_notification(nt):
-        signals.connect(nt, "closed", update_notifications)
-        try:
-            signals.connect(nt, "dismissed", update_notifications)
-        except Exception:
-            pass
-
-    def on_new_notification(_, nt):
-        watch_notification(nt)
-        update_notifications()
-
-    clock_poll = utils.Poll(60000, lambda *_: update_time())
-    clock_label.set_property("label", clock_poll.bind("output"))
-
-    signals.connect(notifications, "notified", on_new_notification)
-    signals.connect(notifications, "new_popup", on_new_notification)
-
-    for nt in notifications.notifications:
-        watch_notification(nt)
+    unsubscribe = [
+        clock_tick.subscribe(update_time),
+        notification_summary.subscribe(update_notifications),
+    ]
 
     def cleanup(*_):
-        signals.disconnect_all()
-        if clock_poll:
-            try:
-                clock_poll.cancel()
-            except:
-                pass
-
-    signals.connect(clock_button, "destroy", cleanup)
-    update_notifications()
+        for unsub in unsubscribe:
+            unsub()
+
+    clock_button.connect("destroy", cleanup)
     return clock_button
@@ -0,0 +1,27 @@
+from ignis import widgets
+from ignis.window_manager import WindowManager
+from modules.sysmon import Sparkline, get_system_history
+from modules.utils.update_batcher import set_tooltip_if_changed
+
+wm = WindowManager.get_default()
+
+
+def cpu_graph():
+    """CPU sparkline for the bar; opens the system menu on click."""
+
+    graph = Sparkline("cpu", width=48, height=18, css_classes=["bar-cpu-graph"])
+    button = widgets.Button(
+        css_classes=["cpu-graph-button", "unset"],
+        child=graph,
+        on_click=lambda *_: wm.open_window("ignis_SYSTEM_MENU"),
+    )
+
+    def update_tooltip(history):
+        latest = history["cpu"].latest
+        if latest is not None:
+            set_tooltip_if_changed(button, f"CPU {int(latest)}%")
+
+    unsubscribe = get_system_history().subscribe(update_tooltip)
+    button.connect("destroy", lambda *_: unsubscribe())
+
+    return button
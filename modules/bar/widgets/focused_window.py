@@ -1,132 +1,84 @@
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from gi.repository import Gdk, Gtk
 from ignis import utils, widgets
-from ignis.services.hyprland import HyprlandService
-from ignis.services.niri import NiriService
+from modules.compositor import ActiveWindow, get_backend
+from modules.utils.broadcast import Broadcast, signal_source
+from modules.utils.update_batcher import set_if_changed
 from settings import config
 
-hypr = HyprlandService.get_default()
-niri = NiriService.get_default()
-
+backend = get_backend()
 
-def _get_window_text(window, compositor: str) -> str:
-    """Get display text for window based on compositor and config"""
-    if not window:
-        return ""
+FALLBACK_ICON = "application-x-executable-symbolic"
 
-    if compositor == "hyprland":
-        if not window.initial_class or window.address == "0x0":
-            return ""
 
-        win_class = window.initial_class
-        win_title = window.title or ""
+class WindowView(NamedTuple):
+    """Everything the title widget shows, computed once per focus change"""
 
-        if win_class.lower() in config.ui.bar_window_title_exceptions:
-            return win_title
-        return win_class
+    icon: str = FALLBACK_ICON
+    show_icon: bool = False
+    text: str = ""
+    output: Optional[str] = None
 
-    elif compositor == "niri":
-        if not window.app_id:
-            return ""
 
-        win_class = window.app_id
-        win_title = window.title or ""
+EMPTY_VIEW = WindowView()
 
-        if win_class.lower() in config.ui.bar_window_title_exceptions:
-            return win_title
-        return win_class
 
-    return ""
+@lru_cache(maxsize=256)
+def _icon_for_class(win_class: str) -> str:
+    """App class -> icon name; cleared when the icon theme changes"""
+    icon_name = utils.get_app_icon_name(win_class)
+    return icon_name if icon_name else FALLBACK_ICON
 
 
-def _get_window_icon(window, compositor: str) -> str:
-    """Get icon name for window based on compositor"""
-    if not window:
-        return "application-x-executable-symbolic"
+def _watch_icon_theme():
+    display = Gdk.Display.get_default()
+    if display is None:
+        return
+    Gtk.IconTheme.get_for_display(display).connect("changed", lambda *_: _icon_for_class.cache_clear())
 
-    if compositor == "hyprland":
-        if not window.initial_class or window.address == "0x0":
-            return "application-x-executable-symbolic"
-        win_class = window.initial_class
 
-    elif compositor == "niri":
-        if not window.app_id:
-            return "application-x-executable-symbolic"
-        win_class = window.app_id
-    else:
-        return "application-x-executable-symbolic"
+_watch_icon_theme()
 
-    icon_name = utils.get_app_icon_name(win_class)
-    return icon_name if icon_name else "application-x-executable-symbolic"
 
+def _view_for(window: Optional[ActiveWindow]) -> WindowView:
+    if window is None:
+        return EMPTY_VIEW
+    if not window.app_class:
+        return EMPTY_VIEW._replace(output=window.output)
 
-def _should_show_icon(window, compositor: str) -> bool:
-    """Determine if icon should be visible"""
-    if not window:
-        return False
+    if window.app_class.lower() in config.ui.bar_window_title_exceptions:
+        text = window.title
+    else:
+        text = window.app_class
+    return WindowView(icon=_icon_for_class(window.app_class), show_icon=True, text=text, output=window.output)
 
-    if compositor == "hyprland":
-        return bool(window.initial_class and window.address != "0x0")
-    elif compositor == "niri":
-        return bool(window.app_id)
 
-    return False
+# One handler per active-window change, shared by every bar
+active_window = Broadcast(
+    lambda: _view_for(backend.active_window()),
+    signal_source((backend, "active-window-changed")),
+    batched=True,
+)
 
 
 def window_title(monitor_name: str):
-    """Window title widget with direct binding to prevent artifacts"""
-
-    if hypr.is_available:
-        icon = widgets.Icon(
-            pixel_size=22,
-            css_classes=["window-title-icon"],
-            image=hypr.bind(
-                "active_window",
-                transform=lambda win: _get_window_icon(win, "hyprland"),
-            ),
-            visible=hypr.bind(
-                "active_window",
-                transform=lambda win: _should_show_icon(win, "hyprland"),
-            ),
-        )
-
-        title_label = widgets.Label(
-            css_classes=["window-title"],
-            ellipsize="end",
-            max_width_chars=42,
-            halign="start",
-            label=hypr.bind(
-                "active_window",
-                transform=lambda win: _get_window_text(win, "hyprland"),
-            ),
-        )
-
-    elif niri.is_available:
-        icon = widgets.Icon(
-            pixel_size=22,
-            css_classes=["window-title-icon"],
-            image=niri.bind(
-                "active_window",
-                transform=lambda win: _get_window_icon(win, "niri"),
-            ),
-            visible=niri.bind(
-                "active_window",
-                transform=lambda win: _should_show_icon(win, "niri") and niri.active_output == monitor_name,
-            ),
-        )
-
-        title_label = widgets.Label(
-            css_classes=["window-title"],
-            ellipsize="end",
-            max_width_chars=42,
-            halign="start",
-            label=niri.bind(
-                "active_window",
-                transform=lambda win: _get_window_text(win, "niri"),
-            ),
-            visible=niri.bind(
-                "active_output",
-                transform=lambda output: output == monitor_name,
-            ),
-        )
+    """Window title widget driven by a shared, immutable view model"""
+
+    icon = widgets.Icon(
+        pixel_size=22,
+        css_classes=["window-title-icon"],
+        image=FALLBACK_ICON,
+        visible=False,
+    )
+
+    title_label = widgets.Label(
+        css_classes=["window-title"],
+        ellipsize="end",
+        max_width_chars=42,
+        halign="start",
+    )
 
     box = widgets.Box(
         spacing=10,
@@ -136,4 +88,24 @@ def window_title(monitor_name: str):
         child=[icon, title_label],
     )
 
+    if not backend.available:
+        return box
+
+    last_view: Optional[WindowView] = None
+
+    def apply(view: WindowView):
+        nonlocal last_view
+        if view == last_view:
+            return
+        last_view = view
+
+        on_this_output = not backend.per_output or view.output == monitor_name
+        set_if_changed(icon, "image", view.icon)
+        set_if_changed(icon, "visible", view.show_icon and on_this_output)
+        set_if_changed(title_label, "label", view.text)
+        set_if_changed(title_label, "visible", on_this_output)
+
+    unsubscribe = active_window.subscribe(apply)
+    box.connect("destroy", lambda *_: unsubscribe())
+
     return box
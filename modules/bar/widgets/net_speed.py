@@ -0,0 +1,32 @@
+from ignis import widgets
+from ignis.window_manager import WindowManager
+from modules.sysmon import NetSnapshot, format_rate, get_net_sampler
+from modules.utils.update_batcher import set_if_changed, set_tooltip_if_changed
+
+wm = WindowManager.get_default()
+
+
+def net_speed():
+    """Download / upload rate for the bar; opens the system menu on click."""
+
+    label = widgets.Label(css_classes=["net-speed-label"])
+    button = widgets.Button(
+        css_classes=["net-speed-button", "unset"],
+        child=label,
+        on_click=lambda *_: wm.open_window("ignis_SYSTEM_MENU"),
+    )
+
+    def apply(snapshot: NetSnapshot):
+        set_if_changed(label, "label", f"↓{format_rate(snapshot.rx)} ↑{format_rate(snapshot.tx)}")
+        busiest = sorted(
+            (i for i in snapshot.interfaces.values() if i.name != "lo" and (i.rx or i.tx)),
+            key=lambda i: i.rx + i.tx,
+            reverse=True,
+        )
+        tooltip = "\n".join(f"{i.name}: ↓{format_rate(i.rx)} ↑{format_rate(i.tx)}" for i in busiest)
+        set_tooltip_if_changed(button, tooltip or "No traffic")
+
+    unsubscribe = get_net_sampler().subscribe(apply)
+    button.connect("destroy", lambda *_: unsubscribe())
+
+    return button
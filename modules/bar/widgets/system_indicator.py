@@ -1,9 +1,12 @@
+from typing import NamedTuple
+
 from ignis import widgets
 from ignis.services.audio import AudioService
 from ignis.services.network import NetworkService
 from ignis.services.bluetooth import BluetoothService
 from ignis.window_manager import WindowManager
-from modules.utils.signal_manager import SignalManager
+from modules.utils.broadcast import Broadcast, signal_source
+from modules.utils.update_batcher import set_css_class, set_if_changed
 
 wm = WindowManager.get_default()
 audio = AudioService.get_default()
@@ -56,32 +59,60 @@ def _bluetooth_visible():
         return False
 
 
-def system_indicator():
-    """Cluster of volume + mic + network + bluetooth, whole thing clickable."""
-
-    signals = SignalManager()
-
-    speaker_icon = widgets.Icon(
-        image=_speaker_icon(),
-        pixel_size=22,
-    )
+class SpeakerState(NamedTuple):
+    icon: str
+    muted: bool
+
+
+class MicState(NamedTuple):
+    icon: str
+    visible: bool
+
+
+# One broadcast per icon, each wired only to the properties it depends on.
+# distinct=True memoizes the derived value: listeners run only when it changes,
+# so a volume step that keeps the same icon touches no widget at all.
+speaker_state = Broadcast(
+    lambda: SpeakerState(icon=_speaker_icon(), muted=audio.speaker.is_muted),
+    signal_source((audio.speaker, "notify::is-muted"), (audio.speaker, "notify::volume")),
+    # Volume ticks arrive many times per frame while a slider is dragged
+    batched=True,
+    distinct=True,
+)
+
+mic_state = Broadcast(
+    lambda: MicState(icon=_mic_icon(), visible=_mic_visible()),
+    signal_source((audio.microphone, "notify::is-muted")),
+    distinct=True,
+)
+
+network_icon = Broadcast(
+    _network_icon,
+    signal_source(
+        (wifi, "notify::is-connected"),
+        (wifi, "notify::icon-name"),
+        (ethernet, "notify::is-connected"),
+        (vpn, "notify::is-connected"),
+    ),
+    batched=True,
+    distinct=True,
+)
+
+# bluetooth signals (power + connected devices) — keep these so visibility updates
+bluetooth_visible = Broadcast(
+    _bluetooth_visible,
+    signal_source((bluetooth, "notify::powered"), (bluetooth, "notify::connected-devices")),
+    distinct=True,
+)
 
-    mic_icon = widgets.Icon(
-        image=_mic_icon(),
-        pixel_size=22,
-        visible=_mic_visible(),
-    )
 
-    net_icon = widgets.Icon(
-        image=_network_icon(),
-        pixel_size=22,
-    )
+def system_indicator():
+    """Cluster of volume + mic + network + bluetooth, whole thing clickable."""
 
-    bt_icon = widgets.Icon(
-        image=_bluetooth_icon(),
-        pixel_size=22,
-        visible=_bluetooth_visible(),
-    )
+    speaker_icon = widgets.Icon(pixel_size=22)
+    mic_icon = widgets.Icon(pixel_size=22)
+    net_icon = widgets.Icon(pixel_size=22)
+    bt_icon = widgets.Icon(image=_bluetooth_icon(), pixel_size=22)
 
     inner = widgets.Box(
         css_classes=["system-indicator"],
@@ -95,41 +126,25 @@ def system_indicator():
         on_click=lambda *_: wm.open_window("ignis_SYSTEM_MENU"),
     )
 
-    def refresh(*_):
-        speaker_icon.image = _speaker_icon()
-        mic_icon.image = _mic_icon()
-        mic_icon.visible = _mic_visible()
-        net_icon.image = _network_icon()
-
-        bt_icon.image = _bluetooth_icon()
-        bt_icon.visible = _bluetooth_visible()
-
-        if audio.speaker.is_muted:
-            speaker_icon.add_css_class("muted")
-        else:
-            speaker_icon.remove_css_class("muted")
-
-    refresh()
-
-    # audio signals
-    signals.connect(audio.speaker, "notify::is-muted", refresh)
-    signals.connect(audio.speaker, "notify::volume", refresh)
-    signals.connect(audio.microphone, "notify::is-muted", refresh)
-
-    # network signals
-    signals.connect(wifi, "notify::is-connected", refresh)
-    signals.connect(wifi, "notify::icon-name", refresh)
-    signals.connect(ethernet, "notify::is-connected", refresh)
-    signals.connect(vpn, "notify::is-connected", refresh)
-
-    # bluetooth signals (power + connected devices) — keep these so visibility updates
-    signals.connect(bluetooth, "notify::powered", refresh)
-    signals.connect(bluetooth, "notify::connected-devices", refresh)
-
-    signals.connect(
-        button,
-        "destroy",
-        lambda *_: signals.disconnect_all(),
-    )
+    def apply_speaker(state: SpeakerState):
+        set_if_changed(speaker_icon, "image", state.icon)
+        set_css_class(speaker_icon, "muted", state.muted)
+
+    def apply_mic(state: MicState):
+        set_if_changed(mic_icon, "image", state.icon)
+        set_if_changed(mic_icon, "visible", state.visible)
+
+    unsubscribe = [
+        speaker_state.subscribe(apply_speaker),
+        mic_state.subscribe(apply_mic),
+        network_icon.subscribe(lambda icon: set_if_changed(net_icon, "image", icon)),
+        bluetooth_visible.subscribe(lambda visible: set_if_changed(bt_icon, "visible", visible)),
+    ]
+
+    def cleanup(*_):
+        for unsub in unsubscribe:
+            unsub()
+
+    button.connect("destroy", cleanup)
 
     return button
@@ -0,0 +1,85 @@
+from typing import Callable, Dict, Optional, Tuple
+
+from ignis import widgets
+from modules.sysmon import HardwareSnapshot, format_rate, get_hardware_sampler
+from modules.utils.update_batcher import set_if_changed
+
+
+class _ValueRow(widgets.Box):
+    """Name on the left, reading on the right"""
+
+    def __init__(self, icon: str, name: str):
+        self.value = widgets.Label(label="–", halign="end", css_classes=["system-info-text"])
+        super().__init__(
+            spacing=8,
+            child=[
+                widgets.Icon(image=icon, pixel_size=16),
+                widgets.Label(
+                    label=name,
+                    halign="start",
+                    hexpand=True,
+                    ellipsize="end",
+                    css_classes=["system-info-text"],
+                ),
+                self.value,
+            ],
+        )
+
+
+class HardwareSection(widgets.Box):
+    """
+    Disk throughput and hwmon temperatures / fans.
+
+    Samples only while active; SystemPopup activates it while it is shown.
+    Rows are keyed by disk name / sensor and created once, later ticks
+    only update their value labels.
+    """
+
+    def __init__(self):
+        self._disk_box = widgets.Box(vertical=True, spacing=4)
+        self._sensor_box = widgets.Box(vertical=True, spacing=4)
+        self._disk_rows: Dict[str, _ValueRow] = {}
+        self._sensor_rows: Dict[Tuple[str, str, str], _ValueRow] = {}
+        self._unsubscribe: Optional[Callable[[], None]] = None
+
+        super().__init__(
+            vertical=True,
+            spacing=8,
+            visible=False,
+            css_classes=["system-info-widget", "hardware-section"],
+            child=[self._disk_box, self._sensor_box],
+        )
+        self.connect("destroy", lambda *_: self.set_active(False))
+
+    def set_active(self, active: bool):
+        if active and self._unsubscribe is None:
+            self._unsubscribe = get_hardware_sampler().subscribe(self._on_sample)
+        elif not active and self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _on_sample(self, snapshot: HardwareSnapshot):
+        for name in [n for n in self._disk_rows if n not in snapshot.disks]:
+            self._disk_box.remove(self._disk_rows.pop(name))
+
+        for name, rate in snapshot.disks.items():
+            row = self._disk_rows.get(name)
+            if row is None:
+                row = self._disk_rows[name] = _ValueRow("drive-harddisk-symbolic", name)
+                self._disk_box.append(row)
+            text = f"R {format_rate(rate.read)}  W {format_rate(rate.write)}  {int(rate.busy)}%"
+            set_if_changed(row.value, "label", text)
+
+        for reading in snapshot.sensors:
+            key = (reading.chip, reading.label, reading.kind)
+            row = self._sensor_rows.get(key)
+            if row is None:
+                icon = "temperature-symbolic" if reading.kind == "temp" else "fan-symbolic"
+                row = self._sensor_rows[key] = _ValueRow(icon, f"{reading.chip} {reading.label}")
+                self._sensor_box.append(row)
+            text = f"{reading.value:.0f}°C" if reading.kind == "temp" else f"{reading.value:.0f} RPM"
+            set_if_changed(row.value, "label", text)
+
+        self._disk_box.visible = bool(self._disk_rows)
+        self._sensor_box.visible = bool(self._sensor_rows)
+        self.visible = bool(self._disk_rows or self._sensor_rows)
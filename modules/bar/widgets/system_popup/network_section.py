@@ -6,6 +6,7 @@ from modules.bar.widgets.network_items import (
     VpnNetworkItem,
     WifiNetworkItem,
 )
+from modules.sysmon import NetSnapshot, Sparkline, format_rate, get_net_history, get_net_sampler
 
 net = NetworkService.get_default()
 wifi = net.wifi
@@ -147,12 +148,27 @@ class NetworkSection(widgets.Box):
             ),
         )
 
+        self._rx_label = widgets.Label(label="↓ –", halign="start", hexpand=True, css_classes=["sys-net-rate"])
+        self._tx_label = widgets.Label(label="↑ –", halign="end", css_classes=["sys-net-rate"])
+        net_history = get_net_history()
+        throughput = widgets.Box(
+            vertical=True,
+            spacing=2,
+            css_classes=["sys-net-throughput"],
+            child=[
+                widgets.Box(child=[self._rx_label, self._tx_label]),
+                Sparkline("rx", max_value=None, height=24, history=net_history, css_classes=["rx-sparkline"]),
+                Sparkline("tx", max_value=None, height=16, history=net_history, css_classes=["tx-sparkline"]),
+            ],
+        )
+
         self._device_list = widgets.Box(
             vertical=True,
             spacing=6,
             visible=False,
             css_classes=["sys-net-details"],
             child=[
+                throughput,
                 wifi_section,
                 ethernet_section,
                 vpn_section,
@@ -173,6 +189,17 @@ class NetworkSection(widgets.Box):
             obj.connect(f"notify::{prop.replace('_', '-')}", lambda *_: self._refresh())
 
         self._refresh()
+        self._unsubscribe_rates = get_net_sampler().subscribe(self._on_rates)
+        self.connect("destroy", self._cleanup)
+
+    def _cleanup(self, *_):
+        if self._unsubscribe_rates:
+            self._unsubscribe_rates()
+            self._unsubscribe_rates = None
+
+    def _on_rates(self, snapshot: NetSnapshot):
+        self._rx_label.label = f"↓ {format_rate(snapshot.rx)}"
+        self._tx_label.label = f"↑ {format_rate(snapshot.tx)}"
 
     def _refresh(self):
         """Update network pill display"""
@@ -0,0 +1,85 @@
+from typing import Callable, List, Optional
+
+from ignis import widgets
+from modules.sysmon import ProcessInfo, ProcessSnapshot, get_process_sampler
+from modules.utils.update_batcher import set_if_changed
+from settings import config
+
+
+def _format_memory(size: int) -> str:
+    mb = size / (1024 * 1024)
+    if mb >= 1024:
+        return f"{mb / 1024:.1f} GB"
+    return f"{mb:.0f} MB"
+
+
+class _ProcessRow(widgets.Box):
+    def __init__(self):
+        self.name = widgets.Label(halign="start", hexpand=True, ellipsize="end", css_classes=["system-info-text"])
+        self.value = widgets.Label(halign="end", css_classes=["system-info-text"])
+        super().__init__(spacing=8, child=[self.name, self.value])
+
+
+class ProcessSection(widgets.Box):
+    """
+    Heaviest processes by CPU or memory (toggled from the header).
+
+    Samples only while active; SystemPopup activates it while it is shown.
+    The rows are built once and relabelled on every tick.
+    """
+
+    def __init__(self):
+        self._by_memory = False
+        self._snapshot: Optional[ProcessSnapshot] = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
+
+        self._rows = [_ProcessRow() for _ in range(config.system.top_processes)]
+        self._mode_label = widgets.Label(label="CPU", css_classes=["system-info-history-toggle"])
+        self._count_label = widgets.Label(halign="start", hexpand=True, css_classes=["system-info-text"])
+
+        header = widgets.Box(
+            child=[
+                self._count_label,
+                widgets.Button(
+                    css_classes=["system-info-history-btn", "unset"],
+                    child=self._mode_label,
+                    on_click=lambda *_: self._toggle_mode(),
+                ),
+            ],
+        )
+
+        super().__init__(
+            vertical=True,
+            spacing=4,
+            css_classes=["system-info-widget", "process-section"],
+            child=[header, *self._rows],
+        )
+        self.connect("destroy", lambda *_: self.set_active(False))
+
+    def set_active(self, active: bool):
+        if active and self._unsubscribe is None:
+            self._unsubscribe = get_process_sampler().subscribe(self._on_sample)
+        elif not active and self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _toggle_mode(self):
+        self._by_memory = not self._by_memory
+        self._mode_label.label = "Memory" if self._by_memory else "CPU"
+        if self._snapshot is not None:
+            self._on_sample(self._snapshot)
+
+    def _on_sample(self, snapshot: ProcessSnapshot):
+        self._snapshot = snapshot
+        set_if_changed(self._count_label, "label", f"Processes ({snapshot.count})")
+
+        processes: List[ProcessInfo] = snapshot.by_memory if self._by_memory else snapshot.by_cpu
+        for i, row in enumerate(self._rows):
+            if i >= len(processes):
+                set_if_changed(row, "visible", False)
+                continue
+            process = processes[i]
+            set_if_changed(row, "visible", True)
+            set_if_changed(row.name, "label", process.name)
+            value = _format_memory(process.memory) if self._by_memory else f"{process.cpu:.1f}%"
+            set_if_changed(row.value, "label", value)
@@ -1,11 +1,19 @@
 from ignis import utils, widgets
 from ignis.services.fetch import FetchService
+from modules.sysmon import Sparkline, SystemSnapshot, get_system_history, get_system_sampler
+from modules.utils.update_batcher import set_tooltip_if_changed
 
 fetch = FetchService.get_default()
 
 
+def _format_window(minutes: int) -> str:
+    if minutes >= 60 and minutes % 60 == 0:
+        return f"{minutes // 60} h"
+    return f"{minutes} min"
+
+
 class SystemInfoWidget(widgets.Box):
-    """System info panel with CPU usage (procfs) + RAM + system info"""
+    """System info panel with CPU usage + RAM (shared procfs sampler) + system info"""
 
     def __init__(self):
         self._cpu_bar = widgets.Scale(
@@ -19,7 +27,7 @@ class SystemInfoWidget(widgets.Box):
 
         self._cpu_label = widgets.Label(label="0%", css_classes=["system-info-percent"])
 
-        cpu_box = widgets.Box(
+        self._cpu_box = widgets.Box(
             spacing=16,
             child=[
                 widgets.Icon(image="cpu-symbolic", pixel_size=22),
@@ -53,6 +61,47 @@ class SystemInfoWidget(widgets.Box):
         self._mem_total_label = widgets.Label(label="Loading…", halign="start", css_classes=["system-info-text"])
         self._uptime_label = widgets.Label(label="Loading…", halign="start", css_classes=["system-info-text"])
 
+        history = get_system_history()
+        self._graphs = [
+            Sparkline("cpu", css_classes=["cpu-sparkline"]),
+            Sparkline("ram", css_classes=["ram-sparkline"]),
+            Sparkline("swap", height=18, css_classes=["swap-sparkline"]),
+            Sparkline("load", max_value=None, height=18, css_classes=["load-sparkline"]),
+        ]
+        self._window_label = widgets.Label(
+            label=_format_window(history.minutes),
+            css_classes=["system-info-history-toggle"],
+        )
+
+        history_box = widgets.Box(
+            vertical=True,
+            spacing=4,
+            css_classes=["system-info-history"],
+            child=[
+                widgets.Box(
+                    child=[
+                        widgets.Label(label="History", hexpand=True, halign="start", css_classes=["system-info-text"]),
+                        widgets.Button(
+                            css_classes=["system-info-history-btn", "unset"],
+                            child=self._window_label,
+                            on_click=lambda *_: self._toggle_window(),
+                        ),
+                    ],
+                ),
+                self._graphs[0],
+                self._graphs[1],
+                widgets.Box(
+                    spacing=12,
+                    child=[
+                        widgets.Label(label="Swap", css_classes=["system-info-text"]),
+                        self._graphs[2],
+                        widgets.Label(label="Load", css_classes=["system-info-text"]),
+                        self._graphs[3],
+                    ],
+                ),
+            ],
+        )
+
         info_box = widgets.Box(
             vertical=True,
             spacing=4,
@@ -69,80 +118,62 @@ class SystemInfoWidget(widgets.Box):
             vertical=True,
             spacing=10,
             css_classes=["system-info-widget"],
-            child=[cpu_box, ram_box, info_box],
+            child=[self._cpu_box, ram_box, history_box, info_box],
         )
 
-        self._last_cpu_total = None
-        self._last_cpu_idle = None
-        self._poll_cpu = None
-        self._poll_ram = None
         self._poll_info = None
 
-        self._update_cpu()
-        self._update_ram()
         self._update_info()
 
-        self._poll_cpu = utils.Poll(3000, self._update_cpu)
-        self._poll_ram = utils.Poll(3000, self._update_ram)
+        self._unsubscribe_sampler = get_system_sampler().subscribe(self._on_sample)
         self._poll_info = utils.Poll(60000, self._update_info)
 
         self.connect("destroy", self._cleanup)
 
     def _cleanup(self, *_):
-        """Cancel all polls"""
-        for p in (self._poll_cpu, self._poll_ram, self._poll_info):
-            if p:
-                try:
-                    p.cancel()
-                except Exception:
-                    pass
-        self._poll_cpu = self._poll_ram = self._poll_info = None
-
-    def _read_cpu_stat(self):
-        try:
-            with open("/proc/stat", "r") as f:
-                parts = f.readline().split()
-        except Exception:
-            return None, None
-
-        values = list(map(int, parts[1:]))
-        idle = values[3] + values[4]  # idle + iowait
-        total = sum(values)
-        return total, idle
-
-    def _update_cpu(self, *_):
-        total, idle = self._read_cpu_stat()
-        if total is None:
+        """Stop sampling and cancel the info poll"""
+        if self._unsubscribe_sampler:
+            self._unsubscribe_sampler()
+            self._unsubscribe_sampler = None
+        if self._poll_info:
+            try:
+                self._poll_info.cancel()
+            except Exception:
+                pass
+            self._poll_info = None
+
+    def _on_sample(self, snapshot: SystemSnapshot):
+        cpu = snapshot.cpu
+        if cpu is None:
             self._cpu_bar.value = 0
             self._cpu_label.label = "–%"
-            return True
-
-        if self._last_cpu_total is None:
-            self._last_cpu_total = total
-            self._last_cpu_idle = idle
-            return True
-
-        total_delta = total - self._last_cpu_total
-        idle_delta = idle - self._last_cpu_idle
-
-        self._last_cpu_total = total
-        self._last_cpu_idle = idle
-
-        usage = 0 if total_delta <= 0 else 100 * (1 - idle_delta / total_delta)
-        usage = max(0, min(usage, 100))
-
-        self._cpu_bar.value = usage
-        self._cpu_label.label = f"{int(usage)}%"
-        return True
-
-    def _update_ram(self, *_):
-        total = fetch.mem_total or 0
-        available = fetch.mem_available or 0
+        else:
+            self._cpu_bar.value = cpu.percent
+            self._cpu_label.label = f"{int(cpu.percent)}%"
+            set_tooltip_if_changed(self._cpu_box, self._cpu_tooltip(snapshot))
 
-        percent = ((total - available) / total) * 100 if total > 0 else 0
+        memory = snapshot.memory
+        percent = memory.percent if memory else 0
         self._ram_bar.value = percent
         self._ram_label.label = f"{int(percent)}%"
-        return True
+
+    def _toggle_window(self):
+        """Switch the sparklines between the recent and the long (averaged) window"""
+        history = get_system_history()
+        long = not self._graphs[0].long
+        for graph in self._graphs:
+            graph.long = long
+        self._window_label.label = _format_window(history.long_minutes if long else history.minutes)
+
+    def _cpu_tooltip(self, snapshot: SystemSnapshot) -> str:
+        lines = [f"Core {i}: {int(p)}%" for i, p in enumerate(snapshot.cpu.per_core)]
+        if snapshot.load:
+            load = snapshot.load
+            lines.append(f"Load: {load.avg1:.2f} {load.avg5:.2f} {load.avg15:.2f}")
+        pressure = snapshot.pressure.get("cpu")
+        if pressure:
+            lines.append(f"Pressure: {pressure.some:.1f}%")
+        return "\n".join(lines)
 
     def _update_info(self, *_):
         self._os_label.label = f"SYS: {fetch.os_name or 'Unknown'}"
@@ -5,7 +5,9 @@ from ignis.window_manager import WindowManager
 from settings import config
 from .audio_section import AudioSection
 from .bluetooth_section import BluetoothSection
+from .hardware_section import HardwareSection
 from .network_section import NetworkSection
+from .process_section import ProcessSection
 from .system_info_section import SystemInfoWidget
 
 wm = WindowManager.get_default()
@@ -88,6 +90,8 @@ class SystemPopup(widgets.Window):
         self._bluetooth_section = bluetooth_section
 
         system_info = SystemInfoWidget()
+        self._hardware_section = HardwareSection()
+        self._process_section = ProcessSection()
 
         panel = widgets.Box(
             vertical=True,
@@ -99,6 +103,8 @@ class SystemPopup(widgets.Window):
                 network_content,
                 bluetooth_section,
                 system_info,
+                self._hardware_section,
+                self._process_section,
             ],
         )
 
@@ -163,6 +169,9 @@ class SystemPopup(widgets.Window):
 
     def _on_visible_change(self, *_):
         """Handle reveal animation when window opens/closes"""
+        # Disk, sensor and process reads only run while the popup is shown
+        self._hardware_section.set_active(self.visible)
+        self._process_section.set_active(self.visible)
         if self.visible:
             self._revealer.reveal_child = True
         else:
@@ -1,82 +1,107 @@
+from typing import Dict, List, Optional
+
 from ignis import widgets
-from ignis.services.hyprland import HyprlandService, HyprlandWorkspace
-from ignis.services.niri import NiriService, NiriWorkspace
-
-hypr = HyprlandService.get_default()
-niri = NiriService.get_default()
-
-
-def hypr_btn(ws: HyprlandWorkspace):
-    label_text = ws.name
-
-    if label_text.isdigit():
-        pass
-    elif label_text.startswith("special:"):
-        clean_name = label_text.split(":")[-1]
-        label_text = clean_name[0].upper()
-    else:
-        label_text = label_text[0].upper()
-    btn = widgets.Button(
-        css_classes=["ws-btn", "unset"],
-        on_click=lambda *_: ws.switch_to(),
-        child=widgets.Label(label=label_text),
-    )
-    if ws.id == hypr.active_workspace.id:
-        btn.add_css_class("active")
-    return btn
-
-
-def niri_btn(ws: NiriWorkspace):
-    btn = widgets.Button(
-        css_classes=["ws-btn", "unset"],
-        on_click=lambda *_: ws.switch_to(),
-        child=widgets.Label(label=str(ws.idx)),
-    )
-    if ws.is_active:
-        btn.add_css_class("active")
-    return btn
-
-
-def workspace_button(ws):
-    if hypr.is_available:
-        return hypr_btn(ws)
-    elif niri.is_available:
-        return niri_btn(ws)
-    return widgets.Button(css_classes=["ws-btn", "unset"])
-
-
-def _scroll_niri(output: str, delta: int):
-    active = [w for w in niri.workspaces if w.output == output and w.is_active]
-    if not active:
-        return
-    niri.switch_to_workspace(active[0].idx + delta)
+from modules.compositor import Workspace, get_backend
+from modules.utils.broadcast import Broadcast, signal_source
+from modules.utils.scroll_accumulator import ScrollAccumulator
 
+backend = get_backend()
 
-def workspaces(monitor_name: str):
-    if hypr.is_available:
-        return widgets.EventBox(
-            css_classes=["workspaces"],
-            spacing=4,
-            on_scroll_up=lambda *_: hypr.switch_to_workspace(hypr.active_workspace.id - 1),
-            on_scroll_down=lambda *_: hypr.switch_to_workspace(hypr.active_workspace.id + 1),
-            child=hypr.bind_many(
-                ["workspaces", "active_workspace"],
-                transform=lambda ws, active: [
-                    workspace_button(w) for w in ws if w.id >= 1 or w.name == "special:scratchpad"
-                ],
-            ),
-        )
+# Shared by every bar; each compositor event is handled once
+workspace_list = Broadcast(backend.workspaces, signal_source((backend, "workspaces-changed")))
+active_workspace = Broadcast(backend.active_workspace, signal_source((backend, "active-workspace-changed")))
+
+
+class WorkspaceButtons(widgets.EventBox):
+    """
+    Workspace buttons keyed by workspace id.
+
+    Buttons are created and destroyed only when workspaces appear or
+    disappear; switching workspaces just moves the "active" class.
+
+    Scrolling is accumulated and throttled: however many scroll events
+    arrive, each dispatch is one backend.scroll(steps) request.
+    """
+
+    def __init__(self, monitor_name: str):
+        self._monitor_name = monitor_name
+        self._buttons: Dict[int, widgets.Button] = {}
+        self._labels: Dict[int, str] = {}
+        self._order: List[int] = []
+        self._active_id: Optional[int] = None
+
+        super().__init__(css_classes=["workspaces"], spacing=4)
+        self._scroll = ScrollAccumulator(lambda steps: backend.scroll(steps, self._monitor_name))
+        self._scroll.attach(self)
+
+        self._unsubscribe = [
+            workspace_list.subscribe(self._on_workspaces),
+            active_workspace.subscribe(self._on_active_workspace),
+        ]
+        self.connect("destroy", self._cleanup)
+
+    def _cleanup(self, *_):
+        self._scroll.reset()
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe.clear()
 
-    elif niri.is_available:
-        return widgets.EventBox(
-            css_classes=["workspaces"],
-            spacing=4,
-            on_scroll_up=lambda *_: _scroll_niri(monitor_name, +1),
-            on_scroll_down=lambda *_: _scroll_niri(monitor_name, -1),
-            child=niri.bind(
-                "workspaces",
-                transform=lambda ws: [workspace_button(w) for w in ws if w.output == monitor_name],
-            ),
+    def _on_workspaces(self, workspaces: List[Workspace]):
+        if backend.per_output:
+            workspaces = [w for w in workspaces if w.output == self._monitor_name]
+        active = next((w.id for w in workspaces if w.active), None)
+        self.sync(workspaces, active)
+
+    def _on_active_workspace(self, workspace: Optional[Workspace]):
+        if workspace is None:
+            return
+        if backend.per_output and workspace.output != self._monitor_name:
+            return
+        self.set_active(workspace.id)
+
+    def sync(self, workspaces: List[Workspace], active_id: Optional[int]):
+        """Reconcile buttons with the given workspaces (in display order)"""
+        order = [ws.id for ws in workspaces]
+        present = set(order)
+
+        for ws_id in [i for i in self._buttons if i not in present]:
+            del self._buttons[ws_id]
+            del self._labels[ws_id]
+
+        for ws in workspaces:
+            button = self._buttons.get(ws.id)
+            if button is None:
+                self._buttons[ws.id] = self._make_button(ws.id, ws.label)
+            elif self._labels[ws.id] != ws.label:
+                button.child.label = ws.label
+            self._labels[ws.id] = ws.label
+
+        # Any appearance/disappearance changes the order; the child setter
+        # detaches buttons that are no longer listed
+        if order != self._order:
+            self._order = order
+            self.child = [self._buttons[i] for i in order]
+
+        self.set_active(active_id)
+
+    def set_active(self, active_id: Optional[int]):
+        if active_id == self._active_id:
+            return
+        if self._active_id in self._buttons:
+            self._buttons[self._active_id].remove_css_class("active")
+        if active_id in self._buttons:
+            self._buttons[active_id].add_css_class("active")
+        self._active_id = active_id
+
+    def _make_button(self, ws_id: int, label: str) -> widgets.Button:
+        return widgets.Button(
+            css_classes=["ws-btn", "unset"],
+            on_click=lambda *_: backend.switch_to(ws_id),
+            child=widgets.Label(label=label),
         )
 
-    return widgets.Box(css_classes=["workspaces"])
+
+def workspaces(monitor_name: str):
+    if not backend.available:
+        return widgets.Box(css_classes=["workspaces"])
+    return WorkspaceButtons(monitor_name)
@@ -0,0 +1,12 @@
+from .backend import ActiveWindow, CompositorBackend, NullBackend, Workspace, get_backend, set_backend
+from .fake import FakeBackend
+
+__all__ = [
+    "ActiveWindow",
+    "CompositorBackend",
+    "FakeBackend",
+    "NullBackend",
+    "Workspace",
+    "get_backend",
+    "set_backend",
+]
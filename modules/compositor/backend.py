@@ -0,0 +1,97 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from gi.repository import GObject
+
+
+@dataclass(frozen=True)
+class Workspace:
+    id: int
+    name: str  # human-readable ("3", "Scratchpad")
+    label: str  # short form for bar buttons
+    output: Optional[str] = None
+    active: bool = False  # active on its output
+
+
+@dataclass(frozen=True)
+class ActiveWindow:
+    app_class: str  # empty when nothing is focused
+    title: str
+    output: Optional[str] = None
+
+
+class CompositorBackend(GObject.Object):
+    """
+    Compositor-neutral view of workspaces and the focused window.
+
+    Implementations translate their service's signals into the normalized
+    events below once, and cache the normalized values, so widgets never
+    branch on the compositor or touch compositor objects.
+    """
+
+    __gsignals__ = {
+        "workspaces-changed": (GObject.SignalFlags.RUN_FIRST, None, (object,)),
+        "active-workspace-changed": (GObject.SignalFlags.RUN_FIRST, None, (object,)),
+        "active-window-changed": (GObject.SignalFlags.RUN_FIRST, None, (object,)),
+    }
+
+    name = "none"
+    # Workspaces and focus belong to a single output (Niri)
+    per_output = False
+
+    def __init__(self):
+        super().__init__()
+        self._workspaces: List[Workspace] = []
+        self._active_workspace: Optional[Workspace] = None
+        self._active_window: Optional[ActiveWindow] = None
+
+    @property
+    def available(self) -> bool:
+        return self.name != "none"
+
+    def workspaces(self) -> List[Workspace]:
+        return self._workspaces
+
+    def active_workspace(self) -> Optional[Workspace]:
+        return self._active_workspace
+
+    def active_window(self) -> Optional[ActiveWindow]:
+        return self._active_window
+
+    def switch_to(self, workspace_id: int):
+        pass
+
+    def scroll(self, steps: int, output: Optional[str] = None):
+        """Move `steps` workspaces away from the active one, in one request"""
+        pass
+
+
+class NullBackend(CompositorBackend):
+    """No supported compositor detected"""
+
+
+_backend: Optional[CompositorBackend] = None
+
+
+def get_backend() -> CompositorBackend:
+    """The compositor backend, resolved once on first use"""
+    global _backend
+
+    if _backend is None:
+        from .hyprland import HyprlandBackend, hypr
+        from .niri import NiriBackend, niri
+
+        if hypr.is_available:
+            _backend = HyprlandBackend()
+        elif niri.is_available:
+            _backend = NiriBackend()
+        else:
+            _backend = NullBackend()
+
+    return _backend
+
+
+def set_backend(backend: CompositorBackend):
+    """Replace the backend (e.g. with FakeBackend for tests and benchmarks); call before widgets are built"""
+    global _backend
+    _backend = backend
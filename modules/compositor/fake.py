@@ -0,0 +1,44 @@
+from typing import List, Optional
+
+from .backend import ActiveWindow, CompositorBackend, Workspace
+
+
+class FakeBackend(CompositorBackend):
+    """
+    In-memory backend for tests and benchmarks.
+
+    Drive it with set_workspaces / set_active / set_active_window; switch
+    and scroll requests are recorded in `requests` instead of sent anywhere.
+    """
+
+    name = "fake"
+
+    def __init__(self, workspaces: Optional[List[Workspace]] = None, per_output: bool = False):
+        super().__init__()
+        self.per_output = per_output
+        self.requests: List[tuple] = []
+        self._active_window = ActiveWindow(app_class="", title="")
+        self.set_workspaces(workspaces or [Workspace(id=i, name=str(i), label=str(i)) for i in range(1, 6)])
+
+    def set_workspaces(self, workspaces: List[Workspace]):
+        self._workspaces = list(workspaces)
+        self._active_workspace = next((w for w in self._workspaces if w.active), None)
+        self.emit("workspaces-changed", self._workspaces)
+
+    def set_active(self, workspace_id: int):
+        self._workspaces = [Workspace(w.id, w.name, w.label, w.output, w.id == workspace_id) for w in self._workspaces]
+        self._active_workspace = next((w for w in self._workspaces if w.active), None)
+        self.emit("active-workspace-changed", self._active_workspace)
+
+    def set_active_window(self, app_class: str, title: str = "", output: Optional[str] = None):
+        self._active_window = ActiveWindow(app_class=app_class, title=title, output=output)
+        self.emit("active-window-changed", self._active_window)
+
+    def switch_to(self, workspace_id: int):
+        self.requests.append(("switch", workspace_id))
+        self.set_active(workspace_id)
+
+    def scroll(self, steps: int, output: Optional[str] = None):
+        self.requests.append(("scroll", steps, output))
+        current = self._active_workspace.id if self._active_workspace else 1
+        self.switch_to(max(1, current + steps))
@@ -0,0 +1,69 @@
+from typing import Optional
+
+from ignis.services.hyprland import HyprlandService, HyprlandWorkspace
+
+from .backend import ActiveWindow, CompositorBackend, Workspace
+
+hypr = HyprlandService.get_default()
+
+
+def _names(ws: HyprlandWorkspace):
+    """(name, label) for a Hyprland workspace"""
+    name = ws.name
+    if name.isdigit():
+        return name, name
+    if name.startswith("special:"):
+        clean_name = name.split(":")[-1]
+        return clean_name.capitalize(), clean_name[0].upper()
+    return name, name[0].upper()
+
+
+class HyprlandBackend(CompositorBackend):
+    name = "hyprland"
+
+    def __init__(self):
+        super().__init__()
+        hypr.connect("notify::workspaces", self._on_workspaces)
+        hypr.connect("notify::active-workspace", self._on_active_workspace)
+        hypr.connect("notify::active-window", self._on_active_window)
+        self._refresh_workspaces()
+        self._active_window = self._read_active_window()
+
+    def _refresh_workspaces(self):
+        active_id = hypr.active_workspace.id
+        workspaces = []
+        for ws in hypr.workspaces:
+            # Negative ids are special workspaces; only the scratchpad is shown
+            if ws.id < 1 and ws.name != "special:scratchpad":
+                continue
+            name, label = _names(ws)
+            workspaces.append(Workspace(id=ws.id, name=name, label=label, output=ws.monitor, active=ws.id == active_id))
+        self._workspaces = workspaces
+
+        active = hypr.active_workspace
+        name, label = _names(active)
+        self._active_workspace = Workspace(id=active.id, name=name, label=label, output=active.monitor, active=True)
+
+    def _read_active_window(self) -> ActiveWindow:
+        window = hypr.active_window
+        if not window or not window.initial_class or window.address == "0x0":
+            return ActiveWindow(app_class="", title="")
+        return ActiveWindow(app_class=window.initial_class, title=window.title or "")
+
+    def _on_workspaces(self, *_):
+        self._refresh_workspaces()
+        self.emit("workspaces-changed", self._workspaces)
+
+    def _on_active_workspace(self, *_):
+        self._refresh_workspaces()
+        self.emit("active-workspace-changed", self._active_workspace)
+
+    def _on_active_window(self, *_):
+        self._active_window = self._read_active_window()
+        self.emit("active-window-changed", self._active_window)
+
+    def switch_to(self, workspace_id: int):
+        hypr.switch_to_workspace(workspace_id)
+
+    def scroll(self, steps: int, output: Optional[str] = None):
+        hypr.switch_to_workspace(max(1, hypr.active_workspace.id + steps))
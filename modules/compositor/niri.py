@@ -0,0 +1,66 @@
+from typing import Optional
+
+from ignis.services.niri import NiriService
+
+from .backend import ActiveWindow, CompositorBackend, Workspace
+
+niri = NiriService.get_default()
+
+
+class NiriBackend(CompositorBackend):
+    name = "niri"
+    per_output = True
+
+    def __init__(self):
+        super().__init__()
+        niri.connect("notify::workspaces", self._on_workspaces)
+        niri.connect("notify::active-workspace", self._on_active_workspace)
+        niri.connect("notify::active-window", self._on_active_window)
+        niri.connect("notify::active-output", self._on_active_window)
+        self._refresh_workspaces()
+        self._active_window = self._read_active_window()
+
+    def _refresh_workspaces(self):
+        self._workspaces = [
+            Workspace(id=ws.id, name=str(ws.idx), label=str(ws.idx), output=ws.output, active=ws.is_active)
+            for ws in niri.workspaces
+        ]
+
+        active = niri.active_workspace
+        if active is None:
+            self._active_workspace = None
+        else:
+            self._active_workspace = Workspace(
+                id=active.id, name=str(active.idx), label=str(active.idx), output=active.output, active=True
+            )
+
+    def _read_active_window(self) -> ActiveWindow:
+        window = niri.active_window
+        if not window or not window.app_id:
+            return ActiveWindow(app_class="", title="", output=niri.active_output)
+        return ActiveWindow(app_class=window.app_id, title=window.title or "", output=niri.active_output)
+
+    def _on_workspaces(self, *_):
+        self._refresh_workspaces()
+        self.emit("workspaces-changed", self._workspaces)
+
+    def _on_active_workspace(self, *_):
+        self._refresh_workspaces()
+        self.emit("active-workspace-changed", self._active_workspace)
+
+    def _on_active_window(self, *_):
+        self._active_window = self._read_active_window()
+        self.emit("active-window-changed", self._active_window)
+
+    def switch_to(self, workspace_id: int):
+        for ws in niri.workspaces:
+            if ws.id == workspace_id:
+                ws.switch_to()
+                return
+
+    def scroll(self, steps: int, output: Optional[str] = None):
+        active = [w for w in niri.workspaces if w.output == output and w.is_active]
+        if not active:
+            return
+        # Niri has always moved to the next index on scroll up
+        niri.switch_to_workspace(max(1, active[0].idx - steps))
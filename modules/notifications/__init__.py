@@ -3,7 +3,7 @@ from .integrated_center_notifications import NotificationList
 from .integrated_center_tasks import TaskList
 from .integrated_center_weather import WeatherPill
 from .media import MediaCenterWidget
-from .popup import NotificationPopup, init_notifications
+from .popup import NotificationPopup, get_popup_pool_stats, init_notifications
 from .task_popup import TaskPopupWindow, init_task_popup
 
 __all__ = [
@@ -14,6 +14,7 @@ __all__ = [
     "MediaCenterWidget",
     "NotificationPopup",
     "init_notifications",
+    "get_popup_pool_stats",
     "TaskPopupWindow",
     "init_task_popup",
 ]
@@ -1,5 +1,6 @@
 from ignis import widgets
 from ignis.services.notifications import NotificationService
+from modules.notifications.rules import rules
 from modules.notifications.widgets import NotificationHistoryItem
 from modules.utils.signal_manager import SignalManager
 from settings import config
@@ -40,7 +41,7 @@ class NotificationList:
 
     def _should_show_notification(self, notif) -> bool:
         """Check if notification should be shown in history"""
-        return not config.ui.notifications.should_filter(notif)
+        return rules.decide(notif).history and not config.ui.notifications.should_filter(notif)
 
     def _load_notifications(self):
         """Load existing notifications with proper cleanup"""
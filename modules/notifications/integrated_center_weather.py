@@ -1,6 +1,9 @@
-import asyncio
-from ignis import utils, widgets
+from ignis import widgets
 from ignis.window_manager import WindowManager
+from modules.utils.icon_cache import set_icon_texture
+from modules.utils.signal_manager import SignalManager
+from modules.weather.weather_data import format_updated
+from modules.weather.weather_repository import WeatherRepository
 
 wm = WindowManager.get_default()
 
@@ -9,7 +12,8 @@ class WeatherPill:
     """Compact weather display that opens full weather popup on click"""
 
     def __init__(self):
-        self._poll = None
+        self._signals = SignalManager()
+        self._repository = WeatherRepository.get_default()
 
         self._weather_icon = widgets.Icon(
             image="weather-clouds-symbolic",
@@ -41,29 +45,24 @@ class WeatherPill:
             ),
         )
 
+        self._signals.connect(self._repository, "data-changed", lambda *_: self._apply(self._repository.data))
         self.update()
-        self._poll = utils.Poll(600000, self.update)
 
     def destroy(self):
-        if self._poll:
-            try:
-                self._poll.cancel()
-            except Exception:
-                pass
-            self._poll = None
+        self._signals.disconnect_all()
 
     def update(self, *_):
-        asyncio.create_task(self._update_async())
+        """Show what the repository has and ask it to refresh if stale"""
+        if self._repository.data:
+            self._apply(self._repository.data)
+        self._repository.request_update()
         return True
 
-    async def _update_async(self):
-        from modules.weather.weather_data import fetch_weather_async
-
-        data = await fetch_weather_async()
+    def _apply(self, data):
         if not data:
             return
 
-        self._weather_icon.image = data["icon"]
+        set_icon_texture(self._weather_icon, data["icon"], 32)
         self._weather_temp.label = f"{data['temp']}°"
         self._weather_desc.label = data["desc"]
 
@@ -72,6 +71,7 @@ class WeatherPill:
             f"Feels like {data['feels_like']}°C\n"
             f"Humidity: {data['humidity']}%\n"
             f"Wind: {data['wind']:.1f} m/s\n"
+            f"{format_updated(data.get('updated_at'))}\n"
             "\nClick to open weather details"
         )
         self._weather_icon.set_tooltip_text(tooltip)
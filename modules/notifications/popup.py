@@ -1,57 +1,51 @@
 from ignis import utils, widgets
 from ignis.services.notifications import Notification, NotificationService
+from modules.notifications.rules import init_notification_rules, rules
 from modules.utils.signal_manager import SignalManager
 from settings import config
 
 notifications = NotificationService.get_default()
 
 
+URGENCY_CLASSES = {
+    0: ("notif-low", "notif-title", "notif-body"),
+    1: ("notif-box", "notif-title", "notif-body"),
+    2: ("notif-critical", "notif-title-critical", "notif-body-critical"),
+}
+
+
 class NotificationWidget(widgets.Box):
-    """Individual notification widget with close button and actions"""
+    """Individual notification widget with close button and actions, rebindable for pooling"""
 
-    def __init__(self, notification: Notification):
-        urgency_class = "notif-box"
-        title_class = "notif-title"
-        body_class = "notif-body"
+    def __init__(self, notification: Notification | None = None):
+        self._notification = None
+        self._actions = []
+        self._action_buttons: list[widgets.Button] = []
 
-        if notification.urgency == 0:
-            urgency_class = "notif-low"
-        elif notification.urgency == 2:
-            urgency_class = "notif-critical"
-            title_class = "notif-title-critical"
-            body_class = "notif-body-critical"
+        self._icon = widgets.Icon(
+            pixel_size=32,
+            halign="start",
+            valign="start",
+            css_classes=["notif-popup-icon"],
+        )
 
-        if notification.icon:
-            icon_widget = widgets.Icon(
-                image=notification.icon,
-                pixel_size=32,
-                halign="start",
-                valign="start",
-                css_classes=["notif-popup-icon"],
-            )
-        else:
-            dot_color = "critical" if notification.urgency == 2 else "normal"
-            icon_widget = widgets.Label(
-                label="●",
-                css_classes=["notif-popup-dot", dot_color],
-                halign="start",
-                valign="start",
-            )
+        self._dot = widgets.Label(
+            label="●",
+            css_classes=["notif-popup-dot", "normal"],
+            halign="start",
+            valign="start",
+        )
 
-        summary = widgets.Label(
+        self._summary = widgets.Label(
             ellipsize="end",
-            label=notification.summary,
             halign="start",
-            visible=notification.summary != "",
-            css_classes=[title_class],
+            css_classes=["notif-title"],
         )
 
-        body = widgets.Label(
-            label=notification.body,
+        self._body = widgets.Label(
             ellipsize="end",
             halign="start",
-            css_classes=[body_class],
-            visible=notification.body != "",
+            css_classes=["notif-body"],
         )
 
         close_btn = widgets.Button(
@@ -60,68 +54,128 @@ class NotificationWidget(widgets.Box):
             valign="start",
             hexpand=True,
             css_classes=["notif-close-btn"],
-            on_click=lambda x: notification.close(),
+            on_click=lambda x: self._notification and self._notification.close(),
         )
 
         text_box = widgets.Box(
             vertical=True,
             style="margin-left: 0.75rem;",
-            child=[summary, body],
+            child=[self._summary, self._body],
         )
 
         content = widgets.Box(
-            child=[icon_widget, text_box, close_btn],
+            child=[self._icon, self._dot, text_box, close_btn],
         )
 
-        action_box = widgets.Box(
-            child=[
-                widgets.Button(
-                    child=widgets.Label(label=action.label),
-                    on_click=lambda x, action=action: action.invoke(),
-                    css_classes=["notif-action"],
-                )
-                for action in notification.actions
-            ],
+        self._action_box = widgets.Box(
             homogeneous=True,
-            style="margin-top: 0.75rem;" if notification.actions else "",
+            style="margin-top: 0.75rem;",
             spacing=10,
+            visible=False,
         )
 
         super().__init__(
             vertical=True,
-            css_classes=[urgency_class],
-            child=[content, action_box] if notification.actions else [content],
+            css_classes=["notif-box"],
+            child=[content, self._action_box],
         )
 
+        if notification is not None:
+            self.bind(notification)
+
+    def bind(self, notification: Notification):
+        """Show a notification, reusing the existing child widgets"""
+        self._notification = notification
+        self._actions = list(notification.actions)
+
+        urgency_class, title_class, body_class = URGENCY_CLASSES.get(notification.urgency, URGENCY_CLASSES[1])
+        self.set_css_classes([urgency_class])
+
+        if notification.icon:
+            self._icon.image = notification.icon
+            self._icon.visible = True
+            self._dot.visible = False
+        else:
+            dot_color = "critical" if notification.urgency == 2 else "normal"
+            self._dot.set_css_classes(["notif-popup-dot", dot_color])
+            self._dot.visible = True
+            self._icon.visible = False
+
+        self._summary.label = notification.summary
+        self._summary.visible = notification.summary != ""
+        self._summary.set_css_classes([title_class])
+
+        self._body.label = notification.body
+        self._body.visible = notification.body != ""
+        self._body.set_css_classes([body_class])
+
+        while len(self._action_buttons) < len(self._actions):
+            index = len(self._action_buttons)
+            button = widgets.Button(
+                child=widgets.Label(),
+                on_click=lambda x, index=index: self._invoke_action(index),
+                css_classes=["notif-action"],
+            )
+            self._action_buttons.append(button)
+            self._action_box.append(button)
+
+        for index, button in enumerate(self._action_buttons):
+            if index < len(self._actions):
+                button.child.label = self._actions[index].label
+                button.visible = True
+            else:
+                button.visible = False
+
+        self._action_box.visible = bool(self._actions)
+
+    def unbind(self):
+        """Drop references to the notification so a pooled widget does not keep it alive"""
+        self._notification = None
+        self._actions = []
+
+    def _invoke_action(self, index: int):
+        if index < len(self._actions):
+            self._actions[index].invoke()
+
 
 class Popup(widgets.Revealer):
-    def __init__(self, parent_box: "PopupBox", notification: Notification):
+    def __init__(self, parent_box: "PopupBox"):
         self._parent_box = parent_box
-        self._notification = notification
+        self._notification = None
         self._signals = SignalManager()
-
-        widget = NotificationWidget(notification)
+        self._widget = NotificationWidget()
 
         super().__init__(
             transition_type="slide_down",
             transition_duration=300,
             reveal_child=False,
-            child=widget,
+            child=self._widget,
         )
 
-        self._signals.connect(notification, "dismissed", lambda *_: self.destroy())
-        self._signals.connect(notification, "closed", lambda *_: self.destroy())
+    def bind(self, notification: Notification):
+        """Attach to a new notification"""
+        self._notification = notification
+        self._widget.bind(notification)
+
+        self._signals.connect(notification, "dismissed", lambda *_: self.dismiss())
+        self._signals.connect(notification, "closed", lambda *_: self.dismiss())
+
+    def unbind(self):
+        self._signals.disconnect_all()
+        self._widget.unbind()
+        self._notification = None
 
-    def destroy(self):
-        """Simple animated destruction with proper cleanup"""
+    def dismiss(self):
+        """Simple animated removal with proper cleanup"""
         self._signals.disconnect_all()
         self.reveal_child = False
 
         utils.Timeout(self.transition_duration, self._cleanup)
 
     def _cleanup(self):
-        """Remove popup and check if window should hide"""
+        """Remove popup, return it to the pool and check if window should hide"""
         self.unparent()
+        self._parent_box.pool.release(self)
 
         visible_popups = [child for child in self._parent_box.child if child.get_visible() and child.get_mapped()]
 
@@ -129,12 +183,43 @@ class Popup(widgets.Revealer):
             self._parent_box._window.visible = False
 
 
+class PopupPool:
+    """Bounded free list of Popup widgets that get rebound instead of rebuilt"""
+
+    def __init__(self, parent_box: "PopupBox", max_size: int):
+        self._parent_box = parent_box
+        self._max_size = max_size
+        self._free: list[Popup] = []
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, notification: Notification) -> Popup:
+        if self._free:
+            popup = self._free.pop()
+            self.hits += 1
+        else:
+            popup = Popup(parent_box=self._parent_box)
+            self.misses += 1
+
+        popup.bind(notification)
+        return popup
+
+    def release(self, popup: Popup):
+        popup.unbind()
+        if len(self._free) < self._max_size:
+            self._free.append(popup)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "free": len(self._free)}
+
+
 class PopupBox(widgets.Box):
     """Container for notification popups"""
 
     def __init__(self, window: "NotificationPopup"):
         self._window = window
         self._signals = SignalManager()
+        self.pool = PopupPool(self, config.ui.notifications.popup_pool_size)
 
         super().__init__(
             vertical=True,
@@ -146,7 +231,15 @@ class PopupBox(widgets.Box):
 
     def _on_new_popup(self, service, notification: Notification):
         """Add new notification popup"""
-        popup = Popup(parent_box=self, notification=notification)
+        decision = rules.decide(notification, live=True)
+        if not decision.popup:
+            return
+
+        target = decision.monitor if decision.monitor in _popup_windows else config.ui.notifications_monitor
+        if target != self._window.monitor_id:
+            return
+
+        popup = self.pool.acquire(notification)
         self.prepend(popup)
 
         if not self._window.visible:
@@ -163,6 +256,7 @@ class NotificationPopup(widgets.Window):
     """Main notification popup window"""
 
     def __init__(self, monitor: int = 0):
+        self.monitor_id = monitor
         self._popup_box = PopupBox(window=self)
 
         super().__init__(
@@ -179,8 +273,32 @@ class NotificationPopup(widgets.Window):
         """Cleanup all signal connections"""
         self._popup_box.cleanup()
 
+    def pool_stats(self) -> dict:
+        """Popup pool hit/miss counters"""
+        return self._popup_box.pool.stats()
+
+
+_popup_windows: dict[int, NotificationPopup] = {}
+
 
 def init_notifications():
-    """Initialize notification popup on configured monitor"""
+    """Initialize notification popups on the configured monitor and rule-routed monitors"""
+    init_notification_rules()
+
     monitor = config.ui.notifications_monitor
-    return NotificationPopup(monitor)
+    monitor_count = len(utils.get_monitors())
+
+    for target in {monitor, *rules.monitors}:
+        if target in _popup_windows:
+            continue
+        if not 0 <= target < monitor_count:
+            print(f"Notification rule routes to missing monitor {target}, using {monitor}")
+            continue
+        _popup_windows[target] = NotificationPopup(target)
+
+    return _popup_windows[monitor]
+
+
+def get_popup_pool_stats() -> dict[int, dict]:
+    """Popup pool counters for every notification popup window, keyed by monitor"""
+    return {monitor: window.pool_stats() for monitor, window in _popup_windows.items()}
@@ -0,0 +1,195 @@
+import re
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple
+
+from ignis import utils
+from ignis.services.notifications import Notification, NotificationService
+from settings import config
+from settings.settings import log_warning
+
+notifications = NotificationService.get_default()
+
+URGENCY_NAMES = {"low": 0, "normal": 1, "critical": 2}
+ACTIONS = {
+    "no-popup",
+    "history-only",  # alias of no-popup
+    "drop",
+    "auto-expire-after",
+    "rate-limit",
+    "route-to-monitor",
+}
+WILDCARD = "*"
+MAX_DECISIONS = 256
+
+
+@dataclass(frozen=True)
+class RuleDecision:
+    """Outcome of running a notification through the rules"""
+
+    popup: bool = True
+    history: bool = True
+    expire_after: Optional[int] = None  # seconds
+    monitor: Optional[int] = None
+
+
+DEFAULT_DECISION = RuleDecision()
+
+
+class NotificationRule:
+    """Single compiled rule: match conditions + one action"""
+
+    __slots__ = ("app_name", "urgency", "summary", "category", "action", "value", "window", "_hits")
+
+    def __init__(self, data: Dict):
+        self.app_name = str(data["app_name"]).lower() if data.get("app_name") else None
+        self.urgency = _parse_urgency(data.get("urgency"))
+        self.summary = re.compile(data["summary"], re.IGNORECASE) if data.get("summary") else None
+        self.category = str(data["category"]).lower() if data.get("category") else None
+        self.action = data.get("action", "")
+
+        if self.action not in ACTIONS:
+            raise ValueError(f"unknown action '{self.action}'")
+
+        self.value = None
+        self.window = 0
+        self._hits: deque = deque()
+
+        if self.action == "auto-expire-after":
+            self.value = int(data["after"])
+        elif self.action == "rate-limit":
+            self.value = int(data.get("limit", 1))
+            self.window = float(data.get("window", 60))
+        elif self.action == "route-to-monitor":
+            self.value = int(data["monitor"])
+
+    def matches(self, notification: Notification) -> bool:
+        if self.urgency is not None and notification.urgency != self.urgency:
+            return False
+        if self.category is not None and _category(notification) != self.category:
+            return False
+        if self.summary is not None and not self.summary.search(notification.summary or ""):
+            return False
+        return True
+
+    def apply(self, decision: RuleDecision, now: float, live: bool) -> RuleDecision:
+        if self.action in ("no-popup", "history-only"):
+            return replace(decision, popup=False)
+        if self.action == "drop":
+            return replace(decision, popup=False, history=False)
+        if self.action == "auto-expire-after":
+            return replace(decision, expire_after=self.value)
+        if self.action == "route-to-monitor":
+            return replace(decision, monitor=self.value)
+
+        # rate-limit: sliding window of popup timestamps. Only live
+        # notifications take a slot; replayed history never pops up.
+        if not live:
+            return decision
+        while self._hits and now - self._hits[0] > self.window:
+            self._hits.popleft()
+        if len(self._hits) >= self.value:
+            return replace(decision, popup=False)
+        self._hits.append(now)
+        return decision
+
+
+def _parse_urgency(value) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if value.lower() not in URGENCY_NAMES:
+            raise ValueError(f"unknown urgency '{value}'")
+        return URGENCY_NAMES[value.lower()]
+    return int(value)
+
+
+def _category(notification: Notification) -> str:
+    """Category hint, if the service exposes it"""
+    return (getattr(notification, "category", None) or "").lower()
+
+
+class NotificationRules:
+    """
+    Rules compiled into a dispatch table indexed by lowercase app_name.
+
+    Each table entry holds the app-specific rules merged with the wildcard
+    rules in config order, so a notification needs one dict lookup.
+    """
+
+    def __init__(self, rules: List[Dict]):
+        compiled: List[NotificationRule] = []
+        for i, data in enumerate(rules):
+            try:
+                compiled.append(NotificationRule(data))
+            except (KeyError, ValueError, TypeError, re.error) as e:
+                log_warning(f"Ignoring notification rule #{i + 1}: {e}")
+
+        self._wildcard: Tuple[NotificationRule, ...] = tuple(r for r in compiled if r.app_name is None)
+        self._table: Dict[str, Tuple[NotificationRule, ...]] = {}
+        for app in {r.app_name for r in compiled if r.app_name is not None}:
+            self._table[app] = tuple(r for r in compiled if r.app_name in (None, app))
+
+        self.monitors = {r.value for r in compiled if r.action == "route-to-monitor"}
+        self._decisions: "OrderedDict[int, RuleDecision]" = OrderedDict()
+
+    def decide(self, notification: Notification, live: bool = False) -> RuleDecision:
+        """
+        Evaluate rules for a notification.
+
+        live=True is for notifications arriving now (notified / new_popup):
+        rate limits count them and the decision is memoized, so later calls
+        agree. Other calls (history replay on startup) see the memo if there
+        is one, and otherwise evaluate without recording anything.
+        """
+        decision = self._decisions.get(notification.id)
+        if decision is not None:
+            return decision
+
+        decision = DEFAULT_DECISION
+        rules = self._table.get((notification.app_name or "").lower(), self._wildcard)
+        if rules:
+            now = time.monotonic()
+            for rule in rules:
+                if rule.matches(notification):
+                    decision = rule.apply(decision, now, live)
+                    if not decision.history:
+                        break
+
+        if live:
+            self._decisions[notification.id] = decision
+            if len(self._decisions) > MAX_DECISIONS:
+                self._decisions.popitem(last=False)
+        return decision
+
+
+rules = NotificationRules(config.ui.notifications.rules)
+
+
+def _on_notified(_, notification: Notification):
+    decision = rules.decide(notification, live=True)
+
+    if not decision.history:
+        notification.close()
+        return
+
+    if decision.expire_after is not None:
+        utils.Timeout(decision.expire_after * 1000, _expire, notification)
+
+
+def _expire(notification: Notification):
+    if notification in notifications.notifications:
+        notification.close()
+
+
+_initialized = False
+
+
+def init_notification_rules():
+    """Enact history-level actions (drop, auto-expire) for new notifications"""
+    global _initialized
+    if _initialized:
+        return
+    _initialized = True
+    notifications.connect("notified", _on_notified)
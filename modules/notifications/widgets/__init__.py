@@ -6,11 +6,15 @@ from modules.notifications.widgets.notification_items import (
 )
 from modules.notifications.widgets.task_dialogs import AddTaskDialog, EditTaskDialog
 from modules.notifications.widgets.task_items import TaskItem
-from modules.notifications.widgets.time_utils import format_time_ago, format_time_until
+from modules.notifications.widgets.time_scheduler import RelativeTimeScheduler, time_ago_scheduler
+from modules.notifications.widgets.time_utils import format_time_ago, format_time_until, time_ago_with_deadline
 
 __all__ = [
     "format_time_ago",
     "format_time_until",
+    "time_ago_with_deadline",
+    "RelativeTimeScheduler",
+    "time_ago_scheduler",
     "NotificationHistoryItem",
     "ScreenshotHistoryItem",
     "NormalHistoryItem",
@@ -2,10 +2,15 @@ import asyncio
 from ignis import utils, widgets
 from ignis.services.notifications import Notification
 from ignis.window_manager import WindowManager
-from modules.notifications.widgets.time_utils import format_time_ago
+from modules.notifications.widgets.time_scheduler import time_ago_scheduler
 from modules.utils.signal_manager import SignalManager
+from modules.utils.thumbnails import get_thumbnail_service
 
 wm = WindowManager.get_default()
+thumbnails = get_thumbnail_service()
+
+PREVIEW_SIZE = (96, 54)
+LARGE_PREVIEW_SIZE = (352, 198)
 
 
 def is_screenshot(notification: Notification) -> bool:
@@ -32,28 +37,29 @@ class ScreenshotHistoryItem(widgets.Box):
 
     def __init__(self, notification: Notification):
         self._signals = SignalManager()
-        self._poll = None
+        self._time_entry = None
         self._expanded = False
+        self._path = notification.icon
+        self._large_loaded = False
+        self._load_tasks = set()
 
+        # Thumbnails are decoded off the main thread and set once ready
         self._preview = widgets.Picture(
-            image=notification.icon,
             content_fit="cover",
-            width=96,
-            height=54,
+            width=PREVIEW_SIZE[0],
+            height=PREVIEW_SIZE[1],
             css_classes=["screenshot-preview-small"],
         )
 
         self._large_preview = widgets.Picture(
-            image=notification.icon,
             content_fit="cover",
-            width=352,
-            height=198,
+            width=LARGE_PREVIEW_SIZE[0],
+            height=LARGE_PREVIEW_SIZE[1],
             css_classes=["screenshot-preview-large"],
             visible=False,
         )
 
         self._timestamp = widgets.Label(
-            label=format_time_ago(notification.time),
             halign="start",
             css_classes=["screenshot-timestamp"],
         )
@@ -131,35 +137,50 @@ class ScreenshotHistoryItem(widgets.Box):
             child=[self._compact_row],
         )
 
-        self._poll = utils.Poll(60000, lambda *_: self._update_timestamp(notification))
+        self._load_preview(self._preview, PREVIEW_SIZE)
+
+        self._time_entry = time_ago_scheduler.register(self._timestamp, notification.time)
         self._signals.connect(notification, "closed", lambda *_: setattr(self, "visible", False))
         self._signals.connect(self, "destroy", lambda *_: self.destroy())
 
     def destroy(self):
-        if self._poll:
-            try:
-                self._poll.cancel()
-            except Exception:
-                pass
-            self._poll = None
+        if self._time_entry:
+            time_ago_scheduler.unregister(self._time_entry)
+            self._time_entry = None
+
+        for task in self._load_tasks:
+            task.cancel()
+        self._load_tasks.clear()
 
         self._signals.disconnect_all()
         super().destroy()
 
+    def _load_preview(self, picture: widgets.Picture, size: tuple):
+        task = asyncio.create_task(self._load_preview_async(picture, size))
+        self._load_tasks.add(task)
+        task.add_done_callback(self._load_tasks.discard)
+
+    async def _load_preview_async(self, picture: widgets.Picture, size: tuple):
+        """Fetch a downscaled texture from the thumbnail service"""
+        scale = picture.get_scale_factor()
+        texture = await thumbnails.get_texture(self._path, size[0] * scale, size[1] * scale)
+        if texture is not None:
+            picture.set_paintable(texture)
+
     def _toggle_expand(self):
         """Toggle expanded preview"""
         self._expanded = not self._expanded
         self._large_preview.visible = self._expanded
 
+        if self._expanded and not self._large_loaded:
+            self._large_loaded = True
+            self._load_preview(self._large_preview, LARGE_PREVIEW_SIZE)
+
         if self._expanded and self._large_preview not in self.child:
             self.append(self._large_preview)
         elif not self._expanded and self._large_preview in self.child:
             self._large_preview.unparent()
 
-    def _update_timestamp(self, notification):
-        self._timestamp.label = format_time_ago(notification.time)
-        return True
-
     def _open_screenshot(self, notification):
         if notification.icon:
             asyncio.create_task(utils.exec_sh_async(f"xdg-open '{notification.icon}'"))
@@ -172,6 +193,7 @@ class ScreenshotHistoryItem(widgets.Box):
     def _delete(self, notification):
         if notification.icon:
             asyncio.create_task(utils.exec_sh_async(f"rm '{notification.icon}'"))
+            thumbnails.invalidate(notification.icon)
             notification.close()
 
 
@@ -180,7 +202,7 @@ class NormalHistoryItem(widgets.Box):
 
     def __init__(self, notification: Notification):
         self._signals = SignalManager()
-        self._poll = None
+        self._time_entry = None
         self._expanded = False
         self._notification = notification
 
@@ -215,7 +237,6 @@ class NormalHistoryItem(widgets.Box):
         )
 
         self._timestamp_label = widgets.Label(
-            label=format_time_ago(notification.time),
             halign="start",
             css_classes=["notif-timestamp"],
         )
@@ -285,7 +306,7 @@ class NormalHistoryItem(widgets.Box):
             child=[icon_widget, text_box, actions],
         )
 
-        self._poll = utils.Poll(60000, lambda *_: self._update_timestamp(notification))
+        self._time_entry = time_ago_scheduler.register(self._timestamp_label, notification.time)
         self._signals.connect(notification, "closed", lambda *_: setattr(self, "visible", False))
         self._signals.connect(self, "destroy", lambda *_: self.destroy())
 
@@ -296,19 +317,12 @@ class NormalHistoryItem(widgets.Box):
         self._body_expanded.visible = self._expanded
 
     def destroy(self):
-        if self._poll:
-            try:
-                self._poll.cancel()
-            except Exception:
-                pass
-            self._poll = None
+        if self._time_entry:
+            time_ago_scheduler.unregister(self._time_entry)
+            self._time_entry = None
         self._signals.disconnect_all()
         super().destroy()
 
-    def _update_timestamp(self, notification):
-        self._timestamp_label.label = format_time_ago(notification.time)
-        return True
-
 
 class NotificationHistoryItem(widgets.Box):
     """Smart notification item - auto-selects screenshot or normal layout"""
@@ -0,0 +1,83 @@
+import heapq
+import itertools
+import time
+
+from ignis import utils, widgets
+from modules.notifications.widgets.time_utils import time_ago_with_deadline
+
+# Upper bound on a single sleep, so labels catch up after suspend/clock changes
+MAX_SLEEP_MS = 3600 * 1000
+
+
+class RelativeTimeScheduler:
+    """
+    Keeps "x minutes ago" labels current with a single shared timer.
+
+    Every registered label sits in a min-heap keyed by the moment its text
+    next changes; the timer is armed for the earliest deadline only.
+    """
+
+    def __init__(self):
+        self._heap: list = []
+        self._seq = itertools.count()
+        self._timeout = None
+        self._armed_for = None
+
+    def register(self, label: widgets.Label, timestamp: int) -> list:
+        """Start tracking a label; returns a handle for unregister()"""
+        entry = [label, timestamp]
+        self._update(entry, int(time.time()))
+        self._arm()
+        return entry
+
+    def unregister(self, entry: list):
+        """Stop tracking a label (lazily removed from the heap)"""
+        entry[0] = None
+
+    def _update(self, entry: list, now: int):
+        label, timestamp = entry
+        text, deadline = time_ago_with_deadline(timestamp, now)
+        if label.label != text:
+            label.label = text
+        heapq.heappush(self._heap, (deadline, next(self._seq), entry))
+
+    def _arm(self):
+        while self._heap and self._heap[0][2][0] is None:
+            heapq.heappop(self._heap)
+
+        if not self._heap:
+            self._cancel()
+            return
+
+        deadline = self._heap[0][0]
+        if self._timeout is not None and self._armed_for == deadline:
+            return
+
+        self._cancel()
+        delay = min(MAX_SLEEP_MS, max(0, int((deadline - time.time()) * 1000)))
+        self._armed_for = deadline
+        self._timeout = utils.Timeout(delay, self._on_timeout)
+
+    def _cancel(self):
+        if self._timeout is not None:
+            try:
+                self._timeout.cancel()
+            except Exception:
+                pass
+        self._timeout = None
+        self._armed_for = None
+
+    def _on_timeout(self):
+        self._timeout = None
+        self._armed_for = None
+        now = int(time.time())
+
+        while self._heap and self._heap[0][0] <= now:
+            _, _, entry = heapq.heappop(self._heap)
+            if entry[0] is not None:
+                self._update(entry, now)
+
+        self._arm()
+
+
+time_ago_scheduler = RelativeTimeScheduler()
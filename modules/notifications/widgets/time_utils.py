@@ -1,4 +1,7 @@
 import time
+from typing import Tuple
+
+DAY = 86400
 
 
 def format_time_until(fire_at: int) -> str:
@@ -23,46 +26,58 @@ def format_time_until(fire_at: int) -> str:
 
 
 def format_time_ago(timestamp: int) -> str:
-    now = int(time.time())
-    diff = now - timestamp
+    return time_ago_with_deadline(timestamp)[0]
 
-    if diff < 0:
-        return "just now"
+
+def time_ago_with_deadline(timestamp: int, now: int | None = None) -> Tuple[str, int]:
+    """
+    Relative time label plus the unix time at which that label next changes.
+    Each bucket changes exactly when its unit count increments.
+    """
+    if now is None:
+        now = int(time.time())
+    diff = now - timestamp
 
     if diff < 60:
-        return "just now"
+        return "just now", timestamp + 60
 
     minutes = diff // 60
     if minutes < 60:
+        deadline = timestamp + (minutes + 1) * 60
         if minutes == 1:
-            return "1 minute ago"
-        return f"{int(minutes)} minutes ago"
+            return "1 minute ago", deadline
+        return f"{int(minutes)} minutes ago", deadline
 
     hours = minutes // 60
     if hours < 24:
+        deadline = timestamp + (hours + 1) * 3600
         if hours == 1:
-            return "1 hour ago"
-        return f"{int(hours)} hours ago"
+            return "1 hour ago", deadline
+        return f"{int(hours)} hours ago", deadline
 
     days = hours // 24
     if days < 7:
+        deadline = timestamp + (days + 1) * DAY
         if days == 1:
-            return "yesterday"
-        return f"{int(days)} days ago"
+            return "yesterday", deadline
+        return f"{int(days)} days ago", deadline
 
     weeks = days // 7
     if weeks < 4:
+        deadline = timestamp + (weeks + 1) * 7 * DAY
         if weeks == 1:
-            return "1 week ago"
-        return f"{int(weeks)} weeks ago"
+            return "1 week ago", deadline
+        return f"{int(weeks)} weeks ago", deadline
 
     months = days // 30
     if months < 12:
+        deadline = timestamp + (months + 1) * 30 * DAY
         if months == 1:
-            return "1 month ago"
-        return f"{int(months)} months ago"
+            return "1 month ago", deadline
+        return f"{int(months)} months ago", deadline
 
     years = days // 365
+    deadline = timestamp + (years + 1) * 365 * DAY
     if years == 1:
-        return "1 year ago"
-    return f"{int(years)} years ago"
+        return "1 year ago", deadline
+    return f"{int(years)} years ago", deadline
@@ -1,13 +1,11 @@
 from ignis import utils, widgets
-from ignis.services.hyprland import HyprlandService
-from ignis.services.niri import NiriService
+from modules.compositor import get_backend
 from modules.utils.signal_manager import SignalManager
 from settings import config
 
 TIMEOUT = config.ui.workspace_osd_timeout
 
-hypr = HyprlandService.get_default()
-niri = NiriService.get_default()
+backend = get_backend()
 
 _osd_window = None
 _bar_visible = True
@@ -43,10 +41,7 @@ class WorkspaceOSD(widgets.Window):
 
         self.connect("notify::visible", self._on_visible_changed)
 
-        if hypr.is_available:
-            self._signals.connect(hypr, "notify::active-workspace", self._on_workspace_change)
-        elif niri.is_available:
-            self._signals.connect(niri, "notify::active-workspace", self._on_workspace_change)
+        self._signals.connect(backend, "active-workspace-changed", self._on_workspace_change)
 
         self.connect("destroy", self._cleanup)
 
@@ -91,17 +86,9 @@ class WorkspaceOSD(widgets.Window):
         self.show_osd()
 
     def _get_workspace_name(self):
-        """Extract current workspace name for Hyprland/Niri."""
-        if hypr.is_available:
-            name = hypr.active_workspace.name
-            if name.startswith("special:"):
-                name = name.split(":")[-1].capitalize()
-            return name
-
-        if niri.is_available:
-            return str(niri.active_workspace.idx)
-
-        return None
+        """Current workspace name as normalized by the compositor backend."""
+        workspace = backend.active_workspace()
+        return workspace.name if workspace else None
 
 
 def init_workspace_osd():
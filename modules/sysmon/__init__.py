@@ -0,0 +1,76 @@
+from .diskstats import DiskRate, DiskStatsReader
+from .hardware import HardwareReader, HardwareSnapshot
+from .history import (
+    MetricHistory,
+    RingBuffer,
+    SampleHistory,
+    downsample,
+    get_net_history,
+    get_system_history,
+)
+from .hwmon import Sensor, SensorReader, SensorReading, discover_sensors
+from .netdev import InterfaceRate, NetDevReader, NetSnapshot, format_rate
+from .processes import ProcessInfo, ProcessReader, ProcessSnapshot
+from .procfile import ProcFile
+from .procfs import CpuSnapshot, LoadSnapshot, MemorySnapshot, PressureSnapshot, ProcfsReader, SystemSnapshot
+from .sampler import (
+    HardwareSampler,
+    NetSampler,
+    ProcessSampler,
+    Sampler,
+    SystemSampler,
+    get_hardware_sampler,
+    get_net_sampler,
+    get_process_sampler,
+    get_system_sampler,
+    set_hardware_sampler,
+    set_net_sampler,
+    set_process_sampler,
+    set_system_sampler,
+)
+from .sparkline import Sparkline
+
+__all__ = [
+    "ProcFile",
+    "ProcfsReader",
+    "SystemSnapshot",
+    "CpuSnapshot",
+    "MemorySnapshot",
+    "LoadSnapshot",
+    "PressureSnapshot",
+    "Sampler",
+    "SystemSampler",
+    "get_system_sampler",
+    "set_system_sampler",
+    "RingBuffer",
+    "MetricHistory",
+    "SampleHistory",
+    "downsample",
+    "get_system_history",
+    "get_net_history",
+    "NetDevReader",
+    "NetSnapshot",
+    "InterfaceRate",
+    "NetSampler",
+    "get_net_sampler",
+    "set_net_sampler",
+    "format_rate",
+    "DiskStatsReader",
+    "DiskRate",
+    "Sensor",
+    "SensorReading",
+    "SensorReader",
+    "discover_sensors",
+    "HardwareReader",
+    "HardwareSnapshot",
+    "HardwareSampler",
+    "get_hardware_sampler",
+    "set_hardware_sampler",
+    "ProcessReader",
+    "ProcessInfo",
+    "ProcessSnapshot",
+    "ProcessSampler",
+    "get_process_sampler",
+    "set_process_sampler",
+    "Sparkline",
+]
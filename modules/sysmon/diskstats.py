@@ -0,0 +1,78 @@
+import os
+from typing import Dict, NamedTuple, Set, Tuple
+
+from .procfile import ProcFile
+
+SECTOR_SIZE = 512  # /proc/diskstats always counts 512-byte sectors
+
+
+class DiskRate(NamedTuple):
+    name: str
+    read: float  # bytes/s
+    write: float
+    busy: float  # % of the interval with I/O in flight
+
+
+class DiskStatsReader:
+    """
+    Read/write throughput of physical disks from /proc/diskstats.
+
+    A device counts as a physical disk when <sys_root>/block/<name>/device
+    exists, which excludes partitions, loop, zram and device-mapper nodes.
+    The classification is cached; only a device name never seen before
+    (hotplug) triggers another lookup.
+    """
+
+    def __init__(self, root: str = "/proc", sys_root: str = "/sys"):
+        self._sys_root = sys_root
+        self._file = ProcFile(os.path.join(root, "diskstats"), 8192)
+        self._disks: Set[str] = set()
+        self._ignored: Set[str] = set()
+        # name -> (sectors_read, sectors_written, io_ms)
+        self._prev: Dict[str, Tuple[int, int, int]] = {}
+
+    def _is_disk(self, name: str) -> bool:
+        if name in self._disks:
+            return True
+        if name in self._ignored:
+            return False
+        if os.path.exists(os.path.join(self._sys_root, "block", name, "device")):
+            self._disks.add(name)
+            return True
+        self._ignored.add(name)
+        return False
+
+    def read(self, elapsed: float) -> Dict[str, DiskRate]:
+        """Rates since the previous read, elapsed seconds ago (0 on the first read)"""
+        rates = {}
+        prev = self._prev
+        current = {}
+
+        # major minor name reads merged sectors ms writes merged sectors ms in_flight io_ms ...
+        for line in self._file.read().split(b"\n"):
+            fields = line.split()
+            if len(fields) < 13:
+                continue
+            name = fields[2].decode()
+            if not self._is_disk(name):
+                continue
+
+            counters = (int(fields[5]), int(fields[9]), int(fields[12]))
+            current[name] = counters
+
+            last = prev.get(name)
+            if last is None or elapsed <= 0 or counters[0] < last[0] or counters[1] < last[1]:
+                rates[name] = DiskRate(name, 0.0, 0.0, 0.0)
+                continue
+            rates[name] = DiskRate(
+                name,
+                read=(counters[0] - last[0]) * SECTOR_SIZE / elapsed,
+                write=(counters[1] - last[1]) * SECTOR_SIZE / elapsed,
+                busy=min(100.0, max(0.0, (counters[2] - last[2]) / (elapsed * 10))),
+            )
+
+        self._prev = current
+        return rates
+
+    def close(self):
+        self._file.close()
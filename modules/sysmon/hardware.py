@@ -0,0 +1,53 @@
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from .diskstats import DiskRate, DiskStatsReader
+from .hwmon import SensorReader, SensorReading
+
+
+class HardwareSnapshot(NamedTuple):
+    time: float  # time.monotonic()
+    disks: Dict[str, DiskRate]
+    sensors: List[SensorReading]
+
+
+class HardwareReader:
+    """
+    Disk throughput and hwmon sensors, read together in one pass per tick.
+
+    Sampling pauses while nobody looks, so a read more than max_gap seconds
+    after the previous one starts over instead of reporting the average
+    over the pause. root / sys_root can point at fake procfs and sysfs trees.
+    """
+
+    def __init__(
+        self,
+        root: str = "/proc",
+        sys_root: str = "/sys",
+        min_interval: float = 0.25,
+        max_gap: float = 30.0,
+    ):
+        self._min_interval = min_interval
+        self._max_gap = max_gap
+        self._disks = DiskStatsReader(root, sys_root)
+        self._sensors = SensorReader(sys_root)
+        self._last: Optional[HardwareSnapshot] = None
+
+    def read(self) -> HardwareSnapshot:
+        now = time.monotonic()
+        if self._last is not None and now - self._last.time < self._min_interval:
+            return self._last
+
+        elapsed = now - self._last.time if self._last is not None else 0.0
+        if elapsed > self._max_gap:
+            elapsed = 0.0
+        self._last = HardwareSnapshot(
+            time=now,
+            disks=self._disks.read(elapsed),
+            sensors=self._sensors.read(),
+        )
+        return self._last
+
+    def close(self):
+        self._disks.close()
+        self._sensors.close()
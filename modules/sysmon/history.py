@@ -0,0 +1,221 @@
+import math
+from array import array
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from modules.utils.broadcast import Broadcast
+
+from .procfs import SystemSnapshot
+from .sampler import Sampler, get_net_sampler, get_system_sampler
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+class RingBuffer:
+    """
+    Fixed-size float32 ring.
+
+    The storage is allocated once; append overwrites the oldest slot in
+    place, so memory stays constant however long the shell runs.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = array("f", bytes(4 * capacity))
+        self._head = 0  # next slot to write
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float):
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    @property
+    def latest(self) -> Optional[float]:
+        return self._data[self._head - 1] if self._count else None
+
+    def values(self) -> array:
+        """Samples oldest to newest (a copy)"""
+        if self._count < self.capacity:
+            return self._data[: self._count]
+        return self._data[self._head :] + self._data[: self._head]
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+
+
+def downsample(values: Sequence[float], points: int) -> Sequence[float]:
+    """Average values into at most `points` evenly sized buckets"""
+    n = len(values)
+    if points <= 0 or n <= points:
+        return values
+
+    if HAS_NUMPY:
+        data = np.frombuffer(values, dtype=np.float32) if isinstance(values, array) else np.asarray(values)
+        starts = np.linspace(0, n, points + 1).astype(np.intp)
+        sums = np.add.reduceat(data, starts[:-1])
+        return (sums / np.diff(starts)).tolist()
+
+    result = []
+    for i in range(points):
+        start = i * n // points
+        end = (i + 1) * n // points
+        result.append(sum(values[start:end]) / (end - start))
+    return result
+
+
+class MetricHistory:
+    """
+    Recent samples at full rate plus a longer tier of averages.
+
+    Every `factor` recent samples are averaged into one long-tier sample,
+    so both windows are drawn from the same number of points.
+    """
+
+    def __init__(self, capacity: int, long_capacity: int, factor: int):
+        self.recent = RingBuffer(capacity)
+        self.long = RingBuffer(long_capacity)
+        self._factor = factor
+        self._sum = 0.0
+        self._pending = 0
+
+    def append(self, value: float):
+        self.recent.append(value)
+        self._sum += value
+        self._pending += 1
+        if self._pending == self._factor:
+            self.long.append(self._sum / self._factor)
+            self._sum = 0.0
+            self._pending = 0
+
+    @property
+    def latest(self) -> Optional[float]:
+        return self.recent.latest
+
+    def series(self, long: bool = False, points: int = 0) -> Sequence[float]:
+        values = (self.long if long else self.recent).values()
+        return downsample(values, points)
+
+
+class SampleHistory:
+    """
+    Per-metric history fed by a Sampler.
+
+    metrics maps a name to a function extracting that value from a
+    snapshot. Keeps `minutes` of samples at the sampler rate and
+    `long_minutes` of averages. Subscribers are called after each
+    recorded sample.
+    """
+
+    def __init__(
+        self,
+        sampler: Sampler,
+        metrics: Dict[str, Callable[[Any], float]],
+        minutes: int = 10,
+        long_minutes: int = 120,
+    ):
+        self._sampler = sampler
+        self._extractors = metrics
+        self.minutes = minutes
+        self.long_minutes = long_minutes
+
+        capacity = max(2, minutes * 60000 // sampler.interval_ms)
+        factor = max(1, math.ceil(long_minutes / minutes))
+        long_capacity = max(2, long_minutes * 60000 // sampler.interval_ms // factor)
+        self.metrics: Dict[str, MetricHistory] = {
+            name: MetricHistory(capacity, long_capacity, factor) for name in metrics
+        }
+
+        self._last_time: Optional[float] = None
+        self._broadcast = Broadcast(lambda: self, self._source)
+
+    def __getitem__(self, metric: str) -> MetricHistory:
+        return self.metrics[metric]
+
+    def subscribe(self, callback: Callable[["SampleHistory"], None]) -> Callable[[], None]:
+        """Call back now and after every sample; returns an unsubscribe function"""
+        return self._broadcast.subscribe(callback)
+
+    def _source(self, notify: Callable[[], None]) -> Callable[[], None]:
+        def on_sample(snapshot):
+            if self._record(snapshot):
+                notify()
+
+        return self._sampler.subscribe(on_sample)
+
+    def _record(self, snapshot) -> bool:
+        # A resubscribe hands back the snapshot that was already recorded
+        if snapshot.time == self._last_time:
+            return False
+        self._last_time = snapshot.time
+
+        for name, extract in self._extractors.items():
+            self.metrics[name].append(extract(snapshot))
+        return True
+
+
+def _cpu_percent(snapshot: SystemSnapshot) -> float:
+    return snapshot.cpu.percent if snapshot.cpu else 0.0
+
+
+def _ram_percent(snapshot: SystemSnapshot) -> float:
+    return snapshot.memory.percent if snapshot.memory else 0.0
+
+
+def _swap_percent(snapshot: SystemSnapshot) -> float:
+    return snapshot.memory.swap_percent if snapshot.memory else 0.0
+
+
+def _load_avg1(snapshot: SystemSnapshot) -> float:
+    return snapshot.load.avg1 if snapshot.load else 0.0
+
+
+SYSTEM_METRICS = {"cpu": _cpu_percent, "ram": _ram_percent, "swap": _swap_percent, "load": _load_avg1}
+NET_METRICS = {"rx": lambda s: s.rx, "tx": lambda s: s.tx}
+
+_history: Optional[SampleHistory] = None
+_net_history: Optional[SampleHistory] = None
+
+
+def get_system_history() -> SampleHistory:
+    """Get or create the global CPU/RAM/swap/load history"""
+    global _history
+
+    if _history is None:
+        from settings import config
+
+        _history = SampleHistory(
+            get_system_sampler(),
+            SYSTEM_METRICS,
+            minutes=config.system.history_minutes,
+            long_minutes=config.system.long_history_minutes,
+        )
+
+    return _history
+
+
+def get_net_history() -> SampleHistory:
+    """Get or create the global RX/TX throughput history"""
+    global _net_history
+
+    if _net_history is None:
+        from settings import config
+
+        _net_history = SampleHistory(
+            get_net_sampler(),
+            NET_METRICS,
+            minutes=config.system.history_minutes,
+            long_minutes=config.system.long_history_minutes,
+        )
+
+    return _net_history
@@ -0,0 +1,80 @@
+import glob
+import os
+import re
+from typing import List, NamedTuple, Optional
+
+from .procfile import ProcFile
+
+_INPUT_RE = re.compile(r"^(temp|fan)(\d+)_input$")
+
+
+class Sensor(NamedTuple):
+    chip: str  # hwmon "name" (k10temp, coretemp, nvme, ...)
+    label: str  # tempN_label, or "temp1" / "fan1"
+    kind: str  # "temp" or "fan"
+    path: str
+
+
+class SensorReading(NamedTuple):
+    chip: str
+    label: str
+    kind: str
+    value: float  # °C or RPM
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def discover_sensors(sys_root: str = "/sys") -> List[Sensor]:
+    """All temperature and fan inputs under <sys_root>/class/hwmon, in a stable order"""
+    sensors = []
+    for hwmon in sorted(glob.glob(os.path.join(sys_root, "class", "hwmon", "hwmon*"))):
+        chip = _read_text(os.path.join(hwmon, "name")) or os.path.basename(hwmon)
+        try:
+            entries = sorted(os.listdir(hwmon))
+        except OSError:
+            continue
+        for entry in entries:
+            match = _INPUT_RE.match(entry)
+            if not match:
+                continue
+            kind, index = match.groups()
+            label = _read_text(os.path.join(hwmon, f"{kind}{index}_label")) or f"{kind}{index}"
+            sensors.append(Sensor(chip, label, kind, os.path.join(hwmon, entry)))
+    return sensors
+
+
+class SensorReader:
+    """
+    Reads every discovered hwmon input in one pass.
+
+    Discovery (directory walks, name and label files) happens once; each
+    input then stays open as a ProcFile and is re-read with one pread per
+    tick. Inputs that fail to read (sensor asleep, device gone) are skipped.
+    """
+
+    def __init__(self, sys_root: str = "/sys"):
+        self.sensors = discover_sensors(sys_root)
+        self._files = [ProcFile(sensor.path, 32) for sensor in self.sensors]
+
+    def read(self) -> List[SensorReading]:
+        readings = []
+        for sensor, f in zip(self.sensors, self._files):
+            data = f.read()
+            try:
+                raw = int(data)
+            except ValueError:
+                continue
+            # temperatures are millidegrees Celsius, fans RPM
+            value = raw / 1000 if sensor.kind == "temp" else float(raw)
+            readings.append(SensorReading(sensor.chip, sensor.label, sensor.kind, value))
+        return readings
+
+    def close(self):
+        for f in self._files:
+            f.close()
@@ -0,0 +1,110 @@
+import os
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .procfile import ProcFile
+
+LOOPBACK = "lo"
+# Lowest EMA weight; at 0 the rates would never move off zero
+MIN_SMOOTHING = 0.05
+
+
+class InterfaceRate(NamedTuple):
+    name: str
+    rx: float  # bytes/s, smoothed
+    tx: float
+    rx_bytes: int  # counters since boot
+    tx_bytes: int
+
+
+class NetSnapshot(NamedTuple):
+    time: float  # time.monotonic()
+    interfaces: Dict[str, InterfaceRate]
+    # Sums over every interface except loopback
+    rx: float
+    tx: float
+
+
+def format_rate(bytes_per_sec: float) -> str:
+    """1234567 -> '1.2 MB/s'"""
+    value = float(bytes_per_sec)
+    for unit in ("B/s", "kB/s", "MB/s"):
+        if value < 1000:
+            return f"{value:.0f} {unit}" if unit == "B/s" or value >= 100 else f"{value:.1f} {unit}"
+        value /= 1000
+    return f"{value:.1f} GB/s"
+
+
+class NetDevReader:
+    """
+    Per-interface RX/TX rates from /proc/net/dev.
+
+    One pread and one parse per tick through a persistent descriptor.
+    Rates are counter deltas over the elapsed time, smoothed with an
+    exponential moving average (smoothing is the weight of the newest
+    sample, at least MIN_SMOOTHING; 1.0 disables smoothing). A counter that
+    goes backwards (driver reset, interface re-created) restarts that
+    interface from zero.
+
+    root can point at a fake procfs tree containing net/dev.
+    """
+
+    def __init__(self, root: str = "/proc", smoothing: float = 0.5, min_interval: float = 0.25):
+        self.root = root
+        self._smoothing = min(max(smoothing, MIN_SMOOTHING), 1.0)
+        self._min_interval = min_interval
+        self._file = ProcFile(os.path.join(root, "net", "dev"), 4096)
+
+        # name -> (rx_bytes, tx_bytes, rx_rate, tx_rate)
+        self._state: Dict[str, Tuple[int, int, float, float]] = {}
+        self._last_time: Optional[float] = None
+        self._last: Optional[NetSnapshot] = None
+
+    def read(self) -> NetSnapshot:
+        now = time.monotonic()
+        if self._last is not None and now - self._last.time < self._min_interval:
+            return self._last
+
+        elapsed = now - self._last_time if self._last_time is not None else 0.0
+        self._last_time = now
+
+        alpha = self._smoothing
+        state = self._state
+        new_state = {}
+        interfaces = {}
+        total_rx = total_tx = 0.0
+
+        # Two header lines, then "  eth0: rx_bytes rx_packets ... tx_bytes ..."
+        for line in self._file.read().split(b"\n")[2:]:
+            name, sep, counters = line.partition(b":")
+            if not sep:
+                continue
+            fields = counters.split()
+            if len(fields) < 9:
+                continue
+            name = name.strip().decode()
+            rx_bytes = int(fields[0])
+            tx_bytes = int(fields[8])
+
+            rx_rate = tx_rate = 0.0
+            prev = state.get(name)
+            if prev is not None and elapsed > 0:
+                rx_delta = rx_bytes - prev[0]
+                tx_delta = tx_bytes - prev[1]
+                if rx_delta >= 0 and tx_delta >= 0:
+                    rx_rate = alpha * rx_delta / elapsed + (1 - alpha) * prev[2]
+                    tx_rate = alpha * tx_delta / elapsed + (1 - alpha) * prev[3]
+
+            new_state[name] = (rx_bytes, tx_bytes, rx_rate, tx_rate)
+            interfaces[name] = InterfaceRate(name, rx_rate, tx_rate, rx_bytes, tx_bytes)
+            if name != LOOPBACK:
+                total_rx += rx_rate
+                total_tx += tx_rate
+
+        # Interfaces that disappeared are dropped with the old state
+        self._state = new_state
+        self._last = NetSnapshot(time=now, interfaces=interfaces, rx=total_rx, tx=total_tx)
+        return self._last
+
+    def close(self):
+        self._file.close()
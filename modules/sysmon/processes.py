@@ -0,0 +1,162 @@
+import heapq
+import os
+import resource
+import time
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .procfile import ProcFile
+
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+# Fields after "pid (comm) ", 0-based: state=0, utime=11, stime=12, starttime=19, rss=21
+_UTIME, _STIME, _STARTTIME, _RSS = 11, 12, 19, 21
+
+_by_cpu = itemgetter(0)
+_by_memory = itemgetter(1)
+
+
+class ProcessInfo(NamedTuple):
+    pid: int
+    name: str
+    cpu: float  # % of one core since the previous tick
+    memory: int  # resident bytes
+
+
+class ProcessSnapshot(NamedTuple):
+    time: float  # time.monotonic()
+    by_cpu: List[ProcessInfo]
+    by_memory: List[ProcessInfo]
+    count: int
+
+
+def _default_max_open() -> int:
+    """Half of the soft fd limit, so the rest of the shell keeps its headroom"""
+    try:
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (ValueError, OSError):
+        return 256
+    if soft == resource.RLIM_INFINITY:
+        return 4096
+    return max(0, soft // 2)
+
+
+class ProcessReader:
+    """
+    Top-N processes by CPU and by memory.
+
+    Each tick lists <root> with os.scandir and reads every /proc/<pid>/stat
+    through a ProcFile cached per pid (at most max_open of them; any beyond
+    that are opened per read). CPU is the utime+stime delta since the
+    previous tick; starttime tells a reused pid apart from the old process.
+    Only the top `limit` entries are selected with heapq.nlargest, the
+    process table itself is never sorted.
+
+    Like HardwareReader, a read more than max_gap seconds after the previous
+    one starts over instead of averaging CPU over the pause.
+    """
+
+    def __init__(
+        self,
+        root: str = "/proc",
+        limit: int = 5,
+        max_open: Optional[int] = None,
+        min_interval: float = 0.25,
+        max_gap: float = 30.0,
+    ):
+        self.root = root
+        self.limit = limit
+        self._max_open = _default_max_open() if max_open is None else max_open
+        self._min_interval = min_interval
+        self._max_gap = max_gap
+
+        # Keyed by the /proc entry name
+        self._files: Dict[str, ProcFile] = {}
+        # pid -> (starttime, utime + stime)
+        self._prev: Dict[str, Tuple[int, int]] = {}
+        self._last: Optional[ProcessSnapshot] = None
+
+    def _open_stat(self, pid: str) -> bytes:
+        """Read a pid with no cached handle (new process, dead handle or over max_open)"""
+        path = os.path.join(self.root, pid, "stat")
+        if len(self._files) < self._max_open:
+            f = ProcFile(path, 1024)
+            if not f.available:
+                return b""
+            self._files[pid] = f
+            return f.read()
+
+        try:
+            with open(path, "rb") as fh:
+                return fh.read()
+        except OSError:
+            return b""
+
+    def read(self) -> ProcessSnapshot:
+        now = time.monotonic()
+        last = self._last
+        if last is not None and now - last.time < self._min_interval:
+            return last
+
+        elapsed = now - last.time if last is not None else 0.0
+        if elapsed > self._max_gap:
+            elapsed = 0.0
+        scale = 100 / (CLK_TCK * elapsed) if elapsed > 0 else 0.0
+        files = self._files
+        prev = self._prev
+        current: Dict[str, Tuple[int, int]] = {}
+        # (cpu, rss_pages, pid, "pid (comm")
+        rows = []
+
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                pid = entry.name
+                if not pid.isdigit():
+                    continue
+
+                f = files.get(pid)
+                data = f.read() if f is not None else None
+                if not data:
+                    # Exited, or the pid was reused under a dead handle
+                    if f is not None:
+                        del files[pid]
+                        f.close()
+                    data = self._open_stat(pid)
+                    if not data:
+                        continue
+
+                head, _, tail = data.rpartition(b")")
+                fields = tail.split(None, _RSS + 1)
+                if len(fields) <= _RSS:
+                    continue
+                start = int(fields[_STARTTIME])
+                ticks = int(fields[_UTIME]) + int(fields[_STIME])
+                current[pid] = (start, ticks)
+
+                before = prev.get(pid)
+                cpu = (ticks - before[1]) * scale if before is not None and before[0] == start else 0.0
+                rows.append((cpu, int(fields[_RSS]), pid, head))
+
+        # Drop handles of processes that are gone
+        for pid in files.keys() - current.keys():
+            files.pop(pid).close()
+        self._prev = current
+
+        self._last = ProcessSnapshot(
+            time=now,
+            by_cpu=[self._info(row) for row in heapq.nlargest(self.limit, rows, key=_by_cpu)],
+            by_memory=[self._info(row) for row in heapq.nlargest(self.limit, rows, key=_by_memory)],
+            count=len(rows),
+        )
+        return self._last
+
+    def _info(self, row) -> ProcessInfo:
+        cpu, rss, pid, head = row
+        name = head.partition(b"(")[2].decode(errors="replace")
+        return ProcessInfo(pid=int(pid), name=name, cpu=cpu, memory=rss * PAGE_SIZE)
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
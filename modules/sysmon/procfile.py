@@ -0,0 +1,61 @@
+import os
+from typing import Optional
+
+_HAS_PREADV = hasattr(os, "preadv")
+
+
+class ProcFile:
+    """
+    A procfs/sysfs file kept open and re-read from offset 0.
+
+    The kernel regenerates the contents on every read at offset 0, so one
+    descriptor serves the whole session: no open/close or path lookup per
+    sample. Data is read into a reusable buffer that grows (and stays grown)
+    if a read fills it.
+
+    A file that cannot be opened reads as empty, so a missing PSI file or an
+    unreadable sensor just drops out of the snapshot.
+    """
+
+    def __init__(self, path: str, size: int = 4096):
+        self.path = path
+        self._buf = bytearray(size)
+        self._view = memoryview(self._buf)
+        self._fd: Optional[int] = None
+        try:
+            self._fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError:
+            pass
+
+    @property
+    def available(self) -> bool:
+        return self._fd is not None
+
+    def read(self) -> bytes:
+        if self._fd is None:
+            return b""
+        try:
+            while True:
+                if _HAS_PREADV:
+                    n = os.preadv(self._fd, [self._buf], 0)
+                else:
+                    data = os.pread(self._fd, len(self._buf), 0)
+                    n = len(data)
+                    self._buf[:n] = data
+                if n < len(self._buf):
+                    return self._view[:n].tobytes()
+                self._buf = bytearray(len(self._buf) * 2)
+                self._view = memoryview(self._buf)
+        except OSError:
+            return b""
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,183 @@
+import os
+import time
+from array import array
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .procfile import ProcFile
+
+PRESSURE_RESOURCES = ("cpu", "memory", "io")
+
+_MEMINFO_KEYS = {
+    b"MemTotal": "total",
+    b"MemAvailable": "available",
+    b"SwapTotal": "swap_total",
+    b"SwapFree": "swap_free",
+}
+
+
+class CpuSnapshot(NamedTuple):
+    percent: float  # all cores
+    per_core: Tuple[float, ...]
+
+
+class MemorySnapshot(NamedTuple):
+    # kB, as in /proc/meminfo
+    total: int
+    available: int
+    swap_total: int
+    swap_free: int
+
+    @property
+    def percent(self) -> float:
+        return (self.total - self.available) / self.total * 100 if self.total > 0 else 0.0
+
+    @property
+    def swap_percent(self) -> float:
+        return (self.swap_total - self.swap_free) / self.swap_total * 100 if self.swap_total > 0 else 0.0
+
+
+class LoadSnapshot(NamedTuple):
+    avg1: float
+    avg5: float
+    avg15: float
+    running: int
+    total: int
+
+
+class PressureSnapshot(NamedTuple):
+    # avg10 percentages; "full" is 0 where the kernel doesn't report it
+    some: float
+    full: float
+
+
+class SystemSnapshot(NamedTuple):
+    time: float  # time.monotonic()
+    cpu: Optional[CpuSnapshot]
+    memory: Optional[MemorySnapshot]
+    load: Optional[LoadSnapshot]
+    pressure: Dict[str, PressureSnapshot]
+
+
+class ProcfsReader:
+    """
+    Reads /proc/stat, /proc/meminfo, /proc/loadavg and /proc/pressure/* in
+    one pass through persistent descriptors.
+
+    CPU usage is the delta of the jiffy counters since the previous read,
+    kept per core in preallocated arrays. The first read reports the
+    average since boot. Reads closer together than min_interval return the
+    previous snapshot, since deltas over a few milliseconds are just noise.
+
+    root can point at a fake procfs tree with the same file layout.
+    """
+
+    def __init__(self, root: str = "/proc", min_interval: float = 0.25):
+        self.root = root
+        self._min_interval = min_interval
+        self._stat = ProcFile(os.path.join(root, "stat"), 16384)
+        self._meminfo = ProcFile(os.path.join(root, "meminfo"), 8192)
+        self._loadavg = ProcFile(os.path.join(root, "loadavg"), 256)
+        self._pressure: Dict[str, ProcFile] = {}
+        for name in PRESSURE_RESOURCES:
+            f = ProcFile(os.path.join(root, "pressure", name), 256)
+            if f.available:
+                self._pressure[name] = f
+
+        # Index 0 is the aggregate "cpu" line, 1.. are cpu0, cpu1, ...
+        self._prev_total = array("Q")
+        self._prev_idle = array("Q")
+        self._last: Optional[SystemSnapshot] = None
+
+    def read(self) -> SystemSnapshot:
+        now = time.monotonic()
+        if self._last is not None and now - self._last.time < self._min_interval:
+            return self._last
+
+        self._last = SystemSnapshot(
+            time=now,
+            cpu=self._parse_cpu(self._stat.read()),
+            memory=self._parse_meminfo(self._meminfo.read()),
+            load=self._parse_loadavg(self._loadavg.read()),
+            pressure={name: self._parse_pressure(f.read()) for name, f in self._pressure.items()},
+        )
+        return self._last
+
+    def close(self):
+        for f in (self._stat, self._meminfo, self._loadavg, *self._pressure.values()):
+            f.close()
+
+    def _parse_cpu(self, data: bytes) -> Optional[CpuSnapshot]:
+        prev_total = self._prev_total
+        prev_idle = self._prev_idle
+        percents = []
+
+        # cpu lines come first; stop at the first other line
+        for index, line in enumerate(data.split(b"\n")):
+            if not line.startswith(b"cpu"):
+                break
+            fields = line.split()
+            # user nice system idle iowait irq softirq steal; guest time is already in user
+            values = [int(v) for v in fields[1:9]]
+            if len(values) < 5:
+                break
+            idle = values[3] + values[4]
+            total = sum(values)
+
+            if index == len(prev_total):
+                prev_total.append(0)
+                prev_idle.append(0)
+
+            total_delta = total - prev_total[index]
+            idle_delta = idle - prev_idle[index]
+            prev_total[index] = total
+            prev_idle[index] = idle
+
+            usage = 0.0 if total_delta <= 0 else 100 * (1 - idle_delta / total_delta)
+            percents.append(max(0.0, min(usage, 100.0)))
+
+        if not percents:
+            return None
+        return CpuSnapshot(percent=percents[0], per_core=tuple(percents[1:]))
+
+    def _parse_meminfo(self, data: bytes) -> Optional[MemorySnapshot]:
+        values = {}
+        for line in data.split(b"\n"):
+            key, _, rest = line.partition(b":")
+            field = _MEMINFO_KEYS.get(key)
+            if field is None:
+                continue
+            values[field] = int(rest.split()[0])
+            if len(values) == len(_MEMINFO_KEYS):
+                break
+
+        if "total" not in values:
+            return None
+        return MemorySnapshot(
+            total=values["total"],
+            available=values.get("available", 0),
+            swap_total=values.get("swap_total", 0),
+            swap_free=values.get("swap_free", 0),
+        )
+
+    def _parse_loadavg(self, data: bytes) -> Optional[LoadSnapshot]:
+        fields = data.split()
+        if len(fields) < 4:
+            return None
+        running, _, total = fields[3].partition(b"/")
+        return LoadSnapshot(
+            avg1=float(fields[0]),
+            avg5=float(fields[1]),
+            avg15=float(fields[2]),
+            running=int(running),
+            total=int(total or 0),
+        )
+
+    def _parse_pressure(self, data: bytes) -> PressureSnapshot:
+        # some avg10=0.00 avg60=0.00 avg300=0.00 total=0
+        # full avg10=0.00 avg60=0.00 avg300=0.00 total=0
+        avg10 = {}
+        for line in data.split(b"\n"):
+            fields = line.split()
+            if len(fields) > 1 and fields[1].startswith(b"avg10="):
+                avg10[fields[0]] = float(fields[1][6:])
+        return PressureSnapshot(some=avg10.get(b"some", 0.0), full=avg10.get(b"full", 0.0))
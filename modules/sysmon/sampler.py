@@ -0,0 +1,149 @@
+from typing import Any, Callable, Optional
+
+from modules.utils.broadcast import Broadcast, poll_source
+
+from .hardware import HardwareReader
+from .netdev import NetDevReader
+from .processes import ProcessReader
+from .procfs import ProcfsReader
+
+
+class Sampler:
+    """
+    Calls read() at one rate and hands each snapshot to every subscriber.
+
+    Sampling runs only while someone is subscribed; a late subscriber gets
+    the latest snapshot immediately instead of triggering an extra read.
+    """
+
+    def __init__(self, read: Callable[[], Any], interval_ms: int = 3000):
+        self.interval_ms = interval_ms
+        self._broadcast = Broadcast(read, poll_source(interval_ms))
+
+    def subscribe(self, callback: Callable[[Any], None]) -> Callable[[], None]:
+        """Call back now and on every sample; returns an unsubscribe function"""
+        return self._broadcast.subscribe(callback)
+
+    @property
+    def latest(self) -> Any:
+        return self._broadcast.value
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._broadcast.listener_count
+
+
+class SystemSampler(Sampler):
+    """CPU, memory, load and pressure (SystemSnapshot)"""
+
+    def __init__(self, root: str = "/proc", interval_ms: int = 3000):
+        self._reader = ProcfsReader(root)
+        super().__init__(self._reader.read, interval_ms)
+
+
+class NetSampler(Sampler):
+    """Per-interface throughput from /proc/net/dev (NetSnapshot)"""
+
+    def __init__(self, root: str = "/proc", interval_ms: int = 3000, smoothing: float = 0.5):
+        self._reader = NetDevReader(root, smoothing=smoothing)
+        super().__init__(self._reader.read, interval_ms)
+
+
+class HardwareSampler(Sampler):
+    """Disk throughput and hwmon sensors (HardwareSnapshot)"""
+
+    def __init__(self, root: str = "/proc", sys_root: str = "/sys", interval_ms: int = 3000):
+        self._reader = HardwareReader(root, sys_root)
+        super().__init__(self._reader.read, interval_ms)
+
+
+class ProcessSampler(Sampler):
+    """Top processes by CPU and memory (ProcessSnapshot)"""
+
+    def __init__(self, root: str = "/proc", limit: int = 5, interval_ms: int = 3000):
+        self._reader = ProcessReader(root, limit=limit)
+        super().__init__(self._reader.read, interval_ms)
+
+
+_sampler: Optional[SystemSampler] = None
+_net_sampler: Optional[NetSampler] = None
+_hardware_sampler: Optional[HardwareSampler] = None
+_process_sampler: Optional[ProcessSampler] = None
+
+
+def get_system_sampler() -> SystemSampler:
+    """Get or create global SystemSampler instance"""
+    global _sampler
+
+    if _sampler is None:
+        from settings import config
+
+        _sampler = SystemSampler(interval_ms=config.system.sample_interval)
+
+    return _sampler
+
+
+def set_system_sampler(sampler: SystemSampler):
+    """Replace the sampler (e.g. one reading a fake procfs root); call before widgets are built"""
+    global _sampler
+    _sampler = sampler
+
+
+def get_net_sampler() -> NetSampler:
+    """Get or create global NetSampler instance"""
+    global _net_sampler
+
+    if _net_sampler is None:
+        from settings import config
+
+        _net_sampler = NetSampler(
+            interval_ms=config.system.sample_interval,
+            smoothing=config.system.net_smoothing,
+        )
+
+    return _net_sampler
+
+
+def set_net_sampler(sampler: NetSampler):
+    """Replace the network sampler; call before widgets are built"""
+    global _net_sampler
+    _net_sampler = sampler
+
+
+def get_hardware_sampler() -> HardwareSampler:
+    """Get or create global HardwareSampler instance"""
+    global _hardware_sampler
+
+    if _hardware_sampler is None:
+        from settings import config
+
+        _hardware_sampler = HardwareSampler(interval_ms=config.system.sample_interval)
+
+    return _hardware_sampler
+
+
+def set_hardware_sampler(sampler: HardwareSampler):
+    """Replace the hardware sampler (e.g. one reading a fake sysfs root); call before widgets are built"""
+    global _hardware_sampler
+    _hardware_sampler = sampler
+
+
+def get_process_sampler() -> ProcessSampler:
+    """Get or create global ProcessSampler instance"""
+    global _process_sampler
+
+    if _process_sampler is None:
+        from settings import config
+
+        _process_sampler = ProcessSampler(
+            limit=config.system.top_processes,
+            interval_ms=config.system.sample_interval,
+        )
+
+    return _process_sampler
+
+
+def set_process_sampler(sampler: ProcessSampler):
+    """Replace the process sampler (e.g. one reading a fake procfs root); call before widgets are built"""
+    global _process_sampler
+    _process_sampler = sampler
@@ -0,0 +1,95 @@
+from typing import Optional
+
+from gi.repository import Gtk
+
+from .history import SampleHistory, get_system_history
+
+PADDING = 1
+
+
+class Sparkline(Gtk.DrawingArea):
+    """
+    Filled line of one SampleHistory metric, in the widget's CSS color.
+
+    Draws straight from the ring buffer, downsampled to about one point per
+    two pixels. Defaults to the system history; max_value=None scales to
+    the largest visible sample (load, throughput).
+    """
+
+    def __init__(
+        self,
+        metric: str,
+        max_value: Optional[float] = 100.0,
+        long: bool = False,
+        height: int = 28,
+        width: int = -1,
+        css_classes: Optional[list] = None,
+        history: Optional[SampleHistory] = None,
+    ):
+        super().__init__()
+        self._metric = metric
+        self._max_value = max_value
+        self._long = long
+        self._history: Optional[SampleHistory] = None
+
+        self.set_content_height(height)
+        if width > 0:
+            self.set_content_width(width)
+        else:
+            self.set_hexpand(True)
+        self.set_css_classes(["sparkline", *(css_classes or [])])
+        self.set_draw_func(self._draw)
+
+        self._unsubscribe = (history or get_system_history()).subscribe(self._on_history)
+        self.connect("destroy", self._cleanup)
+
+    @property
+    def long(self) -> bool:
+        return self._long
+
+    @long.setter
+    def long(self, value: bool):
+        if value != self._long:
+            self._long = value
+            self.queue_draw()
+
+    def _cleanup(self, *_):
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    def _on_history(self, history: SampleHistory):
+        self._history = history
+        self.queue_draw()
+
+    def _draw(self, _area, cr, width: int, height: int):
+        if self._history is None:
+            return
+        values = self._history[self._metric].series(self._long, points=max(2, width // 2))
+        count = len(values)
+        if count < 2:
+            return
+
+        top = self._max_value or max(max(values), 1.0)
+        plot_h = height - 2 * PADDING
+        step = width / (count - 1)
+
+        color = self.get_color()
+        r, g, b = color.red, color.green, color.blue
+
+        def y_for(v: float) -> float:
+            return PADDING + plot_h - min(v / top, 1.0) * plot_h
+
+        cr.move_to(0, y_for(values[0]))
+        for i in range(1, count):
+            cr.line_to(i * step, y_for(values[i]))
+
+        cr.set_source_rgba(r, g, b, 0.9)
+        cr.set_line_width(1.5)
+        cr.stroke_preserve()
+
+        cr.line_to(width, height)
+        cr.line_to(0, height)
+        cr.close_path()
+        cr.set_source_rgba(r, g, b, 0.2)
+        cr.fill()
@@ -1,10 +1,29 @@
 from .bar_state import BarStateManager, load_bar_state, save_bar_state
+from .broadcast import Broadcast, poll_source, signal_source
+from .icon_cache import IconTextureCache, get_icon_cache, set_icon_texture
+from .scroll_accumulator import ScrollAccumulator
 from .signal_manager import SignalManager
 from .task_storage_manager import TaskStorageManager
+from .thumbnails import ThumbnailService, get_thumbnail_service
+from .update_batcher import UpdateBatcher, get_update_batcher, set_css_class, set_if_changed, set_tooltip_if_changed
 
 __all__ = [
     "SignalManager",
     "TaskStorageManager",
+    "ThumbnailService",
+    "get_thumbnail_service",
+    "IconTextureCache",
+    "get_icon_cache",
+    "set_icon_texture",
+    "ScrollAccumulator",
+    "Broadcast",
+    "signal_source",
+    "poll_source",
+    "UpdateBatcher",
+    "get_update_batcher",
+    "set_if_changed",
+    "set_css_class",
+    "set_tooltip_if_changed",
     "BarStateManager",
     "load_bar_state",
     "save_bar_state",
@@ -0,0 +1,106 @@
+from typing import Any, Callable, Dict, Optional
+
+from ignis import utils
+
+from .signal_manager import SignalManager
+from .update_batcher import get_update_batcher
+
+# start(notify) wires the upstream and returns a function that tears it down
+Source = Callable[[Callable[[], None]], Callable[[], None]]
+
+
+class Broadcast:
+    """
+    One upstream subscription fanned out to any number of listeners.
+
+    The upstream (service signals, a poll, ...) is attached when the first
+    listener subscribes and detached when the last one leaves. Each upstream
+    event computes the value once and hands it to every listener, so N bars
+    cost one set of handlers and one computation instead of N.
+
+    With batched=True, upstream events only mark the broadcast dirty and the
+    value is computed and delivered once per frame by the UpdateBatcher.
+    With distinct=True, listeners are only called when the computed value
+    differs from the previous one.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[], Any],
+        source: Source,
+        batched: bool = False,
+        distinct: bool = False,
+    ):
+        self._compute = compute
+        self._source = source
+        self._batched = batched
+        self._distinct = distinct
+        self._listeners: Dict[int, Callable[[Any], None]] = {}
+        self._next_id = 0
+        self._stop: Optional[Callable[[], None]] = None
+        self._value: Any = None
+
+    @property
+    def value(self) -> Any:
+        return self._value if self._stop is not None else self._compute()
+
+    def subscribe(self, callback: Callable[[Any], None]) -> Callable[[], None]:
+        """Call back now with the current value and on every change; returns an unsubscribe function"""
+        if self._stop is None:
+            self._value = self._compute()
+            self._stop = self._source(self._notify)
+
+        listener_id = self._next_id
+        self._next_id += 1
+        self._listeners[listener_id] = callback
+        callback(self._value)
+        return lambda: self._unsubscribe(listener_id)
+
+    @property
+    def listener_count(self) -> int:
+        return len(self._listeners)
+
+    def _unsubscribe(self, listener_id: int):
+        if self._listeners.pop(listener_id, None) is None:
+            return
+        if not self._listeners and self._stop is not None:
+            self._stop()
+            self._stop = None
+            if self._batched:
+                get_update_batcher().cancel(self)
+
+    def _notify(self, *_):
+        if self._batched:
+            get_update_batcher().mark(self, self._deliver)
+        else:
+            self._deliver()
+
+    def _deliver(self):
+        value = self._compute()
+        if self._distinct and value == self._value:
+            return
+        self._value = value
+        for callback in list(self._listeners.values()):
+            callback(self._value)
+
+
+def signal_source(*connections: tuple) -> Source:
+    """Source from (gobject, signal_name) pairs"""
+
+    def start(notify: Callable[[], None]) -> Callable[[], None]:
+        signals = SignalManager()
+        for obj, signal_name in connections:
+            signals.connect(obj, signal_name, notify)
+        return signals.disconnect_all
+
+    return start
+
+
+def poll_source(interval_ms: int) -> Source:
+    """Source that fires every interval_ms"""
+
+    def start(notify: Callable[[], None]) -> Callable[[], None]:
+        poll = utils.Poll(interval_ms, lambda *_: notify())
+        return poll.cancel
+
+    return start
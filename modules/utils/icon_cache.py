@@ -0,0 +1,116 @@
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+from gi.repository import Gdk, GdkPixbuf, GLib
+
+
+class IconTextureCache:
+    """
+    Rasterizes icon files (SVG or bitmap) once per (path, size, scale) and
+    shares the resulting texture between widgets.
+
+    Textures are kept in an LRU; when a disk directory is given the rasterized
+    PNGs are stored there too, so later sessions skip librsvg entirely. Disk
+    entries are named after the source mtime, so edited icons are picked up.
+    """
+
+    def __init__(self, disk_dir: Optional[Path] = None, max_textures: int = 128):
+        self.disk_dir = disk_dir
+        self._max_textures = max_textures
+        self._textures: "OrderedDict[Tuple[str, int, int], Gdk.Texture]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, path: str, size: int, scale: int = 1) -> Optional[Gdk.Texture]:
+        """Texture of path rasterized at size * scale pixels, or None if it cannot be loaded"""
+        key = (path, size, scale)
+        texture = self._textures.get(key)
+        if texture is not None:
+            self._textures.move_to_end(key)
+            self.hits += 1
+            return texture
+
+        self.misses += 1
+        texture = self._load(path, size * scale)
+        if texture is None:
+            return None
+
+        self._textures[key] = texture
+        while len(self._textures) > self._max_textures:
+            self._textures.popitem(last=False)
+        return texture
+
+    def clear(self):
+        self._textures.clear()
+
+    def _disk_path(self, path: str, mtime: int, pixels: int) -> Optional[Path]:
+        if self.disk_dir is None:
+            return None
+        digest = hashlib.md5(f"{path}:{mtime}:{pixels}".encode()).hexdigest()
+        return self.disk_dir / f"{digest}.png"
+
+    def _load(self, path: str, pixels: int) -> Optional[Gdk.Texture]:
+        try:
+            mtime = int(os.stat(path).st_mtime)
+        except OSError:
+            return None
+
+        disk_path = self._disk_path(path, mtime, pixels)
+        if disk_path is not None and disk_path.exists():
+            try:
+                return Gdk.Texture.new_from_filename(str(disk_path))
+            except GLib.Error:
+                pass
+
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(path, pixels, pixels)
+        except GLib.Error as e:
+            print(f"Failed to load icon {path}: {e}")
+            return None
+
+        if disk_path is not None:
+            try:
+                disk_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = disk_path.with_suffix(f".{os.getpid()}.tmp")
+                pixbuf.savev(str(tmp_path), "png", [], [])
+                os.replace(tmp_path, disk_path)
+            except (GLib.Error, OSError):
+                pass
+
+        return Gdk.Texture.new_for_pixbuf(pixbuf)
+
+
+def set_icon_texture(image, path: str, size: int):
+    """
+    Show a cached texture for an icon file on a Gtk.Image-based widget.
+
+    Themed icon names (no path separator) are passed through unchanged.
+    """
+    if "/" not in path:
+        image.image = path
+        return
+
+    texture = get_icon_cache().lookup(path, size, image.get_scale_factor())
+    if texture is None:
+        image.image = path
+    else:
+        image.set_from_paintable(texture)
+
+
+# Global instance
+_icon_cache: Optional[IconTextureCache] = None
+
+
+def get_icon_cache() -> IconTextureCache:
+    """Get or create global IconTextureCache instance"""
+    global _icon_cache
+
+    if _icon_cache is None:
+        from settings import config
+
+        _icon_cache = IconTextureCache(config.paths.icon_cache_dir)
+
+    return _icon_cache
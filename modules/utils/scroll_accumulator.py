@@ -0,0 +1,84 @@
+import time
+from typing import Callable
+
+from gi.repository import Gdk, Gtk
+from ignis import utils
+
+# Delta needed for one step: a wheel notch, or this many surface pixels on a touchpad
+WHEEL_THRESHOLD = 1.0
+SURFACE_THRESHOLD = 40.0
+MIN_INTERVAL_MS = 150
+
+
+class ScrollAccumulator:
+    """
+    Turns raw scroll deltas into throttled, discrete steps.
+
+    Deltas from Gtk.EventControllerScroll are summed until they cross the
+    threshold. Steps that pile up within `min_interval_ms` of the last
+    dispatch are collapsed into a single `on_steps(n)` call, so a touchpad
+    flick becomes one action instead of dozens.
+    """
+
+    def __init__(
+        self,
+        on_steps: Callable[[int], None],
+        threshold: float = WHEEL_THRESHOLD,
+        surface_threshold: float = SURFACE_THRESHOLD,
+        min_interval_ms: int = MIN_INTERVAL_MS,
+    ):
+        self._on_steps = on_steps
+        self._threshold = threshold
+        self._surface_threshold = surface_threshold
+        self._min_interval = min_interval_ms / 1000
+        self._delta = 0.0
+        self._pending = 0
+        self._last_flush = 0.0
+        self._timeout = None
+
+    def attach(self, widget: Gtk.Widget) -> Gtk.EventControllerScroll:
+        controller = Gtk.EventControllerScroll.new(Gtk.EventControllerScrollFlags.VERTICAL)
+        controller.connect("scroll", self._on_scroll)
+        widget.add_controller(controller)
+        return controller
+
+    def reset(self):
+        self._delta = 0.0
+        self._pending = 0
+        if self._timeout:
+            self._timeout.cancel()
+            self._timeout = None
+
+    def _on_scroll(self, controller, _dx: float, dy: float) -> bool:
+        if controller.get_unit() == Gdk.ScrollUnit.SURFACE:
+            threshold = self._surface_threshold
+        else:
+            threshold = self._threshold
+
+        # Reversing direction drops the leftover from the other way
+        if self._delta * dy < 0:
+            self._delta = 0.0
+        self._delta += dy
+
+        steps = int(self._delta / threshold)
+        if steps:
+            self._delta -= steps * threshold
+            self._pending += steps
+            self._schedule()
+        return True
+
+    def _schedule(self):
+        if self._timeout is not None:
+            return
+        wait = self._last_flush + self._min_interval - time.monotonic()
+        if wait <= 0:
+            self._flush()
+        else:
+            self._timeout = utils.Timeout(int(wait * 1000) + 1, self._flush)
+
+    def _flush(self):
+        self._timeout = None
+        steps, self._pending = self._pending, 0
+        if steps:
+            self._last_flush = time.monotonic()
+            self._on_steps(steps)
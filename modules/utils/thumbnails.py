@@ -0,0 +1,140 @@
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from gi.repository import Gdk, GdkPixbuf, GLib
+
+# freedesktop.org thumbnail flavours → max edge in pixels
+FLAVORS = [("normal", 128), ("large", 256), ("x-large", 512), ("xx-large", 1024)]
+
+
+def _flavor_for(edge: int) -> Tuple[str, int]:
+    """Smallest thumbnail flavour that covers the requested edge"""
+    for name, size in FLAVORS:
+        if edge <= size:
+            return name, size
+    return FLAVORS[-1]
+
+
+class ThumbnailService:
+    """
+    Decodes and downscales images in a worker thread.
+
+    Thumbnails are stored on disk following the freedesktop thumbnail spec
+    (md5 of the file URI, Thumb::URI / Thumb::MTime / Thumb::Size PNG keys)
+    and kept in memory as ready-to-use textures keyed by path + mtime + size.
+    """
+
+    def __init__(self, cache_dir: Path, max_textures: int = 64):
+        self.cache_dir = cache_dir
+        self._max_textures = max_textures
+        self._textures: "OrderedDict[tuple, Gdk.Texture]" = OrderedDict()
+        self._pending: Dict[tuple, asyncio.Task] = {}
+
+    async def get_texture(self, path: str, width: int, height: int) -> Optional[Gdk.Texture]:
+        """Return a texture of at least width x height for the image at path"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        flavor, edge = _flavor_for(max(width, height))
+        key = (path, int(st.st_mtime), st.st_size, flavor)
+
+        texture = self._textures.get(key)
+        if texture is not None:
+            self._textures.move_to_end(key)
+            return texture
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, edge))
+            self._pending[key] = task
+
+        # Shield so a cancelled consumer does not abort a shared decode
+        return await asyncio.shield(task)
+
+    def invalidate(self, path: str):
+        """Drop in-memory textures for a path (e.g. after deleting the file)"""
+        for key in [k for k in self._textures if k[0] == path]:
+            del self._textures[key]
+
+    async def _load(self, key: tuple, edge: int) -> Optional[Gdk.Texture]:
+        path, mtime, size, flavor = key
+        try:
+            pixbuf = await asyncio.to_thread(self._load_pixbuf, path, mtime, size, flavor, edge)
+        finally:
+            self._pending.pop(key, None)
+
+        if pixbuf is None:
+            return None
+
+        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+        self._textures[key] = texture
+        while len(self._textures) > self._max_textures:
+            self._textures.popitem(last=False)
+        return texture
+
+    def _thumb_path(self, uri: str, flavor: str) -> Path:
+        return self.cache_dir / flavor / f"{hashlib.md5(uri.encode()).hexdigest()}.png"
+
+    def _load_pixbuf(self, path: str, mtime: int, size: int, flavor: str, edge: int):
+        """Worker thread: read a valid cached thumbnail or generate a new one"""
+        uri = Path(path).resolve().as_uri()
+        thumb_path = self._thumb_path(uri, flavor)
+
+        try:
+            cached = GdkPixbuf.Pixbuf.new_from_file(str(thumb_path))
+            cached_mtime = cached.get_option("tEXt::Thumb::MTime")
+            cached_size = cached.get_option("tEXt::Thumb::Size")
+            if cached_mtime == str(mtime) and cached_size in (None, str(size)):
+                return cached
+        except GLib.Error:
+            pass
+
+        try:
+            _fmt, src_w, src_h = GdkPixbuf.Pixbuf.get_file_info(path)
+            if src_w <= edge and src_h <= edge:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file(path)
+            else:
+                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, edge, edge, True)
+        except (GLib.Error, TypeError):
+            return None
+
+        self._save_thumbnail(pixbuf, thumb_path, uri, mtime, size)
+        return pixbuf
+
+    def _save_thumbnail(self, pixbuf, thumb_path: Path, uri: str, mtime: int, size: int):
+        """Write thumbnail atomically with the spec's metadata keys"""
+        try:
+            thumb_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path = thumb_path.with_suffix(f".{os.getpid()}.tmp")
+            pixbuf.savev(
+                str(tmp_path),
+                "png",
+                ["tEXt::Thumb::URI", "tEXt::Thumb::MTime", "tEXt::Thumb::Size", "tEXt::Software"],
+                [uri, str(mtime), str(size), "ignis"],
+            )
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, thumb_path)
+        except (GLib.Error, OSError) as e:
+            print(f"Failed to save thumbnail {thumb_path}: {e}")
+
+
+# Global instance
+_thumbnail_service: Optional[ThumbnailService] = None
+
+
+def get_thumbnail_service() -> ThumbnailService:
+    """Get or create global ThumbnailService instance"""
+    global _thumbnail_service
+
+    if _thumbnail_service is None:
+        from settings import config
+
+        _thumbnail_service = ThumbnailService(config.paths.thumbnail_dir)
+
+    return _thumbnail_service
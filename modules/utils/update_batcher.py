@@ -0,0 +1,82 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+from gi.repository import GLib
+
+# After pending signal emissions, before GTK's layout/redraw (PRIORITY_HIGH_IDLE + 20)
+FLUSH_PRIORITY = GLib.PRIORITY_HIGH_IDLE + 10
+
+
+class UpdateBatcher:
+    """
+    Coalesces widget updates to once per frame.
+
+    Handlers call mark(key, apply) instead of writing widgets directly.
+    Marking the same key again before the flush just replaces the pending
+    callback, so a burst of notify signals (a dragged volume slider, a
+    battery reporting five properties at once) ends in a single apply with
+    the final values, run from one idle callback ahead of the next redraw.
+    """
+
+    def __init__(self, priority: int = FLUSH_PRIORITY):
+        self._priority = priority
+        self._dirty: "OrderedDict[Hashable, Callable[[], None]]" = OrderedDict()
+        self._source_id: Optional[int] = None
+
+    def mark(self, key: Hashable, apply: Callable[[], None]):
+        self._dirty[key] = apply
+        if self._source_id is None:
+            self._source_id = GLib.idle_add(self._flush, priority=self._priority)
+
+    def cancel(self, key: Hashable):
+        self._dirty.pop(key, None)
+
+    def flush(self):
+        """Apply everything pending right now"""
+        if self._source_id is not None:
+            GLib.source_remove(self._source_id)
+        self._flush()
+
+    def _flush(self) -> bool:
+        self._source_id = None
+        dirty, self._dirty = self._dirty, OrderedDict()
+        for apply in dirty.values():
+            try:
+                apply()
+            except Exception as e:
+                print(f"Batched update failed: {e}")
+        return GLib.SOURCE_REMOVE
+
+
+def set_if_changed(widget, prop: str, value: Any):
+    """Write a widget property only when it differs"""
+    if getattr(widget, prop) != value:
+        setattr(widget, prop, value)
+
+
+def set_css_class(widget, name: str, enabled: bool):
+    """Add or remove a CSS class only when its state changes"""
+    if widget.has_css_class(name) != enabled:
+        if enabled:
+            widget.add_css_class(name)
+        else:
+            widget.remove_css_class(name)
+
+
+def set_tooltip_if_changed(widget, text: str):
+    if widget.get_tooltip_text() != text:
+        widget.set_tooltip_text(text)
+
+
+# Global instance
+_batcher: Optional[UpdateBatcher] = None
+
+
+def get_update_batcher() -> UpdateBatcher:
+    """Get or create global UpdateBatcher instance"""
+    global _batcher
+
+    if _batcher is None:
+        _batcher = UpdateBatcher()
+
+    return _batcher
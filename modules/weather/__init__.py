@@ -1,10 +1,24 @@
 from .moon import moon_emoji, moon_icon_for, moon_info, moon_phase_name, moon_tooltip
-from .weather_data import fetch_weather_async
+from .astronomy import DayEphemeris, EphemerisTable, get_ephemeris
+from .forecast_model import DailySummary, ForecastSeries
+from .http_client import AsyncHttpTransport, HttpResponse, WeatherTransport
+from .weather_data import fetch_weather_async, set_transport
+from .weather_repository import WeatherRepository
 from .weather_window import WeatherPopup
 
 __all__ = [
     "WeatherPopup",
+    "WeatherRepository",
     "fetch_weather_async",
+    "ForecastSeries",
+    "EphemerisTable",
+    "DayEphemeris",
+    "get_ephemeris",
+    "DailySummary",
+    "set_transport",
+    "WeatherTransport",
+    "AsyncHttpTransport",
+    "HttpResponse",
     "moon_emoji",
     "moon_icon_for",
     "moon_info",
@@ -0,0 +1,271 @@
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from settings import config
+
+from .moon import (
+    MOON_EMOJIS,
+    PHASE_KEYS,
+    PHASE_NAMES,
+    illumination_for_phase,
+    moon_phase_accurate,
+    phase_index_for_phase,
+)
+
+# Solar zenith angles (degrees) for each event
+ZENITH_SUNRISE = 90.833  # refraction + solar disc
+ZENITH_CIVIL = 96.0
+ZENITH_NAUTICAL = 102.0
+ZENITH_ASTRONOMICAL = 108.0
+
+# Geocentric altitude of the moon's centre at rise/set (parallax, refraction, semi-diameter)
+MOON_H0 = 0.125
+
+DEFAULT_DAYS = 7
+
+_RAD = math.pi / 180
+_EPOCH_J2000 = 2451545.0
+
+
+def _julian_day(ts: float) -> float:
+    return ts / 86400.0 + 2440587.5
+
+
+def _utc_midnight(day: date) -> float:
+    return datetime.combine(day, time(), tzinfo=timezone.utc).timestamp()
+
+
+# ───────────────────────────────────────────────
+# SUN (NOAA solar calculator)
+# ───────────────────────────────────────────────
+
+
+def _solar_params(jd: float) -> Tuple[float, float]:
+    """Solar declination (degrees) and equation of time (minutes) at a Julian day"""
+    t = (jd - _EPOCH_J2000) / 36525.0
+
+    l0 = (280.46646 + t * (36000.76983 + t * 0.0003032)) % 360
+    m = 357.52911 + t * (35999.05029 - 0.0001537 * t)
+    e = 0.016708634 - t * (0.000042037 + 0.0000001267 * t)
+    m_rad = m * _RAD
+
+    center = (
+        math.sin(m_rad) * (1.914602 - t * (0.004817 + 0.000014 * t))
+        + math.sin(2 * m_rad) * (0.019993 - 0.000101 * t)
+        + math.sin(3 * m_rad) * 0.000289
+    )
+    omega = (125.04 - 1934.136 * t) * _RAD
+    apparent_long = (l0 + center - 0.00569 - 0.00478 * math.sin(omega)) * _RAD
+
+    obliquity0 = 23 + (26 + (21.448 - t * (46.815 + t * (0.00059 - t * 0.001813))) / 60) / 60
+    obliquity = (obliquity0 + 0.00256 * math.cos(omega)) * _RAD
+
+    declination = math.asin(math.sin(obliquity) * math.sin(apparent_long))
+
+    y = math.tan(obliquity / 2) ** 2
+    l0_rad = l0 * _RAD
+    eq_time = (
+        4
+        / _RAD
+        * (
+            y * math.sin(2 * l0_rad)
+            - 2 * e * math.sin(m_rad)
+            + 4 * e * y * math.sin(m_rad) * math.cos(2 * l0_rad)
+            - 0.5 * y * y * math.sin(4 * l0_rad)
+            - 1.25 * e * e * math.sin(2 * m_rad)
+        )
+    )
+    return declination / _RAD, eq_time
+
+
+def _hour_angle(lat: float, declination: float, zenith: float) -> Optional[float]:
+    """Hour angle (degrees) of the sun at the given zenith; None if it never gets there"""
+    lat_r, dec_r = lat * _RAD, declination * _RAD
+    cos_h = (math.cos(zenith * _RAD) - math.sin(lat_r) * math.sin(dec_r)) / (math.cos(lat_r) * math.cos(dec_r))
+    if not -1.0 <= cos_h <= 1.0:
+        return None
+    return math.acos(cos_h) / _RAD
+
+
+def sun_events(day: date, lat: float, lon: float) -> Dict[str, Optional[int]]:
+    """
+    Unix timestamps of solar noon, sunrise/sunset and civil, nautical and
+    astronomical dawn/dusk for a calendar day. Events that do not happen
+    (polar day/night) are None.
+    """
+    midnight = _utc_midnight(day)
+
+    # Evaluate the sun at (approximate) solar noon, then refine once
+    noon_min = 720 - 4 * lon
+    declination, eq_time = _solar_params(_julian_day(midnight + noon_min * 60))
+    noon_min = 720 - 4 * lon - eq_time
+    declination, eq_time = _solar_params(_julian_day(midnight + noon_min * 60))
+    noon_min = 720 - 4 * lon - eq_time
+
+    events: Dict[str, Optional[int]] = {"noon": int(midnight + noon_min * 60)}
+    for rise_key, set_key, zenith in (
+        ("sunrise", "sunset", ZENITH_SUNRISE),
+        ("civil_dawn", "civil_dusk", ZENITH_CIVIL),
+        ("nautical_dawn", "nautical_dusk", ZENITH_NAUTICAL),
+        ("astronomical_dawn", "astronomical_dusk", ZENITH_ASTRONOMICAL),
+    ):
+        ha = _hour_angle(lat, declination, zenith)
+        if ha is None:
+            events[rise_key] = events[set_key] = None
+        else:
+            events[rise_key] = int(midnight + (noon_min - 4 * ha) * 60)
+            events[set_key] = int(midnight + (noon_min + 4 * ha) * 60)
+    return events
+
+
+# ───────────────────────────────────────────────
+# MOON (low-precision position, ~0.3°)
+# ───────────────────────────────────────────────
+
+
+def _moon_altitude(ts: float, lat: float, lon: float) -> float:
+    """Geocentric altitude of the moon (degrees)"""
+    d = _julian_day(ts) - _EPOCH_J2000
+
+    mean_long = (218.316 + 13.176396 * d) * _RAD
+    mean_anomaly = (134.963 + 13.064993 * d) * _RAD
+    arg_latitude = (93.272 + 13.229350 * d) * _RAD
+
+    ecl_long = mean_long + 6.289 * _RAD * math.sin(mean_anomaly)
+    ecl_lat = 5.128 * _RAD * math.sin(arg_latitude)
+    obliquity = 23.4397 * _RAD
+
+    ra = math.atan2(
+        math.sin(ecl_long) * math.cos(obliquity) - math.tan(ecl_lat) * math.sin(obliquity),
+        math.cos(ecl_long),
+    )
+    dec = math.asin(
+        math.sin(ecl_lat) * math.cos(obliquity) + math.cos(ecl_lat) * math.sin(obliquity) * math.sin(ecl_long)
+    )
+
+    sidereal = (280.16 + 360.9856235 * d + lon) * _RAD
+    hour_angle = sidereal - ra
+    lat_r = lat * _RAD
+    return math.asin(math.sin(lat_r) * math.sin(dec) + math.cos(lat_r) * math.cos(dec) * math.cos(hour_angle)) / _RAD
+
+
+def moon_events(start: float, lat: float, lon: float, step: int = 3600) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Moonrise and moonset within the 24 hours after `start` (unix time),
+    found by sampling the altitude and interpolating the horizon crossing.
+    """
+    rise = set_ = None
+    prev_ts = start
+    prev_alt = _moon_altitude(start, lat, lon) - MOON_H0
+    for ts in range(int(start) + step, int(start) + 86400 + 1, step):
+        alt = _moon_altitude(ts, lat, lon) - MOON_H0
+        if (prev_alt < 0) != (alt < 0):
+            crossing = int(prev_ts + step * prev_alt / (prev_alt - alt))
+            if alt > prev_alt and rise is None:
+                rise = crossing
+            elif alt < prev_alt and set_ is None:
+                set_ = crossing
+        prev_ts, prev_alt = ts, alt
+    return rise, set_
+
+
+# ───────────────────────────────────────────────
+# DAILY EPHEMERIS TABLE
+# ───────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class DayEphemeris:
+    day: date
+    moon_phase: float  # 0 = new, 0.5 = full (at local noon)
+    moon_illumination: float  # percent
+    moon_phase_name: str
+    moon_emoji: str
+    sunrise: Optional[int] = None
+    sunset: Optional[int] = None
+    solar_noon: Optional[int] = None
+    civil_dawn: Optional[int] = None
+    civil_dusk: Optional[int] = None
+    nautical_dawn: Optional[int] = None
+    nautical_dusk: Optional[int] = None
+    astronomical_dawn: Optional[int] = None
+    astronomical_dusk: Optional[int] = None
+    moonrise: Optional[int] = None
+    moonset: Optional[int] = None
+
+
+def compute_day(day: date, lat: Optional[float] = None, lon: Optional[float] = None) -> DayEphemeris:
+    """Everything for one local calendar day; sun/moon times need coordinates"""
+    local_midnight = datetime.combine(day, time())
+    phase = moon_phase_accurate(local_midnight + timedelta(hours=12))
+    index = phase_index_for_phase(phase)
+    fields = {
+        "day": day,
+        "moon_phase": phase,
+        "moon_illumination": illumination_for_phase(phase),
+        "moon_phase_name": PHASE_NAMES[index],
+        "moon_emoji": MOON_EMOJIS[PHASE_KEYS[index]],
+    }
+
+    if lat is not None and lon is not None:
+        sun = sun_events(day, lat, lon)
+        fields["solar_noon"] = sun.pop("noon")
+        fields.update(sun)
+        fields["moonrise"], fields["moonset"] = moon_events(local_midnight.timestamp(), lat, lon)
+
+    return DayEphemeris(**fields)
+
+
+class EphemerisTable:
+    """
+    Precomputed astronomy for `days` consecutive days, keyed by ordinal date.
+
+    The table is filled once (and again only when asked for a day outside
+    the window), so every lookup afterwards is a dict hit — no network and
+    no per-call math.
+    """
+
+    def __init__(self, lat: Optional[float], lon: Optional[float], days: int = DEFAULT_DAYS):
+        self.lat = lat
+        self.lon = lon
+        self.days = max(1, days)
+        self._table: Dict[int, DayEphemeris] = {}
+
+    @property
+    def has_location(self) -> bool:
+        return self.lat is not None and self.lon is not None
+
+    def _fill(self, first: date):
+        self._table = {
+            (first + timedelta(days=i)).toordinal(): compute_day(first + timedelta(days=i), self.lat, self.lon)
+            for i in range(self.days)
+        }
+
+    def get(self, day: Optional[date] = None) -> DayEphemeris:
+        day = day or date.today()
+        entry = self._table.get(day.toordinal())
+        if entry is None:
+            self._fill(day)
+            entry = self._table[day.toordinal()]
+        return entry
+
+    def today(self) -> DayEphemeris:
+        return self.get(date.today())
+
+    def upcoming(self) -> List[DayEphemeris]:
+        today = date.today()
+        return [self.get(today + timedelta(days=i)) for i in range(self.days)]
+
+
+_table: Optional[EphemerisTable] = None
+
+
+def get_ephemeris() -> EphemerisTable:
+    """Global table built from the configured coordinates"""
+    global _table
+    if _table is None:
+        weather = config.weather
+        _table = EphemerisTable(weather.latitude, weather.longitude, weather.ephemeris_days)
+    return _table
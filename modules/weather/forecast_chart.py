@@ -0,0 +1,94 @@
+from datetime import datetime
+from typing import Optional
+
+from gi.repository import Gtk
+
+from .forecast_model import ForecastSeries
+
+CHART_HOURS = 24  # 8 three-hour steps
+PADDING = 8
+LABEL_HEIGHT = 14
+
+
+class ForecastChart(Gtk.DrawingArea):
+    """
+    Temperature line over precipitation bars for the next CHART_HOURS.
+
+    Draws straight from the ForecastSeries arrays with cairo; nothing is
+    rebuilt between redraws except the path itself.
+    """
+
+    def __init__(self, height: int = 96):
+        super().__init__()
+        self._series: Optional[ForecastSeries] = None
+        self.set_content_height(height)
+        self.set_hexpand(True)
+        self.set_css_classes(["weather-chart"])
+        self.set_draw_func(self._draw)
+
+    def set_series(self, series: Optional[ForecastSeries]):
+        self._series = series
+        self.set_visible(series is not None and len(series) > 1)
+        self.queue_draw()
+
+    def _draw(self, _area, cr, width: int, height: int):
+        series = self._series
+        if series is None or len(series) < 2:
+            return
+
+        count = min(len(series), CHART_HOURS // 3 + 1)
+        temps = series.temp[:count]
+        precip = series.precip[:count]
+
+        color = self.get_color()
+        r, g, b = color.red, color.green, color.blue
+
+        plot_w = width - 2 * PADDING
+        plot_h = height - 2 * PADDING - LABEL_HEIGHT
+        step = plot_w / (count - 1)
+
+        # Precipitation bars, scaled to the wettest slot (at least 5 mm)
+        p_max = max(max(precip), 5.0)
+        cr.set_source_rgba(r, g, b, 0.25)
+        bar_w = step * 0.5
+        for i, p in enumerate(precip):
+            if p <= 0:
+                continue
+            bar_h = plot_h * p / p_max
+            x = PADDING + i * step - bar_w / 2
+            cr.rectangle(x, PADDING + plot_h - bar_h, bar_w, bar_h)
+        cr.fill()
+
+        # Temperature line with per-point labels
+        t_min, t_max = min(temps), max(temps)
+        t_span = (t_max - t_min) or 1.0
+
+        def y_for(t: float) -> float:
+            return PADDING + plot_h - (t - t_min) / t_span * plot_h * 0.8 - plot_h * 0.1
+
+        cr.set_source_rgba(r, g, b, 0.9)
+        cr.set_line_width(2)
+        cr.move_to(PADDING, y_for(temps[0]))
+        for i in range(1, count):
+            cr.line_to(PADDING + i * step, y_for(temps[i]))
+        cr.stroke()
+
+        cr.set_font_size(10)
+        for i in range(count):
+            x = PADDING + i * step
+            y = y_for(temps[i])
+            cr.arc(x, y, 2.5, 0, 6.2832)
+            cr.fill()
+
+            text = f"{round(temps[i])}°"
+            extents = cr.text_extents(text)
+            cr.move_to(min(max(x - extents.width / 2, 0), width - extents.width), y - 6)
+            cr.show_text(text)
+
+            if i % 2 == 0:
+                hour = datetime.fromtimestamp(series.timestamps[i]).strftime("%H")
+                extents = cr.text_extents(hour)
+                cr.set_source_rgba(r, g, b, 0.6)
+                cr.move_to(min(max(x - extents.width / 2, 0), width - extents.width), height - PADDING / 2)
+                cr.show_text(hour)
+                cr.set_source_rgba(r, g, b, 0.9)
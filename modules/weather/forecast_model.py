@@ -0,0 +1,153 @@
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+DAY = 86400
+
+
+@dataclass(frozen=True)
+class DailySummary:
+    day_start: int  # local midnight as unix time
+    temp_min: float
+    temp_max: float
+    precip: float  # mm, summed over the day
+    icon_code: str  # entry closest to local noon
+
+
+class ForecastSeries:
+    """
+    Columnar 5-day / 3-hour forecast.
+
+    Each field is one array (timestamps, temperature, precipitation, wind),
+    so the whole forecast is a handful of compact buffers rather than 40
+    dicts. Daily aggregation runs over contiguous day runs, vectorized with
+    NumPy when it is installed.
+    """
+
+    __slots__ = ("timestamps", "temp", "precip", "wind", "icon_codes", "_utc_offsets")
+
+    def __init__(
+        self,
+        timestamps: Sequence[int],
+        temp: Sequence[float],
+        precip: Sequence[float],
+        wind: Sequence[float],
+        icon_codes: Sequence[str],
+    ):
+        self.timestamps = array("q", timestamps)
+        self.temp = array("f", temp)
+        self.precip = array("f", precip)
+        self.wind = array("f", wind)
+        self.icon_codes = list(icon_codes)
+        self._utc_offsets: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_api(cls, fc_json: Dict[str, Any]) -> "ForecastSeries":
+        """Parse the OpenWeather /forecast response in one pass"""
+        timestamps, temp, precip, wind, icons = [], [], [], [], []
+        for entry in fc_json["list"]:
+            timestamps.append(entry["dt"])
+            temp.append(entry["main"]["temp"])
+            precip.append(entry.get("rain", {}).get("3h", 0.0) + entry.get("snow", {}).get("3h", 0.0))
+            wind.append(entry.get("wind", {}).get("speed", 0.0))
+            icons.append(entry["weather"][0]["icon"])
+        return cls(timestamps, temp, precip, wind, icons)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, List]) -> "ForecastSeries":
+        return cls(data["dt"], data["temp"], data["precip"], data["wind"], data["icon"])
+
+    def to_dict(self) -> Dict[str, List]:
+        """JSON-friendly columns for the disk cache"""
+        return {
+            "dt": self.timestamps.tolist(),
+            "temp": [round(t, 1) for t in self.temp],
+            "precip": [round(p, 2) for p in self.precip],
+            "wind": [round(w, 1) for w in self.wind],
+            "icon": self.icon_codes,
+        }
+
+    def local_times(self) -> array:
+        """Timestamps shifted to local wall-clock seconds"""
+        if self._utc_offsets is None:
+            if not self.timestamps:
+                self._utc_offsets = array("q")
+            else:
+                first = time.localtime(self.timestamps[0]).tm_gmtoff
+                last = time.localtime(self.timestamps[-1]).tm_gmtoff
+                if first == last:
+                    self._utc_offsets = array("q", [first]) * len(self.timestamps)
+                else:
+                    # DST change inside the window
+                    self._utc_offsets = array("q", (time.localtime(ts).tm_gmtoff for ts in self.timestamps))
+        return array("q", map(int.__add__, self.timestamps, self._utc_offsets))
+
+    def daily(self) -> List[DailySummary]:
+        """Per local day: min/max temperature, precipitation total, noon icon"""
+        if not self.timestamps:
+            return []
+
+        local = self.local_times()
+        if HAS_NUMPY:
+            return self._daily_numpy(local)
+
+        summaries = []
+        start = 0
+        n = len(local)
+        while start < n:
+            day = local[start] // DAY
+            end = start + 1
+            while end < n and local[end] // DAY == day:
+                end += 1
+            noon = min(range(start, end), key=lambda i: abs(local[i] % DAY - DAY // 2))
+            summaries.append(
+                DailySummary(
+                    day_start=self.timestamps[start] - local[start] % DAY,
+                    temp_min=min(self.temp[start:end]),
+                    temp_max=max(self.temp[start:end]),
+                    precip=sum(self.precip[start:end]),
+                    icon_code=self.icon_codes[noon],
+                )
+            )
+            start = end
+        return summaries
+
+    def _daily_numpy(self, local: array) -> List[DailySummary]:
+        local_np = np.frombuffer(local, dtype=np.int64)
+        temp = np.frombuffer(self.temp, dtype=np.float32)
+        precip = np.frombuffer(self.precip, dtype=np.float32)
+
+        days = local_np // DAY
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(days)) + 1))
+        ends = np.append(starts[1:], len(days))
+
+        mins = np.minimum.reduceat(temp, starts)
+        maxs = np.maximum.reduceat(temp, starts)
+        totals = np.add.reduceat(precip, starts)
+        noon_dist = np.abs(local_np % DAY - DAY // 2)
+
+        summaries = []
+        for i, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+            noon = start + int(np.argmin(noon_dist[start:end]))
+            summaries.append(
+                DailySummary(
+                    day_start=self.timestamps[start] - local[start] % DAY,
+                    temp_min=float(mins[i]),
+                    temp_max=float(maxs[i]),
+                    precip=float(totals[i]),
+                    icon_code=self.icon_codes[noon],
+                )
+            )
+        return summaries
@@ -0,0 +1,242 @@
+import asyncio
+import gzip
+import json
+import ssl
+import time
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+USER_AGENT = "ignis-weather/1.0"
+
+
+class HttpError(Exception):
+    """Transport-level failure (connection, timeout, malformed response)"""
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class WeatherTransport(ABC):
+    """Interface the weather module uses to talk HTTP; swap it out for tests"""
+
+    @abstractmethod
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> HttpResponse:
+        """GET url with params appended to the query; raises HttpError on transport failure"""
+
+    async def close(self):
+        pass
+
+
+_Key = Tuple[str, str, int]
+
+
+class _Connection:
+    __slots__ = ("reader", "writer", "last_used")
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+
+    def usable(self, idle_timeout: float) -> bool:
+        return (
+            not self.writer.is_closing()
+            and not self.reader.at_eof()
+            and time.monotonic() - self.last_used < idle_timeout
+        )
+
+    def close(self):
+        try:
+            self.writer.close()
+        except Exception:
+            pass
+
+
+def _inflate(body: bytes) -> bytes:
+    """Content-Encoding: deflate is meant to be zlib-wrapped, but some servers send raw deflate"""
+    try:
+        return zlib.decompress(body)
+    except zlib.error:
+        inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+        return inflater.decompress(body) + inflater.flush()
+
+
+class AsyncHttpTransport(WeatherTransport):
+    """
+    Small HTTP/1.1 client on asyncio streams.
+
+    Keeps idle connections per host for reuse (one TLS handshake per
+    connection instead of per request), applies a per-request timeout and
+    accepts gzip/deflate bodies.
+    """
+
+    def __init__(self, timeout: float = 10.0, idle_timeout: float = 60.0, max_idle: int = 4):
+        self._timeout = timeout
+        self._idle_timeout = idle_timeout
+        self._max_idle = max_idle
+        self._idle: Dict[_Key, List[_Connection]] = {}
+        self._ssl: Optional[ssl.SSLContext] = None
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> HttpResponse:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise HttpError(f"unsupported URL: {url}")
+
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        target = parts.path or "/"
+        query = "&".join(q for q in (parts.query, urlencode(params or {})) if q)
+        if query:
+            target = f"{target}?{query}"
+
+        try:
+            return await asyncio.wait_for(self._request(key, target, headers or {}), self._timeout)
+        except asyncio.TimeoutError as e:
+            raise HttpError(f"timed out after {self._timeout}s") from e
+        except (OSError, asyncio.IncompleteReadError, ValueError, zlib.error) as e:
+            raise HttpError(str(e)) from e
+
+    async def close(self):
+        for conns in self._idle.values():
+            for conn in conns:
+                conn.close()
+        self._idle.clear()
+
+    async def _request(self, key: _Key, target: str, headers: Dict[str, str]) -> HttpResponse:
+        conn = self._take_idle(key)
+
+        if conn is not None:
+            try:
+                return await self._exchange(key, conn, target, headers)
+            except (OSError, asyncio.IncompleteReadError):
+                # Server dropped the kept-alive connection; retry on a fresh one
+                conn.close()
+
+        conn = await self._open(key)
+        return await self._exchange(key, conn, target, headers)
+
+    def _take_idle(self, key: _Key) -> Optional[_Connection]:
+        conns = self._idle.get(key)
+        while conns:
+            conn = conns.pop()
+            if conn.usable(self._idle_timeout):
+                return conn
+            conn.close()
+        return None
+
+    def _put_idle(self, key: _Key, conn: _Connection):
+        conns = self._idle.setdefault(key, [])
+        if len(conns) >= self._max_idle:
+            conn.close()
+            return
+        conn.last_used = time.monotonic()
+        conns.append(conn)
+
+    async def _open(self, key: _Key) -> _Connection:
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl is None:
+                self._ssl = ssl.create_default_context()
+            reader, writer = await asyncio.open_connection(host, port, ssl=self._ssl, server_hostname=host)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return _Connection(reader, writer)
+
+    async def _exchange(self, key: _Key, conn: _Connection, target: str, headers: Dict[str, str]) -> HttpResponse:
+        _, host, port = key
+        request_headers = {
+            "Host": host if port in (80, 443) else f"{host}:{port}",
+            "User-Agent": USER_AGENT,
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+            **headers,
+        }
+        head = f"GET {target} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in request_headers.items())
+
+        # Any failure part-way (timeout, cancellation, malformed response)
+        # leaves the stream in an unknown state: never reuse or leak it
+        try:
+            conn.writer.write(head.encode("latin-1") + b"\r\n")
+            await conn.writer.drain()
+            status_code, response_headers, body, reusable = await self._read_response(conn.reader)
+        except BaseException:
+            conn.close()
+            raise
+
+        if reusable:
+            self._put_idle(key, conn)
+        else:
+            conn.close()
+
+        encoding = response_headers.get("content-encoding", "").lower()
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "deflate":
+            body = _inflate(body)
+
+        return HttpResponse(status=status_code, headers=response_headers, body=body)
+
+    async def _read_response(self, reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], bytes, bool]:
+        """Status, headers, raw body and whether the connection can be kept"""
+        status_line = await reader.readline()
+        if not status_line:
+            raise asyncio.IncompleteReadError(b"", None)
+        version, status, _reason = (status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""])[:3]
+
+        response_headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n"):
+                break
+            if not line:
+                raise asyncio.IncompleteReadError(b"", None)
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        reusable = version == "HTTP/1.1" and response_headers.get("connection", "").lower() != "close"
+        status_code = int(status)
+
+        if status_code in (204, 304) or 100 <= status_code < 200:
+            body = b""
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            body = await self._read_chunked(reader)
+        elif "content-length" in response_headers:
+            body = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            body = await reader.read()
+            reusable = False
+
+        return status_code, response_headers, body, reusable
+
+    async def _read_chunked(self, reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # Skip trailers up to the blank line
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
@@ -13,6 +13,32 @@ MOON_EMOJIS = {
 }
 
 
+SYNODIC_MONTH = 29.53058867
+KNOWN_NEW_MOON = datetime(2000, 1, 6, 18, 14)
+
+PHASE_KEYS = [
+    "new",
+    "waxing_crescent",
+    "first_quarter",
+    "waxing_gibbous",
+    "full",
+    "waning_gibbous",
+    "last_quarter",
+    "waning_crescent",
+]
+
+PHASE_NAMES = [
+    "New Moon",
+    "Waxing Crescent",
+    "First Quarter",
+    "Waxing Gibbous",
+    "Full Moon",
+    "Waning Gibbous",
+    "Last Quarter",
+    "Waning Crescent",
+]
+
+
 def moon_phase_accurate(date: datetime) -> float:
     """
     Calculate moon phase (0.0 = New, 0.5 = Full, 1.0 = New)
@@ -20,12 +46,30 @@ def moon_phase_accurate(date: datetime) -> float:
 
     Returns fraction of lunar cycle (0.0 to 1.0)
     """
-    known_new_moon = datetime(2000, 1, 6, 18, 14)
-    synodic_month = 29.53058867
-    days_diff = (date - known_new_moon).total_seconds() / 86400.0
-    phase = (days_diff % synodic_month) / synodic_month
+    days_diff = (date - KNOWN_NEW_MOON).total_seconds() / 86400.0
+    return (days_diff % SYNODIC_MONTH) / SYNODIC_MONTH
+
+
+# The helpers below take an already computed phase so callers that need
+# several values (moon_info, the ephemeris table) compute it only once.
+
+
+def illumination_for_phase(phase: float) -> float:
+    return (1 - math.cos(phase * 2 * math.pi)) / 2 * 100
+
+
+def phase_index_for_phase(phase: float) -> int:
+    return int((phase + 0.0625) * 8) % 8
+
+
+def days_to_full_for_phase(phase: float) -> float:
+    if phase < 0.5:
+        return (0.5 - phase) * SYNODIC_MONTH
+    return (1.0 - phase + 0.5) * SYNODIC_MONTH
+
 
-    return phase
+def days_to_new_for_phase(phase: float) -> float:
+    return (1.0 - phase) * SYNODIC_MONTH
 
 
 def moon_illumination(date: datetime) -> float:
@@ -33,10 +77,7 @@ def moon_illumination(date: datetime) -> float:
     Calculate moon illumination percentage (0.0 to 100.0)
     0% = New Moon, 100% = Full Moon
     """
-    phase = moon_phase_accurate(date)
-    illumination = (1 - math.cos(phase * 2 * math.pi)) / 2 * 100
-
-    return illumination
+    return illumination_for_phase(moon_phase_accurate(date))
 
 
 def days_until_full_moon(date: datetime) -> float:
@@ -44,15 +85,7 @@ def days_until_full_moon(date: datetime) -> float:
     Calculate days until next full moon
     Returns decimal days
     """
-    phase = moon_phase_accurate(date)
-    synodic_month = 29.53058867
-
-    if phase < 0.5:
-        days_until = (0.5 - phase) * synodic_month
-    else:
-        days_until = (1.0 - phase + 0.5) * synodic_month
-
-    return days_until
+    return days_to_full_for_phase(moon_phase_accurate(date))
 
 
 def days_until_new_moon(date: datetime) -> float:
@@ -60,11 +93,7 @@ def days_until_new_moon(date: datetime) -> float:
     Calculate days until next new moon
     Returns decimal days
     """
-    phase = moon_phase_accurate(date)
-    synodic_month = 29.53058867
-    days_until = (1.0 - phase) * synodic_month
-
-    return days_until
+    return days_to_new_for_phase(moon_phase_accurate(date))
 
 
 def moon_phase_index(date: datetime) -> int:
@@ -80,25 +109,12 @@ def moon_phase_index(date: datetime) -> int:
     6 = Last Quarter
     7 = Waning Crescent
     """
-    phase = moon_phase_accurate(date)
-    index = int((phase + 0.0625) * 8) % 8
-
-    return index
+    return phase_index_for_phase(moon_phase_accurate(date))
 
 
 def moon_phase_name(date: datetime) -> str:
     """Get the name of the current moon phase"""
-    phase_names = [
-        "New Moon",
-        "Waxing Crescent",
-        "First Quarter",
-        "Waxing Gibbous",
-        "Full Moon",
-        "Waning Gibbous",
-        "Last Quarter",
-        "Waning Crescent",
-    ]
-    return phase_names[moon_phase_index(date)]
+    return PHASE_NAMES[moon_phase_index(date)]
 
 
 def moon_emoji(date: datetime) -> str:
@@ -106,21 +122,7 @@ def moon_emoji(date: datetime) -> str:
     Get moon phase emoji for given date
     Returns Unicode emoji character
     """
-    phase_map = [
-        "new",
-        "waxing_crescent",
-        "first_quarter",
-        "waxing_gibbous",
-        "full",
-        "waning_gibbous",
-        "last_quarter",
-        "waning_crescent",
-    ]
-
-    index = moon_phase_index(date)
-    phase_key = phase_map[index]
-
-    return MOON_EMOJIS[phase_key]
+    return MOON_EMOJIS[PHASE_KEYS[moon_phase_index(date)]]
 
 
 def moon_info(date: datetime) -> dict:
@@ -134,12 +136,14 @@ def moon_info(date: datetime) -> dict:
     - days_to_full: float
     - days_to_new: float
     """
+    phase = moon_phase_accurate(date)
+    index = phase_index_for_phase(phase)
     return {
-        "phase_name": moon_phase_name(date),
-        "emoji": moon_emoji(date),
-        "illumination": moon_illumination(date),
-        "days_to_full": days_until_full_moon(date),
-        "days_to_new": days_until_new_moon(date),
+        "phase_name": PHASE_NAMES[index],
+        "emoji": MOON_EMOJIS[PHASE_KEYS[index]],
+        "illumination": illumination_for_phase(phase),
+        "days_to_full": days_to_full_for_phase(phase),
+        "days_to_new": days_to_new_for_phase(phase),
     }
 
 
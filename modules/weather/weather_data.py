@@ -1,13 +1,12 @@
 import asyncio
 import json
-import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from ignis import utils
 from settings import config
 
-from .moon import moon_icon_for, moon_tooltip
+from .forecast_model import ForecastSeries
+from .http_client import AsyncHttpTransport, HttpError, WeatherTransport
 
 CACHE_FILE = config.paths.weather_cache
 CACHE_TTL = config.weather.cache_ttl
@@ -15,6 +14,19 @@ USE_12H = config.weather.use_12h_format
 ICON_BASE = config.weather.icon_base_path
 API_KEY = config.weather.api_key
 CITY_ID = config.weather.city_id
+CITY_IDS = config.weather.locations
+API_BASE = config.weather.api_base_url
+
+_transport: WeatherTransport = AsyncHttpTransport()
+
+# (endpoint, ids) -> (etag, last_modified, json) for conditional requests
+_validators: Dict[Tuple[str, str], Tuple[Optional[str], Optional[str], dict]] = {}
+
+
+def set_transport(transport: WeatherTransport):
+    """Replace the HTTP transport (e.g. with a stub for tests)"""
+    global _transport
+    _transport = transport
 
 
 def icon_path(name: str) -> str:
@@ -28,16 +40,46 @@ def format_time_hm(dt: datetime) -> str:
     return dt.strftime("%H:%M")
 
 
-def _load_cache() -> Optional[Dict[str, Any]]:
+def format_timestamp(ts: Optional[int]) -> str:
+    """HH:MM for a unix time, or a dash when the event does not happen"""
+    if ts is None:
+        return "—"
+    return format_time_hm(datetime.fromtimestamp(ts))
+
+
+def format_updated(updated_at: Optional[int]) -> str:
+    """'Updated HH:MM' with a hint when the data is well past its TTL"""
+    if not updated_at:
+        return "Not updated yet"
+    label = f"Updated {format_time_hm(datetime.fromtimestamp(updated_at))}"
+    if is_stale(updated_at):
+        label += " (stale)"
+    return label
+
+
+def is_stale(updated_at: Optional[int]) -> bool:
+    return not updated_at or datetime.now().timestamp() - updated_at > 2 * CACHE_TTL
+
+
+def load_cache() -> Dict[str, Dict[str, Any]]:
+    """Per-city cache: {city_id: {"timestamp": int, "data": dict}}"""
     try:
         if not CACHE_FILE.exists():
-            return None
-        return json.loads(CACHE_FILE.read_text())
+            return {}
+        cached = json.loads(CACHE_FILE.read_text())
     except:
-        return None
+        return {}
+
+    if "cities" in cached:
+        return cached["cities"]
+    # Single-city cache from older versions
+    if "data" in cached:
+        return {CITY_ID: cached}
+    return {}
 
 
-def _save_cache(data: Dict[str, Any]):
+def save_cache(cities: Dict[str, Dict[str, Any]]):
+    data = {"cities": cities}
     try:
         CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
         CACHE_FILE.write_text(json.dumps(data))
@@ -45,22 +87,31 @@ def _save_cache(data: Dict[str, Any]):
         pass
 
 
-def _build_url(endpoint: str) -> Optional[str]:
-    if not API_KEY:
-        return None
-    base = "https://api.openweathermap.org/data/2.5"
-    return f"{base}/{endpoint}?id={CITY_ID}&units=metric&appid={API_KEY}"
-
+async def _get_json_async(endpoint: str, ids: str) -> Optional[dict]:
+    """GET an API endpoint, revalidating with ETag/Last-Modified when the server sent them"""
+    params = {"id": ids, "units": "metric", "appid": API_KEY}
+    headers = {}
+    key = (endpoint, ids)
+    etag, last_modified, previous = _validators.get(key, (None, None, None))
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
 
-async def _curl_json_async(url: str) -> Optional[dict]:
     try:
-        res = await utils.exec_sh_async(f"curl -sfL '{url}'")
-        if res.returncode != 0:
+        res = await _transport.get(f"{API_BASE}/{endpoint}", params=params, headers=headers)
+        if res.status == 304 and previous is not None:
+            return previous
+        if res.status != 200:
             return None
-        return json.loads(res.stdout)
-    except:
+        body = res.json()
+    except (HttpError, ValueError):
         return None
 
+    if "etag" in res.headers or "last-modified" in res.headers:
+        _validators[key] = (res.headers.get("etag"), res.headers.get("last-modified"), body)
+    return body
+
 
 def _map_icon(code: str) -> str:
     """Map OpenWeather code → your custom SVG icons."""
@@ -91,26 +142,54 @@ def _map_icon(code: str) -> str:
 
 
 async def fetch_weather_async() -> Optional[Dict[str, Any]]:
-    cached = _load_cache()
-    now = int(time.time())
+    """Current weather for the primary location via the shared repository"""
+    from .weather_repository import WeatherRepository
 
-    if cached and now - cached.get("timestamp", 0) < CACHE_TTL:
-        return cached["data"]
+    return await WeatherRepository.get_default().get()
 
-    url_now = _build_url("weather")
-    url_fc = _build_url("forecast")
 
-    if not url_now or not url_fc:
-        return cached["data"] if cached else None
+async def fetch_remote_async(city_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch and parse fresh data for several cities.
 
-    now_json, fc_json = await asyncio.gather(
-        _curl_json_async(url_now),
-        _curl_json_async(url_fc),
+    Current conditions for all cities come from one "group" request; the
+    forecast endpoint has no batch form, so those run concurrently over the
+    transport's kept-alive connections. Cities that fail are left out.
+    """
+    if not API_KEY or not city_ids:
+        return {}
+
+    if len(city_ids) == 1:
+        current_req = _get_json_async("weather", city_ids[0])
+    else:
+        current_req = _get_json_async("group", ",".join(city_ids))
+
+    current_json, *forecasts = await asyncio.gather(
+        current_req,
+        *(_get_json_async("forecast", city_id) for city_id in city_ids),
     )
 
-    if not now_json or not fc_json:
-        return cached["data"] if cached else None
+    if not current_json:
+        return {}
+
+    if len(city_ids) == 1:
+        current_by_id = {city_ids[0]: current_json}
+    else:
+        current_by_id = {str(entry.get("id")): entry for entry in current_json.get("list", [])}
+
+    results = {}
+    for city_id, fc_json in zip(city_ids, forecasts):
+        now_json = current_by_id.get(city_id)
+        if not now_json or not fc_json:
+            continue
+        data = _parse_city(now_json, fc_json)
+        if data is not None:
+            results[city_id] = data
+    return results
 
+
+def _parse_city(now_json: dict, fc_json: dict) -> Optional[Dict[str, Any]]:
+    """Build the widget payload for one city"""
     try:
         main = now_json["main"]
         weather0 = now_json["weather"][0]
@@ -126,20 +205,15 @@ async def fetch_weather_async() -> Optional[Dict[str, Any]]:
         desc = weather0["description"].title()
         icon_code = weather0["icon"]
 
-        forecast_list = fc_json["list"][:4]
-        forecast = []
-        for entry in forecast_list:
-            dt = datetime.fromtimestamp(entry["dt"])
-            w0 = entry["weather"][0]
-            forecast.append(
-                {
-                    "time": format_time_hm(dt),
-                    "temp": round(entry["main"]["temp"]),
-                    "icon": _map_icon(w0["icon"]),
-                }
-            )
-
-        current_date = datetime.now()
+        series = ForecastSeries.from_api(fc_json)
+        forecast = [
+            {
+                "time": format_time_hm(datetime.fromtimestamp(series.timestamps[i])),
+                "temp": round(series.temp[i]),
+                "icon": _map_icon(series.icon_codes[i]),
+            }
+            for i in range(min(4, len(series)))
+        ]
 
         data = {
             "city": now_json["name"],
@@ -153,39 +227,28 @@ async def fetch_weather_async() -> Optional[Dict[str, Any]]:
             "icon": _map_icon(icon_code),
             "icon_code": icon_code,
             "forecast": forecast,
-            "moon_icon": moon_icon_for(current_date),
-            "moon_tooltip": moon_tooltip(current_date),
+            "hourly": series.to_dict(),
         }
 
-        daily_map = {}
-        for entry in fc_json["list"]:
-            dt = datetime.fromtimestamp(entry["dt"])
-            date_key = dt.date()
-            daily_map.setdefault(date_key, []).append(entry)
-
-        weekly = []
         today = datetime.now().date()
-
-        for date_key, items in daily_map.items():
-            if date_key == today:
+        weekly = []
+        for day in series.daily():
+            date = datetime.fromtimestamp(day.day_start).date()
+            if date == today:
                 continue
-
-            best = min(items, key=lambda e: abs(datetime.fromtimestamp(e["dt"]).hour - 12))
-            w0 = best["weather"][0]
-
             weekly.append(
                 {
-                    "day": date_key.strftime("%a"),
-                    "temp": round(best["main"]["temp"]),
-                    "icon": _map_icon(w0["icon"]),
+                    "day": date.strftime("%a"),
+                    "temp": round(day.temp_max),
+                    "temp_min": round(day.temp_min),
+                    "precip": round(day.precip, 1),
+                    "icon": _map_icon(day.icon_code),
                 }
             )
 
-        weekly = weekly[:5]
-        data["weekly"] = weekly
+        data["weekly"] = weekly[:5]
 
-        _save_cache({"timestamp": int(time.time()), "data": data})
         return data
 
     except:
-        return cached["data"] if cached else None
+        return None
@@ -0,0 +1,169 @@
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from gi.repository import GObject
+from ignis import utils
+
+from .weather_data import CACHE_TTL, CITY_IDS, fetch_remote_async, load_cache, save_cache
+from .weather_scheduler import WeatherScheduler
+
+BACKOFF_BASE = 30  # seconds
+BACKOFF_MAX = 3600
+
+
+class WeatherRepository(GObject.Object):
+    """
+    Single source of weather data for every widget.
+
+    Holds an in-memory copy of the disk cache (read once), deduplicates
+    concurrent fetches into one in-flight request and emits "data-changed"
+    when new data arrives, so consumers subscribe instead of polling.
+
+    Stale data is served immediately while a background revalidation runs;
+    failed fetches back off exponentially (with jitter) before retrying.
+    Every payload carries "updated_at" so the UI can show staleness.
+
+    Data is kept per configured location; all stale locations are refreshed
+    together in one batch and "data-changed" carries {city_id: data} for the
+    cities that changed. Reading any city only touches memory.
+    """
+
+    __gsignals__ = {
+        "data-changed": (GObject.SignalFlags.RUN_FIRST, None, (object,)),
+    }
+
+    _instance: Optional["WeatherRepository"] = None
+
+    def __init__(self, city_ids: Optional[List[str]] = None):
+        super().__init__()
+        self.city_ids: List[str] = list(city_ids or CITY_IDS)
+        cached = load_cache()
+        self._cities: Dict[str, Dict[str, Any]] = {}
+        self._timestamps: Dict[str, int] = {}
+        for city_id in self.city_ids:
+            entry = cached.get(city_id)
+            if entry and entry.get("data"):
+                self._cities[city_id] = entry["data"]
+                self._timestamps[city_id] = entry.get("timestamp", 0)
+                entry["data"].setdefault("updated_at", self._timestamps[city_id])
+        self._inflight: Optional[asyncio.Task] = None
+        self._scheduler: Optional[WeatherScheduler] = None
+        # Maintained by the scheduler from NetworkService connectivity
+        self.online = True
+        self._failures = 0
+        self._retry_at = 0.0
+        self._retry_timeout = None
+
+    @classmethod
+    def get_default(cls) -> "WeatherRepository":
+        if cls._instance is None:
+            cls._instance = cls()
+            cls._instance._start_scheduler()
+        return cls._instance
+
+    @property
+    def primary_city(self) -> str:
+        return self.city_ids[0]
+
+    @property
+    def data(self) -> Optional[Dict[str, Any]]:
+        """Last known data for the primary location, without touching disk or network"""
+        return self._cities.get(self.primary_city)
+
+    def get_city(self, city_id: str) -> Optional[Dict[str, Any]]:
+        """Last known data for any configured location (memory only)"""
+        return self._cities.get(city_id)
+
+    def _stale_cities(self) -> List[str]:
+        now = int(time.time())
+        return [c for c in self.city_ids if c not in self._cities or now - self._timestamps.get(c, 0) >= CACHE_TTL]
+
+    @property
+    def is_fresh(self) -> bool:
+        return not self._stale_cities()
+
+    @property
+    def backing_off(self) -> bool:
+        return time.monotonic() < self._retry_at
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """
+        Stale-while-revalidate: return whatever is in memory right away and
+        refresh in the background if it is stale. Only waits for the network
+        when there is no data at all.
+        """
+        if self.data is None and self.online:
+            await self.refresh()
+            return self.data
+
+        self.request_update()
+        return self.data
+
+    async def refresh(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Fetch stale locations now; concurrent callers share the same request"""
+        if self.backing_off and not force:
+            return self._cities
+
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._fetch())
+            self._inflight.add_done_callback(self._on_fetch_done)
+        return await asyncio.shield(self._inflight)
+
+    def request_update(self):
+        """Revalidate in the background if stale; results arrive via data-changed"""
+        if not self.online or self.is_fresh or self._inflight is not None or self.backing_off:
+            return
+        asyncio.create_task(self.refresh())
+
+    def reset_backoff(self):
+        self._failures = 0
+        self._retry_at = 0.0
+        if self._retry_timeout:
+            self._retry_timeout.cancel()
+            self._retry_timeout = None
+
+    def _on_fetch_done(self, _task):
+        self._inflight = None
+
+    async def _fetch(self) -> Dict[str, Dict[str, Any]]:
+        stale = self._stale_cities() or self.city_ids
+        results = await fetch_remote_async(stale)
+        if not results:
+            self._schedule_retry()
+            return self._cities
+
+        self._failures = 0
+        self._retry_at = 0.0
+        now = int(time.time())
+        for city_id, data in results.items():
+            data["updated_at"] = now
+            self._cities[city_id] = data
+            self._timestamps[city_id] = now
+
+        save_cache({c: {"timestamp": self._timestamps[c], "data": d} for c, d in self._cities.items()})
+        self.emit("data-changed", results)
+        return self._cities
+
+    def _schedule_retry(self):
+        """Exponential backoff with jitter after a failed fetch"""
+        self._failures += 1
+        delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self._failures - 1))
+        delay = random.uniform(delay / 2, delay)
+        self._retry_at = time.monotonic() + delay
+
+        if self._retry_timeout:
+            self._retry_timeout.cancel()
+        self._retry_timeout = utils.Timeout(int(delay * 1000) + 1, self.request_update)
+
+    def _start_scheduler(self):
+        if self._scheduler is None:
+            self._scheduler = WeatherScheduler(self)
+
+    def stop(self):
+        self.reset_backoff()
+
+        if self._scheduler:
+            self._scheduler.destroy()
+            self._scheduler = None
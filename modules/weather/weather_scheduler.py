@@ -0,0 +1,72 @@
+from ignis import utils
+from ignis.services.network import NetworkService
+from modules.utils.signal_manager import SignalManager
+
+from .weather_data import CACHE_TTL
+
+net = NetworkService.get_default()
+wifi = net.wifi
+ethernet = net.ethernet
+vpn = net.vpn
+
+
+def is_online() -> bool:
+    return wifi.is_connected or ethernet.is_connected or vpn.is_connected
+
+
+class WeatherScheduler:
+    """
+    Drives periodic weather refreshes for a repository.
+
+    The refresh poll only runs while some connection is up: going offline
+    stops it (no doomed requests), reconnecting restarts it, which does one
+    immediate refresh if the data went stale in the meantime.
+    """
+
+    def __init__(self, repository):
+        self._repository = repository
+        self._signals = SignalManager()
+        self._poll = None
+        self._online = is_online()
+
+        for obj in (wifi, ethernet, vpn):
+            self._signals.connect(obj, "notify::is-connected", self._on_connectivity_changed)
+
+        repository.online = self._online
+        if self._online:
+            self._start()
+
+    @property
+    def online(self) -> bool:
+        return self._online
+
+    def _on_connectivity_changed(self, *_):
+        online = is_online()
+        if online == self._online:
+            return
+
+        self._online = online
+        self._repository.online = online
+
+        if online:
+            # Failures while offline say nothing about the API; retry right away
+            self._repository.reset_backoff()
+            self._start()
+        else:
+            self._stop()
+
+    def _start(self):
+        if self._poll is None:
+            self._poll = utils.Poll(CACHE_TTL * 1000, lambda *_: self._repository.request_update())
+
+    def _stop(self):
+        if self._poll:
+            try:
+                self._poll.cancel()
+            except Exception:
+                pass
+            self._poll = None
+
+    def destroy(self):
+        self._stop()
+        self._signals.disconnect_all()
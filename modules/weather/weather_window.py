@@ -1,46 +1,114 @@
-import asyncio
-from datetime import datetime
-from typing import List, Optional
+import json
+from typing import Optional
 
 from ignis import utils, widgets
 from ignis.window_manager import WindowManager
+from modules.utils.icon_cache import set_icon_texture
+from modules.utils.signal_manager import SignalManager
 from settings import config
 
-from .weather_data import fetch_weather_async, format_time_hm, icon_path
+from .astronomy import DayEphemeris, get_ephemeris
+from .forecast_chart import ForecastChart
+from .forecast_model import ForecastSeries
+from .weather_data import format_timestamp, format_updated, icon_path, is_stale
+from .weather_repository import WeatherRepository
 
 wm = WindowManager.get_default()
-CACHE_TTL = config.weather.cache_ttl
+
+HOURLY_SLOTS = 4
+WEEKLY_SLOTS = 5
+
+
+def _payload_hash(data: dict) -> int:
+    """Hash of everything except the fetch time, to skip no-op updates"""
+    return hash(json.dumps({k: v for k, v in data.items() if k != "updated_at"}, sort_keys=True, default=str))
+
+
+def _moon_tooltip(day: DayEphemeris) -> str:
+    tooltip = f"{day.moon_phase_name} {day.moon_emoji}\nIllumination: {day.moon_illumination:.1f}%"
+    if day.moonrise or day.moonset:
+        tooltip += f"\nMoonrise {format_timestamp(day.moonrise)}  •  Moonset {format_timestamp(day.moonset)}"
+    return tooltip
+
+
+class ForecastSlot(widgets.Box):
+    """Title / icon / value column whose widgets are reused across updates"""
+
+    def __init__(self, kind: str, icon_size: int):
+        value_class = "weather-forecast-temp" if kind == "forecast" else "weather-weekly-temp"
+        title_class = "weather-forecast-time" if kind == "forecast" else "weather-weekly-day"
+
+        self._title = widgets.Label(label="—", css_classes=[title_class])
+        self._icon = widgets.Icon(pixel_size=icon_size, css_classes=[f"weather-{kind}-icon"])
+        self._icon_size = icon_size
+        self._value = widgets.Label(label="—", css_classes=[value_class])
+        self._icon_path: Optional[str] = None
+
+        super().__init__(
+            vertical=True,
+            halign="center",
+            spacing=4,
+            css_classes=[f"weather-{kind}-item"],
+            child=[self._title, self._icon, self._value],
+        )
+
+    def update(self, title: str, icon: str, value: str):
+        if self._title.label != title:
+            self._title.label = title
+        if self._icon_path != icon:
+            self._icon_path = icon
+            set_icon_texture(self._icon, icon, self._icon_size)
+        if self._value.label != value:
+            self._value.label = value
+        self.visible = True
+
+    def clear(self):
+        """Back to the placeholder shown before any data arrives"""
+        self._title.label = "—"
+        self._value.label = "—"
+        self._icon.clear()
+        self._icon_path = None
+        self.visible = True
 
 
 class WeatherPopup(widgets.Window):
     def __init__(self):
-        self._icon_label = widgets.Icon(
-            image=icon_path("cloudy"),
-            pixel_size=56,
-            css_classes=["weather-main-icon"],
-        )
+        self._icon_label = widgets.Icon(pixel_size=56, css_classes=["weather-main-icon"])
+        set_icon_texture(self._icon_label, icon_path("cloudy"), 56)
 
         self._city_label = widgets.Label(label="—", css_classes=["weather-city"])
         self._temp_label = widgets.Label(label="--°C", css_classes=["weather-temp"])
         self._desc_label = widgets.Label(label="—", css_classes=["weather-desc"])
         self._extra_label = widgets.Label(label="—", css_classes=["weather-extra"])
+        self._updated_label = widgets.Label(label="", css_classes=["weather-updated"])
+        self._astro_label = widgets.Label(label="", visible=False, css_classes=["weather-astro"])
 
         self._moon_label = widgets.Label(
             label="🌕",
             css_classes=["weather-moon-emoji"],
         )
 
+        # Fixed slots, created once and updated in place
+        self._hourly_slots = [ForecastSlot("forecast", 40) for _ in range(HOURLY_SLOTS)]
+        self._sunrise_slot = ForecastSlot("forecast", 40)
+        self._sunset_slot = ForecastSlot("forecast", 40)
+        self._weekly_slots = [ForecastSlot("weekly", 32) for _ in range(WEEKLY_SLOTS)]
+
         self._forecast_box = widgets.Box(
             spacing=16,
             halign="center",
             css_classes=["weather-forecast-row"],
+            child=[*self._hourly_slots, self._sunrise_slot, self._sunset_slot],
         )
 
+        self._chart = ForecastChart()
+
         self._weekly_box = widgets.Box(
             spacing=16,
             halign="center",
             visible=False,
             css_classes=["weather-weekly-row"],
+            child=self._weekly_slots,
         )
 
         self._weekly_arrow = widgets.Icon(
@@ -84,7 +152,7 @@ class WeatherPopup(widgets.Window):
             spacing=4,
             halign="center",
             hexpand=True,
-            child=[self._desc_label, self._extra_label],
+            child=[self._desc_label, self._extra_label, self._astro_label, self._updated_label],
         )
 
         header = widgets.Box(
@@ -95,13 +163,37 @@ class WeatherPopup(widgets.Window):
             child=[header_top, middle_column],
         )
 
+        self._repository = WeatherRepository.get_default()
+        self._ephemeris = get_ephemeris()
+        self._selected_city = self._repository.primary_city
+        self._tab_buttons = {}
+
+        for city_id in self._repository.city_ids:
+            cached = self._repository.get_city(city_id)
+            self._tab_buttons[city_id] = widgets.Button(
+                css_classes=["weather-tab", "unset"],
+                on_click=lambda x, city_id=city_id: self._select_city(city_id),
+                child=widgets.Label(label=cached["city"] if cached else city_id),
+            )
+
+        self._tabs_box = widgets.Box(
+            spacing=6,
+            halign="center",
+            css_classes=["weather-tabs"],
+            visible=len(self._tab_buttons) > 1,
+            child=list(self._tab_buttons.values()),
+        )
+        self._tab_buttons[self._selected_city].add_css_class("active")
+
         popup_box = widgets.Box(
             vertical=True,
             spacing=18,
             css_classes=["weather-popup"],
             child=[
+                self._tabs_box,
                 header,
                 self._forecast_box,
+                self._chart,
                 self._weekly_toggle,
                 self._weekly_box,
             ],
@@ -147,34 +239,26 @@ class WeatherPopup(widgets.Window):
         )
 
         self._last_data: Optional[dict] = None
-        self._update_task = None
-        self._refresh_poll = None
+        self._payload_hash: Optional[int] = None
+        self._signals = SignalManager()
 
         self.connect("notify::visible", self._on_visible_change)
+        self._signals.connect(self._repository, "data-changed", self._on_data_changed)
 
-        self._refresh_poll = utils.Poll(CACHE_TTL * 1000, lambda *_: self._update_weather())
+        self._apply_weather(self._repository.get_city(self._selected_city))
 
         self.connect("destroy", self._cleanup)
 
     def _cleanup(self, *_):
-        """Cancel poll on destroy"""
-        if self._refresh_poll:
-            try:
-                self._refresh_poll.cancel()
-            except:
-                pass
-            self._refresh_poll = None
-
-        if self._update_task:
-            try:
-                self._update_task.cancel()
-            except:
-                pass
-            self._update_task = None
+        """Disconnect from the weather repository on destroy"""
+        self._signals.disconnect_all()
 
     def _on_visible_change(self, *_):
         """Handle reveal animation when window opens/closes"""
         if self.visible:
+            self._repository.request_update()
+            self._update_staleness(self._last_data)
+            self._update_astronomy(self._last_data)
             utils.Timeout(10, lambda: setattr(self._revealer, "reveal_child", True))
         else:
             self._revealer.reveal_child = False
@@ -183,15 +267,87 @@ class WeatherPopup(widgets.Window):
             self._weekly_toggle.child.child[0].label = "Show weekly forecast"
 
     def toggle(self):
-        if not self.visible:
-            self.visible = True
-            self._update_weather()
-        else:
-            self.visible = False
+        self.visible = not self.visible
+
+    def _on_data_changed(self, _repository, changed: dict):
+        for city_id, data in changed.items():
+            if city_id in self._tab_buttons:
+                self._tab_buttons[city_id].child.label = data["city"]
+
+        if self._selected_city in changed:
+            self._apply_weather(changed[self._selected_city])
+
+    def _select_city(self, city_id: str):
+        """Switch tabs; reads only from the repository's in-memory cache"""
+        if city_id == self._selected_city:
+            return
+
+        self._tab_buttons[self._selected_city].remove_css_class("active")
+        self._tab_buttons[city_id].add_css_class("active")
+        self._selected_city = city_id
+
+        data = self._repository.get_city(city_id)
+        if data is None:
+            self._show_placeholder(self._tab_buttons[city_id].child.label)
+            return
+        self._apply_weather(data)
+
+    def _show_placeholder(self, city: str):
+        """Reset every data widget to the first-load state (city not fetched yet)"""
+        self._last_data = None
+        self._payload_hash = None
+
+        set_icon_texture(self._icon_label, icon_path("cloudy"), 56)
+        self._city_label.label = city
+        self._temp_label.label = "--°C"
+        self._desc_label.label = "—"
+        self._extra_label.label = "—"
+        self._updated_label.label = ""
+        self._updated_label.remove_css_class("stale")
+
+        for slot in (*self._hourly_slots, *self._weekly_slots):
+            slot.clear()
+        self._chart.set_series(None)
+        self._update_astronomy(None)
 
     def get_last_data(self):
         return self._last_data
 
+    def _update_staleness(self, data: Optional[dict]):
+        if not data:
+            return
+        updated_at = data.get("updated_at")
+        self._updated_label.label = format_updated(updated_at)
+        if is_stale(updated_at):
+            self._updated_label.add_css_class("stale")
+        else:
+            self._updated_label.remove_css_class("stale")
+
+    def _update_astronomy(self, data: Optional[dict]):
+        """Sun and moon details from the offline ephemeris table"""
+        day = self._ephemeris.today()
+        self._moon_label.label = day.moon_emoji
+        self._moon_label.set_tooltip_text(_moon_tooltip(day))
+
+        # Configured coordinates describe the primary location only
+        local = self._ephemeris.has_location and self._selected_city == self._repository.primary_city
+        if local:
+            sunrise, sunset = day.sunrise, day.sunset
+        elif data:
+            sunrise, sunset = data["sunrise"], data["sunset"]
+        else:
+            sunrise = sunset = None
+
+        self._sunrise_slot.update("Sunrise", icon_path("sunrise"), format_timestamp(sunrise))
+        self._sunset_slot.update("Sunset", icon_path("sunset"), format_timestamp(sunset))
+
+        self._astro_label.visible = local
+        if local:
+            self._astro_label.label = (
+                f"Dawn {format_timestamp(day.civil_dawn)}  •  Dusk {format_timestamp(day.civil_dusk)}"
+                f"  •  Moonrise {format_timestamp(day.moonrise)}"
+            )
+
     def _toggle_weekly(self):
         """Toggle weekly forecast visibility"""
         current = self._weekly_box.visible
@@ -204,19 +360,19 @@ class WeatherPopup(widgets.Window):
 
         self._weekly_arrow.set_css_classes(["expand-arrow", "rotated"] if new_state else ["expand-arrow"])
 
-    def _update_weather(self):
-        self._update_task = asyncio.create_task(self._update_weather_async())
-        return True
-
-    async def _update_weather_async(self):
-        data = await fetch_weather_async()
-
+    def _apply_weather(self, data: Optional[dict]):
         if not data:
             return
 
         self._last_data = data
+        self._update_staleness(data)
 
-        self._icon_label.image = data["icon"]
+        payload_hash = _payload_hash(data)
+        if payload_hash == self._payload_hash:
+            return
+        self._payload_hash = payload_hash
+
+        set_icon_texture(self._icon_label, data["icon"], 56)
         self._city_label.label = data["city"]
         self._temp_label.label = f"{data['temp']}°C"
         self._desc_label.label = data["desc"]
@@ -224,82 +380,21 @@ class WeatherPopup(widgets.Window):
             f"Feels like {data['feels_like']}°C  •  Humidity {data['humidity']}%  •  Wind {data['wind']:.1f} m/s"
         )
 
-        if moon := data.get("moon_icon"):
-            self._moon_label.label = moon
-        if tip := data.get("moon_tooltip"):
-            self._moon_label.set_tooltip_text(tip)
-
-        hourly_items: List[widgets.Widget] = []
-
-        for it in data["forecast"]:
-            hourly_items.append(
-                widgets.Box(
-                    vertical=True,
-                    halign="center",
-                    spacing=4,
-                    css_classes=["weather-forecast-item"],
-                    child=[
-                        widgets.Label(label=it["time"], css_classes=["weather-forecast-time"]),
-                        widgets.Icon(
-                            image=it["icon"],
-                            pixel_size=40,
-                            css_classes=["weather-forecast-icon"],
-                        ),
-                        widgets.Label(
-                            label=f"{it['temp']}°C",
-                            css_classes=["weather-forecast-temp"],
-                        ),
-                    ],
-                )
-            )
+        for slot, it in zip(self._hourly_slots, data["forecast"]):
+            slot.update(it["time"], it["icon"], f"{it['temp']}°C")
+        for slot in self._hourly_slots[len(data["forecast"]) :]:
+            slot.visible = False
 
-        sunrise = format_time_hm(datetime.fromtimestamp(data["sunrise"]))
-        sunset = format_time_hm(datetime.fromtimestamp(data["sunset"]))
-
-        for label, icon in [("Sunrise", "sunrise"), ("Sunset", "sunset")]:
-            hourly_items.append(
-                widgets.Box(
-                    vertical=True,
-                    halign="center",
-                    spacing=4,
-                    css_classes=["weather-forecast-item"],
-                    child=[
-                        widgets.Label(label=label, css_classes=["weather-forecast-time"]),
-                        widgets.Icon(
-                            image=icon_path(icon),
-                            pixel_size=40,
-                            css_classes=["weather-forecast-icon"],
-                        ),
-                        widgets.Label(
-                            label=sunrise if label == "Sunrise" else sunset,
-                            css_classes=["weather-forecast-temp"],
-                        ),
-                    ],
-                )
-            )
+        self._update_astronomy(data)
 
-        self._forecast_box.child = hourly_items
-
-        weekly_items = []
-        for it in data.get("weekly", []):
-            weekly_items.append(
-                widgets.Box(
-                    vertical=True,
-                    halign="center",
-                    spacing=4,
-                    css_classes=["weather-weekly-item"],
-                    child=[
-                        widgets.Label(label=it["day"], css_classes=["weather-weekly-day"]),
-                        widgets.Icon(
-                            image=it["icon"],
-                            pixel_size=32,
-                            css_classes=["weather-weekly-icon"],
-                        ),
-                        widgets.Label(
-                            label=f"{it['temp']}°C",
-                            css_classes=["weather-weekly-temp"],
-                        ),
-                    ],
-                )
-            )
-        self._weekly_box.child = weekly_items
+        hourly = data.get("hourly")
+        self._chart.set_series(ForecastSeries.from_dict(hourly) if hourly else None)
+
+        weekly = data.get("weekly", [])
+        for slot, it in zip(self._weekly_slots, weekly):
+            if "temp_min" in it:
+                slot.update(it["day"], it["icon"], f"{it['temp']}° / {it['temp_min']}°")
+            else:
+                slot.update(it["day"], it["icon"], f"{it['temp']}°C")
+        for slot in self._weekly_slots[len(weekly) :]:
+            slot.visible = False
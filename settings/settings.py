@@ -60,10 +60,14 @@ class PathConfig:
     screenshots_dir: Path = Path.home() / "Pictures" / "Screenshots"
 
     weather_cache: Path = field(init=False)
+    thumbnail_dir: Path = field(init=False)
+    icon_cache_dir: Path = field(init=False)
     timer_queue: Path = field(init=False)
 
     def __post_init__(self):
         self.weather_cache = self.cache_dir / "weather_cache.json"
+        self.thumbnail_dir = self.cache_dir / "thumbnails"
+        self.icon_cache_dir = self.cache_dir / "icons"
         self.timer_queue = self.data_dir / "timers" / "queue.json"
 
         for directory in [
@@ -97,6 +101,11 @@ class WeatherConfig:
     cache_ttl: int = 600
     use_12h_format: bool = False
     icon_base_path: str = "~/.config/ignis/assets/icons/weather"
+    api_base_url: str = "https://api.openweathermap.org/data/2.5"
+    locations: list[str] | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    ephemeris_days: int = 7
 
     def __post_init__(self):
         if not self.api_key:
@@ -105,6 +114,10 @@ class WeatherConfig:
         if not self.city_id or self.city_id == "643492":
             self.city_id = os.getenv("OPEN_WEATHER_CITY_ID", "643492")
 
+        # First location is the primary one (pill, default tab)
+        self.locations = [str(loc) for loc in self.locations or []] or [str(self.city_id)]
+        self.city_id = self.locations[0]
+
         self.icon_base_path = os.path.expanduser(self.icon_base_path)
 
     @classmethod
@@ -178,6 +191,9 @@ class TimeoutConfig:
 @dataclass
 class BarConfig:
     remember_state: bool = True
+    all_monitors: bool = True
+    cpu_graph: bool = True
+    net_speed: bool = False
     window_title_exceptions: list[str] | None = None
 
     def __post_init__(self):
@@ -196,11 +212,15 @@ class BarConfig:
 class NotificationConfig:
     max_history: int = 10
     popup_timeout: int = 5000
+    popup_pool_size: int = 5
     filter_keywords: list[str] | None = None
+    rules: list[dict] | None = None
 
     def __post_init__(self):
         if self.filter_keywords is None:
             self.filter_keywords = []
+        if self.rules is None:
+            self.rules = []
         # Convert to lowercase for case-insensitive matching
         self.filter_keywords = [kw.lower() for kw in self.filter_keywords]
 
@@ -321,6 +341,11 @@ class UIConfig:
 @dataclass
 class SystemConfig:
     bluetooth_manager: str = "blueman-manager"
+    sample_interval: int = 3000  # ms, procfs sampling (CPU, memory, pressure)
+    history_minutes: int = 10  # sparklines at full sample rate
+    long_history_minutes: int = 120  # averaged
+    net_smoothing: float = 0.5  # EMA weight of the newest throughput sample (1.0 = raw)
+    top_processes: int = 5  # rows in the system popup's process list
 
     @classmethod
     def from_dict(cls, data: Dict) -> "SystemConfig":
@@ -0,0 +1,19 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+for path in (ROOT, ROOT / "tests"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from openweather_stub import OpenWeatherStub  # noqa: E402
+
+
+@pytest.fixture
+def openweather():
+    stub = OpenWeatherStub()
+    stub.start()
+    yield stub
+    stub.stop()
@@ -0,0 +1,156 @@
+import gzip
+import hashlib
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES = Path(__file__).parent / "fixtures" / "openweather"
+
+# First path segment selects how the payload is framed on the wire
+MODES = ("plain", "chunked", "gzip", "deflate", "raw-deflate", "close", "eof")
+
+
+class RecordedRequest(NamedTuple):
+    path: str
+    query: Dict[str, str]
+    headers: Dict[str, str]
+    client_port: int
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        self.server.stub.requests.append(
+            RecordedRequest(parts.path, query, {k.lower(): v for k, v in self.headers.items()}, self.client_address[1])
+        )
+
+        segments = parts.path.strip("/").split("/")
+        mode = segments[0]
+        if mode == "broken":
+            self.wfile.write(b"HTTP/1.1 banana OK\r\nContent-Length: 0\r\n\r\n")
+            self.close_connection = True
+            return
+        if mode == "slow":
+            time.sleep(float(query.get("delay", "1")))
+            try:
+                self._send(200, b"{}")
+            except OSError:
+                # The client gave up waiting
+                self.close_connection = True
+            return
+        if mode == "status":
+            self._send(int(segments[1]), b'{"cod": "%s", "message": "stub error"}' % segments[1].encode())
+            return
+        if mode not in MODES:
+            self._send(404, b'{"cod": "404", "message": "unknown mode"}')
+            return
+
+        payload = self._fixture(segments[-1], query.get("id", ""))
+        if payload is None:
+            self._send(404, b'{"cod": "404", "message": "city not found"}')
+            return
+
+        etag = '"%s"' % hashlib.sha1(payload).hexdigest()[:16]
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self._send(200, payload, mode, etag)
+
+    def _fixture(self, endpoint: str, city_id: str):
+        name = "group.json" if endpoint == "group" else f"{endpoint}_{city_id}.json"
+        path = FIXTURES / name
+        return path.read_bytes() if path.is_file() else None
+
+    def _send(self, status: int, body: bytes, mode: str = "plain", etag: str = ""):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if etag:
+            self.send_header("ETag", etag)
+
+        if mode == "gzip":
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        elif mode == "deflate":
+            body = zlib.compress(body)
+            self.send_header("Content-Encoding", "deflate")
+        elif mode == "raw-deflate":
+            compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+            body = compressor.compress(body) + compressor.flush()
+            self.send_header("Content-Encoding", "deflate")
+
+        if mode == "chunked":
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for start in range(0, len(body), 1000):
+                chunk = body[start : start + 1000]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\n\r\n")
+            return
+
+        if mode == "eof":
+            # HTTP/1.0-style framing: body runs until the server closes
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(body)
+            self.close_connection = True
+            return
+
+        if mode == "close":
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "OpenWeatherStub"
+
+
+class OpenWeatherStub:
+    """
+    Local HTTP/1.1 server replaying recorded OpenWeather responses.
+
+    Paths look like /<mode>/data/2.5/<endpoint>?id=...; the endpoint and id
+    pick a fixture file and the mode picks the framing (see MODES). Every
+    response carries an ETag and a matching If-None-Match gets a 304.
+    /status/<code>/... answers with that status, /broken with a malformed
+    status line and /slow?delay=<s> sleeps before answering.
+    """
+
+    def __init__(self):
+        self.requests: List[RecordedRequest] = []
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def connections(self) -> int:
+        """Number of distinct client connections seen so far"""
+        return len({r.client_port for r in self.requests})
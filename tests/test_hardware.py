@@ -0,0 +1,164 @@
+from types import SimpleNamespace
+
+import pytest
+
+from modules.sysmon import hardware
+from modules.sysmon.diskstats import SECTOR_SIZE, DiskStatsReader
+from modules.sysmon.hardware import HardwareReader
+from modules.sysmon.hwmon import SensorReader, discover_sensors
+
+
+def _diskstats(disks):
+    """/proc/diskstats with (sectors_read, sectors_written, io_ms) per device"""
+    lines = []
+    for minor, (name, (read, written, io_ms)) in enumerate(disks.items()):
+        # major minor name reads merged sectors ms writes merged sectors ms in_flight io_ms weighted_ms
+        lines.append(f"   8 {minor:7d} {name} 100 0 {read} 50 200 0 {written} 80 0 {io_ms} 130")
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def tree(tmp_path):
+    proc = tmp_path / "proc"
+    sysfs = tmp_path / "sys"
+    proc.mkdir()
+    for name in ("sda", "nvme0n1"):
+        (sysfs / "block" / name / "device").mkdir(parents=True)
+    # Partitions only live below their disk; loop and zram have no device link
+    (sysfs / "block" / "sda" / "sda1").mkdir()
+    (sysfs / "block" / "loop0").mkdir()
+    (sysfs / "block" / "zram0").mkdir()
+
+    k10temp = sysfs / "class" / "hwmon" / "hwmon0"
+    k10temp.mkdir(parents=True)
+    (k10temp / "name").write_text("k10temp\n")
+    (k10temp / "temp1_input").write_text("45500\n")
+    (k10temp / "temp1_label").write_text("Tctl\n")
+
+    nct = sysfs / "class" / "hwmon" / "hwmon1"
+    nct.mkdir()
+    (nct / "name").write_text("nct6775\n")
+    (nct / "fan1_input").write_text("1200\n")
+    (nct / "temp2_input").write_text("38000\n")
+    (nct / "temp2_type").write_text("4\n")
+
+    _write_disks(tmp_path, {"sda": (0, 0, 0), "nvme0n1": (0, 0, 0)})
+    return tmp_path
+
+
+def _write_disks(tree, disks):
+    # Partition, loop and zram lines are always present and must never show up
+    disks = {**disks, "sda1": (999, 999, 999), "loop0": (999, 999, 999), "zram0": (999, 999, 999)}
+    (tree / "proc" / "diskstats").write_text(_diskstats(disks))
+
+
+def test_only_physical_disks(tree):
+    reader = DiskStatsReader(str(tree / "proc"), str(tree / "sys"))
+
+    assert set(reader.read(0)) == {"sda", "nvme0n1"}
+    reader.close()
+
+
+def test_disk_rates_from_sectors(tree):
+    reader = DiskStatsReader(str(tree / "proc"), str(tree / "sys"))
+    first = reader.read(0)
+    assert first["sda"] == ("sda", 0.0, 0.0, 0.0)
+
+    _write_disks(tree, {"sda": (2000, 4000, 500), "nvme0n1": (0, 100, 0)})
+    rates = reader.read(2.0)
+    assert rates["sda"].read == 2000 * SECTOR_SIZE / 2 == 512000
+    assert rates["sda"].write == 4000 * SECTOR_SIZE / 2
+    assert rates["sda"].busy == pytest.approx(25.0)
+    assert rates["nvme0n1"].write == 100 * SECTOR_SIZE / 2
+    reader.close()
+
+
+def test_disk_counter_reset_reads_as_zero(tree):
+    reader = DiskStatsReader(str(tree / "proc"), str(tree / "sys"))
+    _write_disks(tree, {"sda": (5000, 5000, 100), "nvme0n1": (0, 0, 0)})
+    reader.read(0)
+
+    _write_disks(tree, {"sda": (10, 10, 10), "nvme0n1": (0, 0, 0)})
+    assert reader.read(2.0)["sda"] == ("sda", 0.0, 0.0, 0.0)
+    reader.close()
+
+
+def test_hotplugged_disk_is_picked_up(tree):
+    reader = DiskStatsReader(str(tree / "proc"), str(tree / "sys"))
+    reader.read(0)
+
+    (tree / "sys" / "block" / "sdb" / "device").mkdir(parents=True)
+    _write_disks(tree, {"sda": (0, 0, 0), "nvme0n1": (0, 0, 0), "sdb": (10, 0, 0)})
+    assert "sdb" in reader.read(1.0)
+    reader.close()
+
+
+def test_discover_sensors(tree):
+    sensors = discover_sensors(str(tree / "sys"))
+
+    assert [(s.chip, s.label, s.kind) for s in sensors] == [
+        ("k10temp", "Tctl", "temp"),
+        ("nct6775", "fan1", "fan"),
+        ("nct6775", "temp2", "temp"),
+    ]
+
+
+def test_sensor_values(tree):
+    reader = SensorReader(str(tree / "sys"))
+    values = {(r.chip, r.label): r.value for r in reader.read()}
+
+    # temperatures in millidegrees Celsius, fans in RPM
+    assert values == {("k10temp", "Tctl"): 45.5, ("nct6775", "fan1"): 1200.0, ("nct6775", "temp2"): 38.0}
+
+    # A sensor that fails to read is skipped, the others keep working
+    (tree / "sys" / "class" / "hwmon" / "hwmon1" / "fan1_input").write_text("")
+    (tree / "sys" / "class" / "hwmon" / "hwmon0" / "temp1_input").write_text("61000\n")
+    values = {(r.chip, r.label): r.value for r in reader.read()}
+    assert values == {("k10temp", "Tctl"): 61.0, ("nct6775", "temp2"): 38.0}
+    reader.close()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(hardware, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+def test_hardware_reader(tree, clock):
+    reader = HardwareReader(str(tree / "proc"), str(tree / "sys"), max_gap=30)
+    first = reader.read()
+    assert set(first.disks) == {"sda", "nvme0n1"}
+    assert len(first.sensors) == 3
+
+    clock.now += 0.1
+    assert reader.read() is first
+
+    _write_disks(tree, {"sda": (2000, 0, 0), "nvme0n1": (0, 0, 0)})
+    clock.now += 1.9
+    assert reader.read().disks["sda"].read == 2000 * SECTOR_SIZE / 2
+    reader.close()
+
+
+def test_max_gap_resets_rates(tree, clock):
+    reader = HardwareReader(str(tree / "proc"), str(tree / "sys"), max_gap=30)
+    reader.read()
+
+    # Hidden for a minute: no average over the pause
+    _write_disks(tree, {"sda": (60000, 60000, 1000), "nvme0n1": (0, 0, 0)})
+    clock.now += 60
+    assert reader.read().disks["sda"] == ("sda", 0.0, 0.0, 0.0)
+
+    # The next regular tick reports rates again
+    _write_disks(tree, {"sda": (62000, 60000, 1000), "nvme0n1": (0, 0, 0)})
+    clock.now += 2
+    assert reader.read().disks["sda"].read == 2000 * SECTOR_SIZE / 2
+    reader.close()
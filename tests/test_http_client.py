@@ -0,0 +1,177 @@
+import asyncio
+import json
+
+import pytest
+
+from modules.weather.http_client import AsyncHttpTransport, HttpError, WeatherTransport
+
+CITY = {"id": "643492"}
+
+
+def _get(transport, url, **kwargs):
+    return asyncio.run(transport.get(url, **kwargs))
+
+
+def _track_connections(transport):
+    """Record every connection the transport opens"""
+    opened = []
+    open_connection = transport._open
+
+    async def _open(key):
+        conn = await open_connection(key)
+        opened.append(conn)
+        return conn
+
+    transport._open = _open
+    return opened
+
+
+@pytest.mark.parametrize("mode", ["plain", "chunked", "gzip", "deflate", "raw-deflate", "eof"])
+def test_decodes_body(openweather, mode):
+    transport = AsyncHttpTransport()
+    response = _get(transport, f"{openweather.url}/{mode}/data/2.5/weather", params=CITY)
+
+    assert response.status == 200
+    assert response.json()["name"] == "Moscow"
+    assert response.headers["etag"]
+    assert openweather.requests[0].query == CITY
+    assert openweather.requests[0].headers["accept-encoding"] == "gzip, deflate"
+
+
+def test_chunked_body_spans_several_chunks(openweather):
+    transport = AsyncHttpTransport()
+    response = _get(transport, f"{openweather.url}/chunked/data/2.5/forecast", params=CITY)
+
+    assert len(response.body) > 1000
+    assert len(response.json()["list"]) == 16
+
+
+def test_keep_alive_reuses_connection(openweather):
+    transport = AsyncHttpTransport()
+
+    async def run():
+        for endpoint in ("weather", "forecast", "weather"):
+            response = await transport.get(f"{openweather.url}/gzip/data/2.5/{endpoint}", params=CITY)
+            assert response.status == 200
+        await transport.close()
+
+    asyncio.run(run())
+    assert len(openweather.requests) == 3
+    assert openweather.connections() == 1
+
+
+@pytest.mark.parametrize("mode", ["close", "eof"])
+def test_connection_not_reused_when_server_closes(openweather, mode):
+    transport = AsyncHttpTransport()
+
+    async def run():
+        for _ in range(2):
+            response = await transport.get(f"{openweather.url}/{mode}/data/2.5/weather", params=CITY)
+            assert response.status == 200
+
+    asyncio.run(run())
+    assert openweather.connections() == 2
+    assert not any(transport._idle.values())
+
+
+def test_stale_idle_connection_is_replaced(openweather):
+    transport = AsyncHttpTransport(idle_timeout=0.05)
+
+    async def run():
+        await transport.get(f"{openweather.url}/plain/data/2.5/weather", params=CITY)
+        (conn,) = [c for conns in transport._idle.values() for c in conns]
+        await asyncio.sleep(0.1)
+        response = await transport.get(f"{openweather.url}/plain/data/2.5/weather", params=CITY)
+        assert response.status == 200
+        assert conn.writer.is_closing()
+
+    asyncio.run(run())
+    assert openweather.connections() == 2
+
+
+@pytest.mark.parametrize("status", [401, 404, 429, 500, 503])
+def test_error_status_is_returned(openweather, status):
+    transport = AsyncHttpTransport()
+
+    async def run():
+        response = await transport.get(f"{openweather.url}/status/{status}/data/2.5/weather", params=CITY)
+        assert response.status == status
+        assert json.loads(response.body)["cod"] == str(status)
+        # The error response was fully read, so the connection stays usable
+        response = await transport.get(f"{openweather.url}/plain/data/2.5/weather", params=CITY)
+        assert response.status == 200
+
+    asyncio.run(run())
+    assert openweather.connections() == 1
+
+
+def test_not_modified_has_no_body(openweather):
+    transport = AsyncHttpTransport()
+
+    async def run():
+        first = await transport.get(f"{openweather.url}/plain/data/2.5/weather", params=CITY)
+        second = await transport.get(
+            f"{openweather.url}/plain/data/2.5/weather",
+            params=CITY,
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        assert second.status == 304
+        assert second.body == b""
+
+    asyncio.run(run())
+    assert openweather.connections() == 1
+
+
+def test_malformed_response_raises_and_closes(openweather):
+    transport = AsyncHttpTransport()
+    opened = _track_connections(transport)
+
+    with pytest.raises(HttpError):
+        _get(transport, f"{openweather.url}/broken")
+
+    assert len(opened) == 1
+    assert opened[0].writer.is_closing()
+    assert not any(transport._idle.values())
+
+
+def test_timeout_raises_and_closes(openweather):
+    transport = AsyncHttpTransport(timeout=0.2)
+    opened = _track_connections(transport)
+
+    with pytest.raises(HttpError, match="timed out"):
+        _get(transport, f"{openweather.url}/slow", params={"delay": "1"})
+
+    assert len(opened) == 1
+    assert opened[0].writer.is_closing()
+    assert not any(transport._idle.values())
+
+
+def test_cancellation_closes_connection(openweather):
+    transport = AsyncHttpTransport()
+    opened = _track_connections(transport)
+
+    async def run():
+        task = asyncio.create_task(transport.get(f"{openweather.url}/slow", params={"delay": "1"}))
+        while not openweather.requests:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert len(opened) == 1
+    assert opened[0].writer.is_closing()
+    assert not any(transport._idle.values())
+
+
+def test_unsupported_url():
+    with pytest.raises(HttpError):
+        _get(AsyncHttpTransport(), "ftp://example.com/data")
+
+
+def test_incomplete_transport_fails_at_construction():
+    class NoGet(WeatherTransport):
+        pass
+
+    with pytest.raises(TypeError):
+        NoGet()
@@ -0,0 +1,126 @@
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from modules.sysmon import netdev
+from modules.sysmon.netdev import MIN_SMOOTHING, NetDevReader, format_rate
+
+FIXTURES = Path(__file__).parent / "fixtures" / "netdev"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(netdev, "time", SimpleNamespace(monotonic=clock))
+    return clock
+
+
+@pytest.fixture
+def proc(tmp_path):
+    (tmp_path / "net").mkdir()
+    return tmp_path
+
+
+def _load(proc, name):
+    shutil.copyfile(FIXTURES / name, proc / "net" / "dev")
+
+
+def _reader(proc, clock, smoothing=0.5):
+    _load(proc, "dev.1")
+    reader = NetDevReader(str(proc), smoothing=smoothing)
+    first = reader.read()
+    clock.now += 2
+    _load(proc, "dev.2")
+    return reader, first
+
+
+def test_first_read_has_no_rates(proc, clock):
+    reader, first = _reader(proc, clock)
+
+    assert set(first.interfaces) == {"lo", "enp3s0", "wlan0"}
+    assert first.interfaces["enp3s0"].rx_bytes == 10000000
+    assert first.interfaces["enp3s0"].tx_bytes == 2000000
+    assert (first.rx, first.tx) == (0.0, 0.0)
+    reader.close()
+
+
+def test_rates_are_smoothed(proc, clock):
+    reader, _ = _reader(proc, clock)
+
+    # enp3s0 moved 2 MB down / 400 kB up in 2 s; half of that with smoothing 0.5
+    eth = reader.read().interfaces["enp3s0"]
+    assert (eth.rx, eth.tx) == pytest.approx((500000.0, 100000.0))
+
+    # Idle tick: the average decays instead of dropping to zero
+    clock.now += 2
+    eth = reader.read().interfaces["enp3s0"]
+    assert (eth.rx, eth.tx) == pytest.approx((250000.0, 50000.0))
+    reader.close()
+
+
+def test_without_smoothing(proc, clock):
+    reader, _ = _reader(proc, clock, smoothing=1.0)
+
+    eth = reader.read().interfaces["enp3s0"]
+    assert (eth.rx, eth.tx) == pytest.approx((1000000.0, 200000.0))
+    reader.close()
+
+
+def test_zero_smoothing_is_clamped(proc, clock):
+    reader, _ = _reader(proc, clock, smoothing=0.0)
+
+    eth = reader.read().interfaces["enp3s0"]
+    assert eth.rx == pytest.approx(MIN_SMOOTHING * 1000000.0)
+    reader.close()
+
+
+def test_counter_reset_restarts_interface(proc, clock):
+    reader, _ = _reader(proc, clock, smoothing=1.0)
+
+    wlan = reader.read().interfaces["wlan0"]
+    assert (wlan.rx, wlan.tx) == (0.0, 0.0)
+    assert wlan.rx_bytes == 1000
+
+    # Counting resumes from the new baseline
+    (proc / "net" / "dev").write_text((FIXTURES / "dev.2").read_text().replace("   1000      10", "  21000      30"))
+    clock.now += 2
+    wlan = reader.read().interfaces["wlan0"]
+    assert wlan.rx == pytest.approx(10000.0)
+    reader.close()
+
+
+def test_loopback_not_in_totals(proc, clock):
+    reader, _ = _reader(proc, clock, smoothing=1.0)
+    snapshot = reader.read()
+
+    assert snapshot.interfaces["lo"].rx == pytest.approx(200000.0)
+    # enp3s0 only: wlan0 was reset and lo is excluded
+    assert (snapshot.rx, snapshot.tx) == pytest.approx((1000000.0, 200000.0))
+    reader.close()
+
+
+def test_min_interval_returns_previous_snapshot(proc, clock):
+    reader, first = _reader(proc, clock)
+    clock.now = first.time + 0.1
+
+    assert reader.read() is first
+    reader.close()
+
+
+def test_format_rate():
+    assert format_rate(0) == "0 B/s"
+    assert format_rate(999) == "999 B/s"
+    assert format_rate(1500) == "1.5 kB/s"
+    assert format_rate(250000) == "250 kB/s"
+    assert format_rate(1234567) == "1.2 MB/s"
+    assert format_rate(3.5e9) == "3.5 GB/s"
@@ -0,0 +1,87 @@
+import shutil
+import time
+
+from modules.sysmon.processes import CLK_TCK, PAGE_SIZE, ProcessReader
+
+
+def _write_stat(root, pid, name, ticks, rss=100, start=1000):
+    # Fields after "pid (comm) ": state ... utime(11) stime(12) ... starttime(19) ... rss(21)
+    fields = ["S"] + ["0"] * 22
+    fields[11] = str(ticks)
+    fields[12] = "0"
+    fields[19] = str(start)
+    fields[21] = str(rss)
+    path = root / str(pid)
+    path.mkdir(exist_ok=True)
+    (path / "stat").write_text(f"{pid} ({name}) {' '.join(fields)}\n")
+
+
+def test_top_processes(tmp_path):
+    _write_stat(tmp_path, 1, "init", 0, rss=10)
+    _write_stat(tmp_path, 2, "busy loop", 0, rss=50)
+    _write_stat(tmp_path, 3, "idle", 0, rss=300)
+    (tmp_path / "self").mkdir()
+
+    reader = ProcessReader(str(tmp_path), limit=2, min_interval=0)
+    first = reader.read()
+    assert first.count == 3
+    assert all(p.cpu == 0 for p in first.by_cpu)
+    assert [p.name for p in first.by_memory] == ["idle", "busy loop"]
+    assert first.by_memory[0].memory == 300 * PAGE_SIZE
+
+    _write_stat(tmp_path, 2, "busy loop", CLK_TCK * 10, rss=50)
+    time.sleep(0.05)
+    second = reader.read()
+    top = second.by_cpu[0]
+    assert (top.pid, top.name) == (2, "busy loop")
+    assert top.cpu > 0
+    reader.close()
+
+
+def test_reused_pid_starts_over(tmp_path):
+    _write_stat(tmp_path, 7, "old", 500, start=1000)
+    reader = ProcessReader(str(tmp_path), min_interval=0)
+    reader.read()
+
+    _write_stat(tmp_path, 7, "new", 600, start=2000)
+    time.sleep(0.01)
+    (info,) = reader.read().by_cpu
+    assert (info.name, info.cpu) == ("new", 0)
+    reader.close()
+
+
+def test_exited_process_handles_are_dropped_at_max_open(tmp_path):
+    for pid in (1, 2, 3):
+        _write_stat(tmp_path, pid, f"p{pid}", 0)
+
+    reader = ProcessReader(str(tmp_path), max_open=2, min_interval=0)
+    reader.read()
+    assert len(reader._files) == 2
+
+    # scandir order is arbitrary: remove one of the cached pids
+    gone = next(iter(reader._files))
+    shutil.rmtree(tmp_path / gone)
+    snapshot = reader.read()
+    assert snapshot.count == 2
+    assert gone not in reader._files
+
+    # The freed slot goes to the uncached process on the next tick
+    reader.read()
+    assert len(reader._files) == 2
+    reader.close()
+
+
+def test_long_gap_reads_as_first_sample(tmp_path):
+    _write_stat(tmp_path, 1, "worker", 0)
+    reader = ProcessReader(str(tmp_path), min_interval=0, max_gap=0.05)
+    reader.read()
+
+    _write_stat(tmp_path, 1, "worker", CLK_TCK * 10)
+    time.sleep(0.1)
+    (info,) = reader.read().by_cpu
+    assert info.cpu == 0
+
+    _write_stat(tmp_path, 1, "worker", CLK_TCK * 20)
+    (info,) = reader.read().by_cpu
+    assert info.cpu > 0
+    reader.close()
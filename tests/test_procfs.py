@@ -0,0 +1,130 @@
+import pytest
+
+from modules.sysmon.procfs import ProcfsReader
+
+MEMINFO = """\
+MemTotal:        1000000 kB
+MemFree:          100000 kB
+MemAvailable:     250000 kB
+Buffers:           10000 kB
+Cached:           200000 kB
+SwapCached:            0 kB
+SwapTotal:        400000 kB
+SwapFree:         100000 kB
+"""
+
+PRESSURE = """\
+some avg10=1.50 avg60=0.80 avg300=0.20 total=123456
+full avg10=0.25 avg60=0.10 avg300=0.00 total=4567
+"""
+
+
+def _stat(total, cores):
+    """/proc/stat with (busy, idle) jiffies for the aggregate line and each core"""
+    lines = []
+    for name, (busy, idle) in [("cpu ", total)] + [(f"cpu{i}", core) for i, core in enumerate(cores)]:
+        # user nice system idle iowait irq softirq steal guest guest_nice
+        lines.append(f"{name} {busy} 0 0 {idle} 0 0 0 0 0 0")
+    lines += ["intr 12345 0 0", "ctxt 67890", "btime 1700000000", "processes 4242"]
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def proc(tmp_path):
+    (tmp_path / "stat").write_text(_stat((200, 800), [(150, 350), (50, 450)]))
+    (tmp_path / "meminfo").write_text(MEMINFO)
+    (tmp_path / "loadavg").write_text("0.52 0.58 0.59 3/812 40123\n")
+    return tmp_path
+
+
+def test_cpu_deltas(proc):
+    reader = ProcfsReader(str(proc), min_interval=0)
+
+    # First read is the average since boot
+    cpu = reader.read().cpu
+    assert cpu.percent == pytest.approx(20.0)
+    assert cpu.per_core == pytest.approx((30.0, 10.0))
+
+    (proc / "stat").write_text(_stat((300, 900), [(250, 350), (50, 550)]))
+    cpu = reader.read().cpu
+    assert cpu.percent == pytest.approx(50.0)
+    assert cpu.per_core == pytest.approx((100.0, 0.0))
+    reader.close()
+
+
+def test_cpu_hotplug_adds_cores(proc):
+    reader = ProcfsReader(str(proc), min_interval=0)
+    reader.read()
+
+    (proc / "stat").write_text(_stat((300, 900), [(250, 350), (50, 550), (10, 90)]))
+    cpu = reader.read().cpu
+    assert cpu.per_core == pytest.approx((100.0, 0.0, 10.0))
+    reader.close()
+
+
+def test_min_interval_returns_previous_snapshot(proc):
+    reader = ProcfsReader(str(proc), min_interval=60)
+    first = reader.read()
+
+    (proc / "stat").write_text(_stat((300, 900), [(250, 350), (50, 550)]))
+    assert reader.read() is first
+    reader.close()
+
+
+def test_memory(proc):
+    reader = ProcfsReader(str(proc), min_interval=0)
+    memory = reader.read().memory
+
+    assert (memory.total, memory.available) == (1000000, 250000)
+    assert memory.percent == pytest.approx(75.0)
+    assert memory.swap_percent == pytest.approx(75.0)
+    reader.close()
+
+
+def test_memory_without_swap(proc):
+    (proc / "meminfo").write_text("MemTotal: 2000 kB\nMemAvailable: 1500 kB\nSwapTotal: 0 kB\nSwapFree: 0 kB\n")
+    reader = ProcfsReader(str(proc), min_interval=0)
+    memory = reader.read().memory
+
+    assert memory.percent == pytest.approx(25.0)
+    assert memory.swap_percent == 0.0
+    reader.close()
+
+
+def test_loadavg(proc):
+    reader = ProcfsReader(str(proc), min_interval=0)
+    load = reader.read().load
+
+    assert (load.avg1, load.avg5, load.avg15) == pytest.approx((0.52, 0.58, 0.59))
+    assert (load.running, load.total) == (3, 812)
+    reader.close()
+
+
+def test_pressure(proc):
+    (proc / "pressure").mkdir()
+    (proc / "pressure" / "cpu").write_text("some avg10=3.00 avg60=1.00 avg300=0.50 total=999\n")
+    (proc / "pressure" / "io").write_text(PRESSURE)
+    reader = ProcfsReader(str(proc), min_interval=0)
+    pressure = reader.read().pressure
+
+    assert set(pressure) == {"cpu", "io"}
+    assert pressure["cpu"] == pytest.approx((3.0, 0.0))
+    assert pressure["io"] == pytest.approx((1.5, 0.25))
+    reader.close()
+
+
+def test_missing_pressure_directory(proc):
+    reader = ProcfsReader(str(proc), min_interval=0)
+    snapshot = reader.read()
+
+    assert snapshot.pressure == {}
+    assert snapshot.cpu is not None and snapshot.memory is not None
+    reader.close()
+
+
+def test_missing_files_read_as_none(tmp_path):
+    reader = ProcfsReader(str(tmp_path), min_interval=0)
+    snapshot = reader.read()
+
+    assert (snapshot.cpu, snapshot.memory, snapshot.load) == (None, None, None)
+    reader.close()
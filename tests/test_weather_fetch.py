@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from modules.weather import weather_data
+from modules.weather.http_client import AsyncHttpTransport
+
+MOSCOW = "643492"
+HELSINKI = "658225"
+
+
+@pytest.fixture
+def api(openweather, monkeypatch):
+    """Point weather_data at the stub with a fresh transport and no validators"""
+    monkeypatch.setattr(weather_data, "API_BASE", f"{openweather.url}/gzip/data/2.5")
+    monkeypatch.setattr(weather_data, "API_KEY", "test-key")
+    monkeypatch.setattr(weather_data, "_validators", {})
+    monkeypatch.setattr(weather_data, "_transport", weather_data._transport)
+    weather_data.set_transport(AsyncHttpTransport())
+    return openweather
+
+
+def _fetch(*refreshes):
+    """Run refreshes one after another in a single loop, as the shell does"""
+
+    async def run():
+        try:
+            return [await weather_data.fetch_remote_async(city_ids) for city_ids in refreshes]
+        finally:
+            await weather_data._transport.close()
+
+    results = asyncio.run(run())
+    return results[0] if len(results) == 1 else results
+
+
+def test_single_city(api):
+    results = _fetch([MOSCOW])
+
+    assert list(results) == [MOSCOW]
+    data = results[MOSCOW]
+    assert data["city"] == "Moscow"
+    assert data["temp"] == 4
+    assert data["desc"] == "Overcast Clouds"
+    assert data["humidity"] == 81
+    assert len(data["forecast"]) == 4
+    assert len(data["hourly"]["dt"]) == 16
+    assert data["weekly"]
+
+    endpoints = sorted(r.path.rsplit("/", 1)[1] for r in api.requests)
+    assert endpoints == ["forecast", "weather"]
+    for request in api.requests:
+        assert request.query == {"id": MOSCOW, "units": "metric", "appid": "test-key"}
+
+
+def test_several_cities_share_one_group_request(api):
+    results = _fetch([MOSCOW, HELSINKI])
+
+    assert {city_id: data["city"] for city_id, data in results.items()} == {
+        MOSCOW: "Moscow",
+        HELSINKI: "Helsinki",
+    }
+    endpoints = sorted(r.path.rsplit("/", 1)[1] for r in api.requests)
+    assert endpoints == ["forecast", "forecast", "group"]
+    group = next(r for r in api.requests if r.path.endswith("/group"))
+    assert group.query["id"] == f"{MOSCOW},{HELSINKI}"
+
+
+def test_sequential_refreshes_reuse_connections(api):
+    _fetch([MOSCOW], [MOSCOW], [MOSCOW])
+
+    # weather and forecast run concurrently, later refreshes reuse both
+    assert len(api.requests) == 6
+    assert api.connections() == 2
+
+
+def test_revalidation_serves_previous_body_on_304(api):
+    first, second = _fetch([MOSCOW], [MOSCOW])
+
+    assert second == first
+    revalidated = api.requests[2:]
+    assert len(revalidated) == 2
+    assert all(r.headers.get("if-none-match") for r in revalidated)
+
+
+def test_missing_city_forecast_is_left_out(api):
+    results = _fetch([MOSCOW, "0"])
+
+    assert list(results) == [MOSCOW]
+
+
+@pytest.mark.parametrize("status", [401, 404, 429, 500])
+def test_error_status_returns_nothing(api, monkeypatch, status):
+    monkeypatch.setattr(weather_data, "API_BASE", f"{api.url}/status/{status}/data/2.5")
+
+    assert _fetch([MOSCOW], [MOSCOW, HELSINKI]) == [{}, {}]
+    assert weather_data._validators == {}
+
+
+def test_malformed_response_returns_nothing(api, monkeypatch):
+    monkeypatch.setattr(weather_data, "API_BASE", f"{api.url}/broken")
+
+    assert _fetch([MOSCOW]) == {}
+
+
+@pytest.mark.parametrize("mode", ["plain", "chunked", "deflate", "eof"])
+def test_framings_parse_the_same(api, monkeypatch, mode):
+    expected = _fetch([MOSCOW, HELSINKI])
+    monkeypatch.setattr(weather_data, "API_BASE", f"{api.url}/{mode}/data/2.5")
+    monkeypatch.setattr(weather_data, "_validators", {})
+
+    assert _fetch([MOSCOW, HELSINKI]) == expected
+
+
+def test_no_api_key_skips_requests(api, monkeypatch):
+    monkeypatch.setattr(weather_data, "API_KEY", "")
+
+    assert _fetch([MOSCOW]) == {}
+    assert api.requests == []